@@ -0,0 +1,53 @@
+"""add_tenant_query_indexes
+
+Composite indexes matching the list/get/webhook query shapes. Built with
+CREATE INDEX CONCURRENTLY so existing tables stay writable during the build;
+that requires running outside the migration transaction.
+
+Revision ID: 8d2e4b6a1c05
+Revises: 3f1c9a7d2b64
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e4b6a1c05'
+down_revision: Union[str, None] = '3f1c9a7d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns)
+INDEXES = [
+    ('ix_clients_firm_id_status', 'clients', ['firm_id', 'status']),
+    ('ix_clients_firm_id_email', 'clients', ['firm_id', 'email']),
+    ('ix_intake_forms_firm_id', 'intake_forms', ['firm_id']),
+    ('ix_intake_submissions_form_id', 'intake_submissions', ['form_id']),
+    ('ix_intake_submissions_docusign_envelope_id', 'intake_submissions', ['docusign_envelope_id']),
+    ('ix_documents_submission_id_document_type', 'documents', ['submission_id', 'document_type']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,95 @@
+"""denormalize_firm_id
+
+Store firm_id directly on intake_submissions and documents so tenant checks
+are single-table lookups. The backfill runs in small batches, each committed
+separately, so no long-running transaction holds row locks on live tables.
+
+Revision ID: c47a15e93b28
+Revises: 8d2e4b6a1c05
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47a15e93b28'
+down_revision: Union[str, None] = '8d2e4b6a1c05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BATCH_SIZE = 5000
+
+BACKFILL_SUBMISSIONS = sa.text("""
+    UPDATE intake_submissions s
+    SET firm_id = f.firm_id
+    FROM intake_forms f
+    WHERE f.id = s.form_id
+      AND s.id IN (
+          SELECT id FROM intake_submissions WHERE firm_id IS NULL LIMIT :batch_size
+      )
+""")
+
+BACKFILL_DOCUMENTS = sa.text("""
+    UPDATE documents d
+    SET firm_id = s.firm_id
+    FROM intake_submissions s
+    WHERE s.id = d.submission_id
+      AND d.id IN (
+          SELECT id FROM documents WHERE firm_id IS NULL LIMIT :batch_size
+      )
+""")
+
+
+def _backfill(statement: sa.TextClause) -> None:
+    """Run an UPDATE ... LIMIT batch repeatedly until it touches no rows"""
+    if context.is_offline_mode():
+        # No row counts when rendering SQL; emit a single unbatched update
+        op.execute(statement.bindparams(batch_size=2147483647))
+        return
+
+    bind = op.get_bind()
+    while True:
+        result = bind.execute(statement, {"batch_size": BATCH_SIZE})
+        if result.rowcount == 0:
+            break
+
+
+def upgrade() -> None:
+    op.add_column('intake_submissions', sa.Column('firm_id', sa.UUID(), nullable=True))
+    op.add_column('documents', sa.Column('firm_id', sa.UUID(), nullable=True))
+
+    with op.get_context().autocommit_block():
+        _backfill(BACKFILL_SUBMISSIONS)
+        _backfill(BACKFILL_DOCUMENTS)
+
+        op.create_index(
+            'ix_intake_submissions_firm_id', 'intake_submissions', ['firm_id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_documents_firm_id', 'documents', ['firm_id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+
+    op.alter_column('intake_submissions', 'firm_id', nullable=False)
+    op.alter_column('documents', 'firm_id', nullable=False)
+    op.create_foreign_key(
+        'intake_submissions_firm_id_fkey', 'intake_submissions', 'firms', ['firm_id'], ['id']
+    )
+    op.create_foreign_key(
+        'documents_firm_id_fkey', 'documents', 'firms', ['firm_id'], ['id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('documents_firm_id_fkey', 'documents', type_='foreignkey')
+    op.drop_constraint('intake_submissions_firm_id_fkey', 'intake_submissions', type_='foreignkey')
+    op.drop_index('ix_documents_firm_id', table_name='documents')
+    op.drop_index('ix_intake_submissions_firm_id', table_name='intake_submissions')
+    op.drop_column('documents', 'firm_id')
+    op.drop_column('intake_submissions', 'firm_id')
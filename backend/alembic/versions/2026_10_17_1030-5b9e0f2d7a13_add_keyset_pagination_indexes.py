@@ -0,0 +1,56 @@
+"""add_keyset_pagination_indexes
+
+Indexes for newest-first keyset pagination on (created_at, id) within a firm.
+The new composites cover the old (firm_id) and (firm_id, status) indexes as
+prefixes, so those are dropped.
+
+Revision ID: 5b9e0f2d7a13
+Revises: c47a15e93b28
+Create Date: 2026-10-17 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b9e0f2d7a13'
+down_revision: Union[str, None] = 'c47a15e93b28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (index name, table, columns)
+NEW_INDEXES = [
+    ('ix_clients_firm_id_created_at_id', 'clients', ['firm_id', 'created_at', 'id']),
+    ('ix_clients_firm_id_status_created_at_id', 'clients', ['firm_id', 'status', 'created_at', 'id']),
+    ('ix_intake_submissions_firm_id_created_at_id', 'intake_submissions', ['firm_id', 'created_at', 'id']),
+]
+
+REPLACED_INDEXES = [
+    ('ix_clients_firm_id_status', 'clients', ['firm_id', 'status']),
+    ('ix_intake_submissions_firm_id', 'intake_submissions', ['firm_id']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in NEW_INDEXES:
+            op.create_index(
+                name, table, columns,
+                unique=False, postgresql_concurrently=True, if_not_exists=True,
+            )
+        for name, table, _ in REPLACED_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REPLACED_INDEXES:
+            op.create_index(
+                name, table, columns,
+                unique=False, postgresql_concurrently=True, if_not_exists=True,
+            )
+        for name, table, _ in reversed(NEW_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
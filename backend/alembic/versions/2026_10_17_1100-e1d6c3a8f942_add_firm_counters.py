@@ -0,0 +1,96 @@
+"""add_firm_counters
+
+Per-firm, per-status counts of clients and submissions, kept up to date by
+row triggers in the same transaction as each insert, status change or delete.
+
+Revision ID: e1d6c3a8f942
+Revises: 5b9e0f2d7a13
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1d6c3a8f942'
+down_revision: Union[str, None] = '5b9e0f2d7a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, counter entity)
+TRACKED_TABLES = [
+    ('clients', 'clients'),
+    ('intake_submissions', 'submissions'),
+]
+
+TRACK_FUNCTION = """
+CREATE OR REPLACE FUNCTION firm_counters_track() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE firm_counters
+        SET count = count - 1
+        WHERE firm_id = OLD.firm_id
+          AND entity = TG_ARGV[0]
+          AND status = COALESCE(OLD.status, '');
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO firm_counters (firm_id, entity, status, count)
+        VALUES (NEW.firm_id, TG_ARGV[0], COALESCE(NEW.status, ''), 1)
+        ON CONFLICT (firm_id, entity, status)
+        DO UPDATE SET count = firm_counters.count + 1;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.create_table('firm_counters',
+    sa.Column('firm_id', sa.UUID(), nullable=False),
+    sa.Column('entity', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('count', sa.BigInteger(), nullable=False),
+    sa.ForeignKeyConstraint(['firm_id'], ['firms.id'], ),
+    sa.PrimaryKeyConstraint('firm_id', 'entity', 'status')
+    )
+
+    op.execute(TRACK_FUNCTION)
+
+    for table, entity in TRACKED_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_firm_counters_insert_delete
+            AFTER INSERT OR DELETE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION firm_counters_track('{entity}')
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_firm_counters_update
+            AFTER UPDATE OF status, firm_id ON {table}
+            FOR EACH ROW
+            WHEN (OLD.status IS DISTINCT FROM NEW.status OR OLD.firm_id IS DISTINCT FROM NEW.firm_id)
+            EXECUTE FUNCTION firm_counters_track('{entity}')
+        """)
+
+        # Seed with current counts (the triggers keep them in sync from here on)
+        op.execute(f"""
+            INSERT INTO firm_counters (firm_id, entity, status, count)
+            SELECT firm_id, '{entity}', COALESCE(status, ''), count(*)
+            FROM {table}
+            GROUP BY firm_id, COALESCE(status, '')
+            ON CONFLICT (firm_id, entity, status) DO UPDATE SET count = EXCLUDED.count
+        """)
+
+
+def downgrade() -> None:
+    for table, _ in TRACKED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_firm_counters_update ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_firm_counters_insert_delete ON {table}")
+
+    op.execute("DROP FUNCTION IF EXISTS firm_counters_track()")
+    op.drop_table('firm_counters')
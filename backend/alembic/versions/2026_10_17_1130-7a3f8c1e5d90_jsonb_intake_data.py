@@ -0,0 +1,74 @@
+"""jsonb_intake_data
+
+Convert the intake JSON columns to JSONB and add GIN (jsonb_path_ops) indexes
+so list endpoints can filter with containment (@>) queries. The type change
+rewrites each table under an exclusive lock; run it in a quiet window.
+
+Revision ID: 7a3f8c1e5d90
+Revises: e1d6c3a8f942
+Create Date: 2026-10-17 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a3f8c1e5d90'
+down_revision: Union[str, None] = 'e1d6c3a8f942'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, nullable)
+COLUMNS = [
+    ('clients', 'intake_data', True),
+    ('intake_submissions', 'form_data', False),
+    ('intake_forms', 'fields_schema', False),
+]
+
+# (index name, table, column) - only for columns the API filters on
+GIN_INDEXES = [
+    ('ix_clients_intake_data', 'clients', 'intake_data'),
+    ('ix_intake_submissions_form_data', 'intake_submissions', 'form_data'),
+]
+
+
+def upgrade() -> None:
+    for table, column, nullable in COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            existing_type=sa.JSON(),
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::jsonb',
+        )
+
+    with op.get_context().autocommit_block():
+        for name, table, column in GIN_INDEXES:
+            op.create_index(
+                name, table, [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'jsonb_path_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in GIN_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+    for table, column, nullable in COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(astext_type=sa.Text()),
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::json',
+        )
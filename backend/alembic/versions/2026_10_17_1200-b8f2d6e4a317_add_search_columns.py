@@ -0,0 +1,77 @@
+"""add_search_columns
+
+Generated search_text / search_vector columns on clients and
+intake_submissions, with a GIN tsvector index for word matches and a GIN
+pg_trgm index for fuzzy/partial matches. Adding a stored generated column
+rewrites the table.
+
+Revision ID: b8f2d6e4a317
+Revises: 7a3f8c1e5d90
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8f2d6e4a317'
+down_revision: Union[str, None] = '7a3f8c1e5d90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copies of the model expressions at the time of this migration
+CLIENT_SEARCH_TEXT = (
+    "lower(first_name || ' ' || last_name || ' ' || email || ' ' || coalesce(phone, ''))"
+)
+SUBMISSION_SEARCH_TEXT = "lower({})".format(
+    " || ' ' || ".join(
+        f"coalesce(form_data->>'{key}', '')"
+        for key in ("first_name", "firstName", "last_name", "lastName", "email", "phone", "case_type")
+    )
+)
+
+# (table, search text expression)
+TABLES = [
+    ('clients', CLIENT_SEARCH_TEXT),
+    ('intake_submissions', SUBMISSION_SEARCH_TEXT),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for table, expression in TABLES:
+        op.add_column(table, sa.Column(
+            'search_text', sa.Text(), sa.Computed(expression, persisted=True), nullable=True
+        ))
+        op.add_column(table, sa.Column(
+            'search_vector', postgresql.TSVECTOR(),
+            sa.Computed(f"to_tsvector('simple', {expression})", persisted=True), nullable=True
+        ))
+
+    with op.get_context().autocommit_block():
+        for table, _ in TABLES:
+            op.create_index(
+                f'ix_{table}_search_vector', table, ['search_vector'],
+                unique=False, postgresql_using='gin',
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+            op.create_index(
+                f'ix_{table}_search_text_trgm', table, ['search_text'],
+                unique=False, postgresql_using='gin',
+                postgresql_ops={'search_text': 'gin_trgm_ops'},
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    for table, _ in reversed(TABLES):
+        op.drop_index(f'ix_{table}_search_text_trgm', table_name=table)
+        op.drop_index(f'ix_{table}_search_vector', table_name=table)
+        op.drop_column(table, 'search_vector')
+        op.drop_column(table, 'search_text')
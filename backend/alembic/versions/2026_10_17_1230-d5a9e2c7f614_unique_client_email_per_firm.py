@@ -0,0 +1,114 @@
+"""unique_client_email_per_firm
+
+Make (firm_id, email) unique on clients so public submissions can upsert the
+client with INSERT ... ON CONFLICT. Existing duplicates (from concurrent
+submits) are merged into the oldest client first: their submissions are
+repointed and the duplicate rows deleted.
+
+The index is built concurrently while submits keep running, so a duplicate
+inserted after the merge fails the build and leaves an INVALID index behind.
+The merge and build are retried, dropping any INVALID index first, since
+IF NOT EXISTS would otherwise keep it and ON CONFLICT can't use it.
+
+Revision ID: d5a9e2c7f614
+Revises: b8f2d6e4a317
+Create Date: 2026-10-17 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a9e2c7f614'
+down_revision: Union[str, None] = 'b8f2d6e4a317'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BUILD_ATTEMPTS = 5
+
+# One statement, so it is atomic even in an autocommit block
+MERGE_DUPLICATES = sa.text("""
+    WITH duplicates AS (
+        SELECT id, keep_id FROM (
+            SELECT id, first_value(id) OVER (
+                PARTITION BY firm_id, email ORDER BY created_at, id
+            ) AS keep_id
+            FROM clients
+        ) ranked
+        WHERE id <> keep_id
+    ),
+    repointed AS (
+        UPDATE intake_submissions s
+        SET client_id = d.keep_id
+        FROM duplicates d
+        WHERE s.client_id = d.id
+    )
+    DELETE FROM clients c
+    USING duplicates d
+    WHERE c.id = d.id
+""")
+
+INVALID_INDEX = sa.text("""
+    SELECT 1
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE c.relname = 'uq_clients_firm_id_email' AND NOT i.indisvalid
+""")
+
+
+def _create_unique_index() -> None:
+    op.create_index(
+        'uq_clients_firm_id_email', 'clients', ['firm_id', 'email'],
+        unique=True, postgresql_concurrently=True, if_not_exists=True,
+    )
+
+
+def _merge_and_index() -> None:
+    """Merge duplicates and build the unique index, retrying if a new duplicate lands in between"""
+    if context.is_offline_mode():
+        # Can't inspect or retry when rendering SQL; emit a single pass
+        op.execute(MERGE_DUPLICATES)
+        _create_unique_index()
+        return
+
+    bind = op.get_bind()
+    for attempt in range(1, BUILD_ATTEMPTS + 1):
+        bind.execute(MERGE_DUPLICATES)
+        if bind.execute(INVALID_INDEX).first():
+            op.drop_index(
+                'uq_clients_firm_id_email', table_name='clients',
+                postgresql_concurrently=True, if_exists=True,
+            )
+        try:
+            _create_unique_index()
+            return
+        except sa.exc.IntegrityError:
+            if attempt == BUILD_ATTEMPTS:
+                raise
+            print(f"uq_clients_firm_id_email build hit a new duplicate, retrying ({attempt}/{BUILD_ATTEMPTS})")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        _merge_and_index()
+        # The unique index serves the same lookups
+        op.drop_index(
+            'ix_clients_firm_id_email', table_name='clients',
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_clients_firm_id_email', 'clients', ['firm_id', 'email'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'uq_clients_firm_id_email', table_name='clients',
+            postgresql_concurrently=True, if_exists=True,
+        )
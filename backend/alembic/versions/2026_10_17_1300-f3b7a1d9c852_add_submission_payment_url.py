@@ -0,0 +1,29 @@
+"""add_submission_payment_url
+
+Stores the Stripe checkout URL on the submission. Checkout sessions are now
+created after the submit request, so clients fetch the URL later.
+
+Revision ID: f3b7a1d9c852
+Revises: d5a9e2c7f614
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b7a1d9c852'
+down_revision: Union[str, None] = 'd5a9e2c7f614'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('intake_submissions', sa.Column('payment_url', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('intake_submissions', 'payment_url')
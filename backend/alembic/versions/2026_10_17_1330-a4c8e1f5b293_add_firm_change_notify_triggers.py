@@ -0,0 +1,113 @@
+"""add_firm_change_notify_triggers
+
+NOTIFY firm_changes on intake_submissions and clients inserts and status
+changes, feeding the live dashboard stream (one LISTEN connection per API
+process, see app/services/firm_feed.py). Payloads carry the firm id and the
+row's list-view columns.
+
+Revision ID: a4c8e1f5b293
+Revises: f3b7a1d9c852
+Create Date: 2026-10-17 13:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c8e1f5b293'
+down_revision: Union[str, None] = 'f3b7a1d9c852'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Each statement runs separately (asyncpg can't prepare several at once)
+CREATE_TRIGGERS = [
+    """
+    CREATE OR REPLACE FUNCTION notify_intake_submission_change() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify('firm_changes', json_build_object(
+            'table', TG_TABLE_NAME,
+            'op', lower(TG_OP),
+            'firm_id', NEW.firm_id,
+            'row', json_build_object(
+                'id', NEW.id, 'form_id', NEW.form_id, 'client_id', NEW.client_id,
+                'status', NEW.status,
+                'signature_status', NEW.signature_status,
+                'payment_status', NEW.payment_status,
+                'payment_amount', NEW.payment_amount,
+                'signed_at', NEW.signed_at, 'paid_at', NEW.paid_at,
+                'created_at', NEW.created_at, 'updated_at', NEW.updated_at
+            )
+        )::text);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER intake_submissions_notify_insert AFTER INSERT ON intake_submissions
+    FOR EACH ROW EXECUTE FUNCTION notify_intake_submission_change()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER intake_submissions_notify_update AFTER UPDATE ON intake_submissions
+    FOR EACH ROW WHEN (
+        OLD.status IS DISTINCT FROM NEW.status
+        OR OLD.signature_status IS DISTINCT FROM NEW.signature_status
+        OR OLD.payment_status IS DISTINCT FROM NEW.payment_status
+    )
+    EXECUTE FUNCTION notify_intake_submission_change()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION notify_client_change() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify('firm_changes', json_build_object(
+            'table', TG_TABLE_NAME,
+            'op', lower(TG_OP),
+            'firm_id', NEW.firm_id,
+            'row', json_build_object(
+                'id', NEW.id, 'email', NEW.email,
+                'first_name', NEW.first_name, 'last_name', NEW.last_name,
+                'phone', NEW.phone, 'status', NEW.status,
+                'created_at', NEW.created_at, 'updated_at', NEW.updated_at
+            )
+        )::text);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE TRIGGER clients_notify_insert AFTER INSERT ON clients
+    FOR EACH ROW EXECUTE FUNCTION notify_client_change()
+    """,
+    """
+    CREATE OR REPLACE TRIGGER clients_notify_update AFTER UPDATE ON clients
+    FOR EACH ROW WHEN (
+        OLD.email IS DISTINCT FROM NEW.email
+        OR OLD.first_name IS DISTINCT FROM NEW.first_name
+        OR OLD.last_name IS DISTINCT FROM NEW.last_name
+        OR OLD.phone IS DISTINCT FROM NEW.phone
+        OR OLD.status IS DISTINCT FROM NEW.status
+    )
+    EXECUTE FUNCTION notify_client_change()
+    """,
+]
+
+DROP_TRIGGERS = [
+    "DROP TRIGGER IF EXISTS clients_notify_update ON clients",
+    "DROP TRIGGER IF EXISTS clients_notify_insert ON clients",
+    "DROP FUNCTION IF EXISTS notify_client_change()",
+    "DROP TRIGGER IF EXISTS intake_submissions_notify_update ON intake_submissions",
+    "DROP TRIGGER IF EXISTS intake_submissions_notify_insert ON intake_submissions",
+    "DROP FUNCTION IF EXISTS notify_intake_submission_change()",
+]
+
+
+def upgrade() -> None:
+    for statement in CREATE_TRIGGERS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in DROP_TRIGGERS:
+        op.execute(statement)
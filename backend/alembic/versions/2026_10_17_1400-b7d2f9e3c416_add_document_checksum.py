@@ -0,0 +1,29 @@
+"""add_document_checksum
+
+Stores the SHA-256 of each uploaded document, computed while the upload
+streams to S3.
+
+Revision ID: b7d2f9e3c416
+Revises: a4c8e1f5b293
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2f9e3c416'
+down_revision: Union[str, None] = 'a4c8e1f5b293'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('documents', sa.Column('checksum_sha256', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('documents', 'checksum_sha256')
@@ -0,0 +1,102 @@
+"""serialize_firm_counter_updates
+
+firm_counters_track now takes a shared per-firm advisory lock, so the
+reconcile job (which takes it exclusively, one firm at a time) never
+overwrites increments committed while it counts. Status changes also touch
+the old and new counter rows in key order, so concurrent opposite flips
+can't deadlock.
+
+Revision ID: c9f4b2e7d185
+Revises: b7d2f9e3c416
+Create Date: 2026-10-17 14:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9f4b2e7d185'
+down_revision: Union[str, None] = 'b7d2f9e3c416'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 7001 is COUNTER_LOCK_CLASS in app/services/counter_service.py
+TRACK_FUNCTION = """
+CREATE OR REPLACE FUNCTION firm_counters_track() RETURNS trigger AS $$
+DECLARE
+    old_first boolean;
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM pg_advisory_xact_lock_shared(7001, hashtext(OLD.firm_id::text));
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM pg_advisory_xact_lock_shared(7001, hashtext(NEW.firm_id::text));
+    END IF;
+
+    -- Lock counter rows in (firm_id, status) order
+    old_first := TG_OP = 'DELETE' OR (
+        TG_OP = 'UPDATE'
+        AND (OLD.firm_id, COALESCE(OLD.status, '')) < (NEW.firm_id, COALESCE(NEW.status, ''))
+    );
+
+    IF old_first THEN
+        UPDATE firm_counters
+        SET count = count - 1
+        WHERE firm_id = OLD.firm_id
+          AND entity = TG_ARGV[0]
+          AND status = COALESCE(OLD.status, '');
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO firm_counters (firm_id, entity, status, count)
+        VALUES (NEW.firm_id, TG_ARGV[0], COALESCE(NEW.status, ''), 1)
+        ON CONFLICT (firm_id, entity, status)
+        DO UPDATE SET count = firm_counters.count + 1;
+    END IF;
+
+    IF TG_OP = 'UPDATE' AND NOT old_first THEN
+        UPDATE firm_counters
+        SET count = count - 1
+        WHERE firm_id = OLD.firm_id
+          AND entity = TG_ARGV[0]
+          AND status = COALESCE(OLD.status, '');
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+PREVIOUS_TRACK_FUNCTION = """
+CREATE OR REPLACE FUNCTION firm_counters_track() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE firm_counters
+        SET count = count - 1
+        WHERE firm_id = OLD.firm_id
+          AND entity = TG_ARGV[0]
+          AND status = COALESCE(OLD.status, '');
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO firm_counters (firm_id, entity, status, count)
+        VALUES (NEW.firm_id, TG_ARGV[0], COALESCE(NEW.status, ''), 1)
+        ON CONFLICT (firm_id, entity, status)
+        DO UPDATE SET count = firm_counters.count + 1;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    op.execute(TRACK_FUNCTION)
+
+
+def downgrade() -> None:
+    op.execute(PREVIOUS_TRACK_FUNCTION)
@@ -3,15 +3,53 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.core.deps import get_db
-from app.core.security import create_access_token, verify_password, get_password_hash
+from app.core.deps import get_db, get_current_active_user
+from app.core.principal import Principal
+from app.core.security import create_access_token
 from app.models.user import User
 from app.models.firm import Firm
 from app.schemas.user import UserCreate, UserResponse, Token, UserLogin
+from app.services.password_service import password_service, PasswordHasherBusy
 
 router = APIRouter()
 
 
+def _hasher_busy_exception() -> HTTPException:
+    """503 returned when the password hashing pool is saturated"""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication service is busy, please retry shortly",
+        headers={"Retry-After": "1"},
+    )
+
+
+async def _authenticate(db: AsyncSession, email: str, password: str) -> User | None:
+    """Look up a user by email and check the password off the event loop"""
+    result = await db.execute(select(User).where(User.email == email))
+    user = result.scalar_one_or_none()
+
+    if not user:
+        return None
+
+    try:
+        if not await password_service.verify(password, user.hashed_password):
+            return None
+    except PasswordHasherBusy:
+        raise _hasher_busy_exception()
+
+    return user
+
+
+def _issue_token(user: User) -> str:
+    """Create an access token carrying the user's tenant claims"""
+    return create_access_token(
+        subject=user.id,
+        firm_id=user.firm_id,
+        is_superuser=bool(user.is_superuser),
+        token_version=user.token_version or 0,
+    )
+
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register(
     user_data: UserCreate,
@@ -27,6 +65,12 @@ async def register(
             detail="Email already registered"
         )
 
+    # Hash before opening any writes so the transaction isn't held during bcrypt
+    try:
+        hashed_password = await password_service.hash(user_data.password)
+    except PasswordHasherBusy:
+        raise _hasher_busy_exception()
+
     # Create firm if firm_name provided
     if user_data.firm_name:
         firm = Firm(
@@ -46,7 +90,7 @@ async def register(
     user = User(
         email=user_data.email,
         full_name=user_data.full_name,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=hashed_password,
         firm_id=firm_id,
         is_superuser=True  # First user in firm is superuser
     )
@@ -65,11 +109,9 @@ async def login(
 ) -> dict[str, str]:
     """Login and get access token"""
 
-    # Find user by email
-    result = await db.execute(select(User).where(User.email == form_data.username))
-    user = result.scalar_one_or_none()
+    user = await _authenticate(db, form_data.username, form_data.password)
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -82,7 +124,7 @@ async def login(
             detail="Inactive user"
         )
 
-    access_token = create_access_token(subject=user.id)
+    access_token = _issue_token(user)
 
     return {
         "access_token": access_token,
@@ -97,10 +139,9 @@ async def login_json(
 ) -> dict[str, str]:
     """Login with JSON payload"""
 
-    result = await db.execute(select(User).where(User.email == login_data.email))
-    user = result.scalar_one_or_none()
+    user = await _authenticate(db, login_data.email, login_data.password)
 
-    if not user or not verify_password(login_data.password, user.hashed_password):
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -112,9 +153,25 @@ async def login_json(
             detail="Inactive user"
         )
 
-    access_token = create_access_token(subject=user.id)
+    access_token = _issue_token(user)
 
     return {
         "access_token": access_token,
         "token_type": "bearer"
     }
+
+
+@router.post("/revoke", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_tokens(
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+) -> None:
+    """Revoke every access token issued to the current user (log out everywhere)"""
+
+    user = await db.get(User, current_user.id)
+
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    user.token_version = (user.token_version or 0) + 1
+    await db.commit()
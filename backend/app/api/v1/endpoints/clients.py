@@ -1,52 +1,106 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from uuid import UUID
 
+from app.core.conditional import conditional_response, version_etag
 from app.core.deps import get_db, get_current_active_user
-from app.models.user import User
+from app.core.filters import json_filter_conditions
+from app.core.instrumentation import query_budget
+from app.core.pagination import keyset_paginate, page_items
+from app.core.principal import Principal
+from app.core.serialization import FastJSONResponse, RowProjection
 from app.models.client import Client
+from app.models.firm_counter import COUNTER_CLIENTS
 from app.schemas.client import ClientResponse, ClientUpdate, ClientList
+from app.services import search_service
+from app.services.counter_service import get_firm_count
 
 router = APIRouter()
 
 
+# List pages skip ORM loading and response_model validation (see RowProjection)
+client_rows = RowProjection(Client, ClientResponse, always=("id", "created_at"))
+
+
 @router.get("/", response_model=ClientList)
+@query_budget(3)
 async def list_clients(
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
-    status_filter: str | None = None
-) -> dict:
-    """List all clients for current user's firm"""
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
+    status_filter: str | None = None,
+    filters: list[str] = Query([], alias="filter"),
+    include_total: bool = False,
+    fields: str | None = Query(None, description="Comma-separated fields to return, e.g. id,status,created_at"),
+) -> FastJSONResponse:
+    """
+    List clients for current user's firm, newest first
 
-    query = select(Client).where(Client.firm_id == current_user.firm_id)
+    Pass the returned next_cursor to fetch the following page. The total is
+    only returned when include_total is set and comes from the firm counters.
 
-    if status_filter:
-        query = query.where(Client.status == status_filter)
+    Filter on intake answers with repeated `filter` parameters, e.g.
+    `?filter=intake_data.case_type=divorce`.
+
+    Pass `fields` to select only some columns (id and created_at are always
+    included), e.g. leave out intake_data for the clients table.
+    """
+    selected = client_rows.parse_fields(fields)
 
-    result = await db.execute(query.offset(skip).limit(limit))
-    clients = result.scalars().all()
+    query = client_rows.select(selected).where(Client.firm_id == current_user.firm_id)
 
-    # Get total count
-    count_query = select(func.count(Client.id)).where(Client.firm_id == current_user.firm_id)
     if status_filter:
-        count_query = count_query.where(Client.status == status_filter)
+        query = query.where(Client.status == status_filter)
+
+    json_conditions = json_filter_conditions(filters, {"intake_data": Client.intake_data})
+    if json_conditions:
+        query = query.where(*json_conditions)
+
+    result = await db.execute(keyset_paginate(query, Client, cursor, limit))
+    rows, next_cursor = page_items(result.all(), limit)
+
+    total = None
+    if include_total and json_conditions:
+        # Counters don't know about JSON filters, so count the filtered rows
+        count_result = await db.execute(query.with_only_columns(func.count(Client.id)))
+        total = count_result.scalar()
+    elif include_total:
+        total = await get_firm_count(
+            db, current_user.firm_id, COUNTER_CLIENTS, status=status_filter or None
+        )
+
+    return FastJSONResponse({
+        "items": client_rows.items(rows, selected), "total": total, "next_cursor": next_cursor
+    })
+
+
+@router.get("/search", response_model=ClientList)
+@query_budget(2)
+async def search_clients(
+    q: str = Query(..., min_length=2, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+) -> dict:
+    """Search clients by name, email or phone (best matches first, typo tolerant)"""
 
-    count_result = await db.execute(count_query)
-    total = count_result.scalar()
+    clients = await search_service.search_clients(db, current_user.firm_id, q, limit)
 
-    return {"items": clients, "total": total}
+    return {"items": clients}
 
 
 @router.get("/{client_id}", response_model=ClientResponse)
+@query_budget(2)
 async def get_client(
     client_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    request: Request,
+    response: Response,
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ) -> Client:
-    """Get a specific client"""
+    """Get a specific client (supports If-None-Match)"""
 
     result = await db.execute(
         select(Client)
@@ -57,6 +111,12 @@ async def get_client(
     if not client:
         raise HTTPException(status_code=404, detail="Client not found")
 
+    unchanged = conditional_response(
+        request, response, version_etag(client.id, client.updated_at or client.created_at)
+    )
+    if unchanged:
+        return unchanged
+
     return client
 
 
@@ -64,7 +124,7 @@ async def get_client(
 async def update_client(
     client_id: UUID,
     client_data: ClientUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ) -> Client:
     """Update a client"""
@@ -1,40 +1,100 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+import re
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from botocore.exceptions import ClientError
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from uuid import UUID
-from io import BytesIO
 
+from app.core.conditional import PRIVATE_REVALIDATE
+from app.core.config import settings
 from app.core.deps import get_db, get_current_active_user
-from app.models.user import User
+from app.core.instrumentation import query_budget
+from app.core.principal import Principal
+from app.core.uploads import UPLOAD_OPENAPI, StreamedFile
 from app.models.document import Document
-from app.models.intake import IntakeSubmission, IntakeForm
+from app.models.intake import IntakeSubmission
 from app.schemas.document import DocumentResponse, DocumentUploadResponse
-from app.services.s3_service import upload_file, download_file, generate_presigned_url
+from app.services.s3_service import upload_stream, open_download, iter_body, generate_presigned_url, generate_presigned_urls
 
 router = APIRouter()
 
+# Single byte range ("bytes=0-1023", "bytes=1024-", "bytes=-500"); S3 serves
+# one range per request, so multi-range requests get the whole file
+SINGLE_BYTE_RANGE = re.compile(r"bytes=(\d+-\d*|-\d+)")
+
+
+def _http_date(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
 
-@router.post("/upload", response_model=DocumentUploadResponse, status_code=status.HTTP_201_CREATED)
+def _download_conditions(request: Request) -> dict:
+    """
+    open_download() arguments for a request's Range and validator headers
+
+    If-Range is sent to S3 alongside the range as IfMatch (entity tag) or
+    IfUnmodifiedSince (date), so a 412 means the client's copy is stale.
+    A weak If-Range tag never matches, so the file is sent whole.
+    """
+    headers = request.headers
+    conditions = {
+        "if_none_match": headers.get("if-none-match"),
+        # If-None-Match takes precedence (RFC 9110)
+        "if_modified_since": None if "if-none-match" in headers else _http_date(headers.get("if-modified-since")),
+    }
+
+    byte_range = headers.get("range", "").replace(" ", "")
+    if not SINGLE_BYTE_RANGE.fullmatch(byte_range):
+        return conditions
+
+    if_range = headers.get("if-range", "").strip()
+    if if_range.startswith('"'):
+        conditions["if_match"] = if_range
+    elif if_range.startswith("W/"):
+        return conditions
+    elif if_range:
+        conditions["if_unmodified_since"] = _http_date(if_range)
+        if conditions["if_unmodified_since"] is None:
+            return conditions
+
+    conditions["byte_range"] = byte_range
+    return conditions
+
+
+@router.post(
+    "/upload",
+    response_model=DocumentUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=UPLOAD_OPENAPI
+)
 async def upload_document(
+    request: Request,
     submission_id: UUID,
     document_type: str,
-    file: UploadFile = File(...),
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Upload a document and associate it with a submission
 
     Requires authentication. User must belong to the firm that owns the submission.
+    The file (multipart field "file") is streamed to S3 as it arrives and
+    rejected with 413 as soon as it passes MAX_UPLOAD_SIZE.
     """
     # Verify submission exists and belongs to user's firm
     result = await db.execute(
         select(IntakeSubmission)
-        .join(IntakeForm)
         .where(
             IntakeSubmission.id == submission_id,
-            IntakeForm.firm_id == current_user.firm_id
+            IntakeSubmission.firm_id == current_user.firm_id
         )
     )
     submission = result.scalar_one_or_none()
@@ -45,21 +105,17 @@ async def upload_document(
             detail="Submission not found"
         )
 
-    # Validate file size (max 10MB)
-    file_content = await file.read()
-    file_size = len(file_content)
+    # End the read transaction so the pooled connection isn't held idle
+    # while the client sends the file; the insert below takes a fresh one
+    await db.commit()
 
-    if file_size > 10 * 1024 * 1024:  # 10MB
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail="File size exceeds 10MB limit"
-        )
+    file = StreamedFile(request, max_size=settings.MAX_UPLOAD_SIZE)
+    await file.open()
 
-    # Upload to S3
+    # Stream to S3 (size limit enforced chunk by chunk)
     try:
-        file_obj = BytesIO(file_content)
-        upload_result = await upload_file(
-            file_obj=file_obj,
+        upload_result = await upload_stream(
+            file.chunks(),
             filename=file.filename,
             content_type=file.content_type,
             folder=f"submissions/{submission_id}"
@@ -68,10 +124,12 @@ async def upload_document(
         # Create document record
         document = Document(
             submission_id=submission_id,
+            firm_id=submission.firm_id,
             filename=file.filename,
             document_type=document_type,
             mime_type=file.content_type,
-            file_size=file_size,
+            file_size=file.size,
+            checksum_sha256=file.sha256,
             s3_key=upload_result['s3_key'],
             s3_bucket=upload_result['bucket']
         )
@@ -89,6 +147,8 @@ async def upload_document(
 
         return DocumentUploadResponse(document=response)
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -99,7 +159,7 @@ async def upload_document(
 @router.get("/{document_id}", response_model=DocumentResponse)
 async def get_document(
     document_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get document metadata and download URL"""
@@ -107,11 +167,9 @@ async def get_document(
     # Verify document exists and belongs to user's firm
     result = await db.execute(
         select(Document)
-        .join(IntakeSubmission)
-        .join(IntakeForm)
         .where(
             Document.id == document_id,
-            IntakeForm.firm_id == current_user.firm_id
+            Document.firm_id == current_user.firm_id
         )
     )
     document = result.scalar_one_or_none()
@@ -134,19 +192,24 @@ async def get_document(
 @router.get("/{document_id}/download")
 async def download_document(
     document_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    request: Request,
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
-    """Download document file directly"""
+    """
+    Download document file directly
+
+    Streamed from S3 in chunks. Supports single byte ranges (206, for PDF
+    viewers), If-Range, and conditional requests against the S3 ETag and
+    Last-Modified, which are passed through.
+    """
 
     # Verify document exists and belongs to user's firm
     result = await db.execute(
         select(Document)
-        .join(IntakeSubmission)
-        .join(IntakeForm)
         .where(
             Document.id == document_id,
-            IntakeForm.firm_id == current_user.firm_id
+            Document.firm_id == current_user.firm_id
         )
     )
     document = result.scalar_one_or_none()
@@ -157,30 +220,60 @@ async def download_document(
             detail="Document not found"
         )
 
+    conditions = _download_conditions(request)
     try:
-        # Download from S3
-        file_content = await download_file(document.s3_key)
-
-        # Return as streaming response
-        return StreamingResponse(
-            BytesIO(file_content),
-            media_type=document.mime_type or "application/octet-stream",
-            headers={
-                "Content-Disposition": f'attachment; filename="{document.filename}"'
-            }
-        )
-
-    except Exception as e:
+        try:
+            s3_object = await open_download(document.s3_key, **conditions)
+        except ClientError as e:
+            # 412 only comes from If-Range: send the current file whole
+            if e.response['ResponseMetadata']['HTTPStatusCode'] != 412:
+                raise
+            for name in ("byte_range", "if_match", "if_unmodified_since"):
+                conditions.pop(name, None)
+            s3_object = await open_download(document.s3_key, **conditions)
+
+    except ClientError as e:
+        metadata = e.response['ResponseMetadata']
+        if metadata['HTTPStatusCode'] == 304:
+            etag = metadata.get('HTTPHeaders', {}).get('etag')
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag} if etag else None
+            )
+        if metadata['HTTPStatusCode'] == 416:
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{document.file_size}"}
+            )
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Download failed: {str(e)}"
         )
 
+    headers = {
+        "Content-Disposition": f'attachment; filename="{document.filename}"',
+        "Content-Length": str(s3_object['ContentLength']),
+        "Accept-Ranges": "bytes",
+        "ETag": s3_object['ETag'],
+        "Cache-Control": PRIVATE_REVALIDATE,
+    }
+    if s3_object.get('LastModified'):
+        headers["Last-Modified"] = format_datetime(s3_object['LastModified'].astimezone(timezone.utc), usegmt=True)
+    if s3_object.get('ContentRange'):
+        headers["Content-Range"] = s3_object['ContentRange']
+
+    return StreamingResponse(
+        iter_body(s3_object['Body']),
+        status_code=status.HTTP_206_PARTIAL_CONTENT if s3_object.get('ContentRange') else status.HTTP_200_OK,
+        media_type=document.mime_type or "application/octet-stream",
+        headers=headers
+    )
+
 
 @router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_document(
     document_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Delete a document"""
@@ -188,11 +281,9 @@ async def delete_document(
     # Verify document exists and user is superuser or belongs to firm
     result = await db.execute(
         select(Document)
-        .join(IntakeSubmission)
-        .join(IntakeForm)
         .where(
             Document.id == document_id,
-            IntakeForm.firm_id == current_user.firm_id
+            Document.firm_id == current_user.firm_id
         )
     )
     document = result.scalar_one_or_none()
@@ -226,9 +317,10 @@ async def delete_document(
 
 
 @router.get("/submission/{submission_id}/list", response_model=list[DocumentResponse])
+@query_budget(3)
 async def list_submission_documents(
     submission_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """List all documents for a submission"""
@@ -236,10 +328,9 @@ async def list_submission_documents(
     # Verify submission belongs to user's firm
     result = await db.execute(
         select(IntakeSubmission)
-        .join(IntakeForm)
         .where(
             IntakeSubmission.id == submission_id,
-            IntakeForm.firm_id == current_user.firm_id
+            IntakeSubmission.firm_id == current_user.firm_id
         )
     )
     submission = result.scalar_one_or_none()
@@ -256,12 +347,12 @@ async def list_submission_documents(
     )
     documents = result.scalars().all()
 
-    # Add download URLs
+    # Add download URLs (signed in one batch)
+    download_urls = await generate_presigned_urls([doc.s3_key for doc in documents])
     response_documents = []
     for doc in documents:
-        download_url = await generate_presigned_url(doc.s3_key)
         doc_response = DocumentResponse.model_validate(doc)
-        doc_response.download_url = download_url
+        doc_response.download_url = download_urls[doc.s3_key]
         response_documents.append(doc_response)
 
     return response_documents
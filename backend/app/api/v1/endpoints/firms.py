@@ -1,21 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.core.conditional import conditional_response, version_etag
 from app.core.deps import get_db, get_current_active_user
-from app.models.user import User
+from app.core.principal import Principal
+from app.core.sse import SSE_HEADERS
 from app.models.firm import Firm
 from app.schemas.firm import FirmResponse, FirmUpdate
+from app.services.firm_feed import firm_change_feed
 
 router = APIRouter()
 
 
 @router.get("/me", response_model=FirmResponse)
 async def get_my_firm(
-    current_user: User = Depends(get_current_active_user),
+    request: Request,
+    response: Response,
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ) -> Firm:
-    """Get current user's firm"""
+    """Get current user's firm (supports If-None-Match)"""
 
     result = await db.execute(
         select(Firm).where(Firm.id == current_user.firm_id)
@@ -25,13 +32,19 @@ async def get_my_firm(
     if not firm:
         raise HTTPException(status_code=404, detail="Firm not found")
 
+    unchanged = conditional_response(
+        request, response, version_etag(firm.id, firm.updated_at or firm.created_at)
+    )
+    if unchanged:
+        return unchanged
+
     return firm
 
 
 @router.put("/me", response_model=FirmResponse)
 async def update_my_firm(
     firm_data: FirmUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ) -> Firm:
     """Update current user's firm"""
@@ -59,3 +72,24 @@ async def update_my_firm(
     await db.refresh(firm)
 
     return firm
+
+
+@router.get("/me/events", response_class=StreamingResponse)
+async def stream_my_firm_events(
+    current_user: Principal = Depends(get_current_active_user)
+) -> StreamingResponse:
+    """
+    Live dashboard feed for the current user's firm (Server-Sent Events)
+
+    Sends a `change` event ({table, op, row}) whenever a submission or client
+    of the firm is created or changes status, and `resync` when changes may
+    have been missed and the list should be refetched.
+    """
+    release = firm_change_feed.reserve(current_user.firm_id)
+
+    return StreamingResponse(
+        firm_change_feed.stream(current_user.firm_id, release),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+        background=BackgroundTask(release)
+    )
@@ -1,13 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from uuid import UUID
+from sqlalchemy import String, insert, literal, select, func
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID, insert as pg_insert
+from sqlalchemy.orm import joinedload, selectinload
+from uuid import UUID, uuid4
 
 from app.core.deps import get_db, get_current_active_user
+from app.core.compression import negotiate_encoding
+from app.core.conditional import conditional_response, etag_matches, not_modified, version_etag
 from app.core.config import settings
-from app.models.user import User
+from app.core.filters import json_filter_conditions
+from app.core.instrumentation import query_budget
+from app.core.pagination import keyset_paginate, page_items
+from app.core.principal import Principal
+from app.core.serialization import FastJSONResponse, RowProjection
+from app.core.sse import SSE_HEADERS
+from app.db.base import AsyncSessionLocal
 from app.models.intake import IntakeForm, IntakeSubmission
 from app.models.client import Client
+from app.models.firm_counter import COUNTER_SUBMISSIONS
 from app.schemas.intake import (
     IntakeFormCreate,
     IntakeFormUpdate,
@@ -15,21 +28,41 @@ from app.schemas.intake import (
     IntakeSubmissionCreate,
     IntakeSubmissionPublicCreate,
     IntakeSubmissionResponse,
+    IntakeSubmissionDetail,
     IntakeSubmissionList
 )
-from app.services.stripe_service import create_checkout_session
+from app.services import search_service
+from app.services.counter_service import get_firm_count
+from app.services.form_cache import public_form_cache
+from app.services.form_validation import SCHEMA_ERRORS, compile_schema, get_validator
+from app.services.s3_service import generate_presigned_urls
+from app.services.checkout_service import ensure_checkout_session, prefetch_checkout_session
+from app.services.submission_events import status_payload, submission_event_streams
 
 router = APIRouter()
 
 
+def _check_fields_schema(fields_schema: dict) -> None:
+    """Reject schemas the validator compiler can't handle (e.g. a bad pattern)"""
+    try:
+        compile_schema(fields_schema)
+    except SCHEMA_ERRORS as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid fields_schema: {e}"
+        )
+
+
 @router.post("/forms", response_model=IntakeFormResponse, status_code=status.HTTP_201_CREATED)
 async def create_intake_form(
     form_data: IntakeFormCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ) -> IntakeForm:
     """Create a new intake form"""
 
+    _check_fields_schema(form_data.fields_schema)
+
     form = IntakeForm(
         **form_data.model_dump(),
         firm_id=current_user.firm_id
@@ -42,29 +75,61 @@ async def create_intake_form(
     return form
 
 
+# List pages skip ORM loading and response_model validation (see RowProjection)
+form_rows = RowProjection(IntakeForm, IntakeFormResponse)
+
+
 @router.get("/forms", response_model=list[IntakeFormResponse])
+@query_budget(3)
 async def list_intake_forms(
-    current_user: User = Depends(get_current_active_user),
+    request: Request,
+    response: Response,
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
     skip: int = 0,
-    limit: int = 100
-) -> list[IntakeForm]:
-    """List all intake forms for current user's firm"""
+    limit: int = 100,
+    fields: str | None = Query(None, description="Comma-separated fields to return, e.g. id,name,is_active"),
+) -> Response:
+    """
+    List all intake forms for current user's firm
+
+    Supports If-None-Match: the ETag comes from the form count and latest
+    change, so an unchanged list costs one small aggregate query.
+
+    Pass `fields` to select only some columns (id is always included), e.g.
+    leave out fields_schema when only listing form names.
+    """
+    selected = form_rows.parse_fields(fields)
+
+    version = await db.execute(
+        select(func.count(IntakeForm.id), func.max(func.coalesce(IntakeForm.updated_at, IntakeForm.created_at)))
+        .where(IntakeForm.firm_id == current_user.firm_id)
+    )
+    count, last_changed = version.one()
+
+    unchanged = conditional_response(
+        request, response, version_etag(current_user.firm_id, count, last_changed, skip, limit, selected)
+    )
+    if unchanged:
+        return unchanged
 
     result = await db.execute(
-        select(IntakeForm)
+        form_rows.select(selected)
         .where(IntakeForm.firm_id == current_user.firm_id)
         .offset(skip)
         .limit(limit)
     )
 
-    return result.scalars().all()
+    return FastJSONResponse(
+        form_rows.items(result.all(), selected),
+        headers={"ETag": response.headers["etag"], "Cache-Control": response.headers["cache-control"]}
+    )
 
 
 @router.get("/forms/{form_id}", response_model=IntakeFormResponse)
 async def get_intake_form(
     form_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ) -> IntakeForm:
     """Get a specific intake form"""
@@ -85,7 +150,7 @@ async def get_intake_form(
 async def update_intake_form(
     form_id: UUID,
     form_data: IntakeFormUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ) -> IntakeForm:
     """Update an intake form"""
@@ -101,6 +166,9 @@ async def update_intake_form(
 
     # Update fields
     update_data = form_data.model_dump(exclude_unset=True)
+    if update_data.get("fields_schema") is not None:
+        _check_fields_schema(update_data["fields_schema"])
+
     for field, value in update_data.items():
         setattr(form, field, value)
 
@@ -113,7 +181,7 @@ async def update_intake_form(
 @router.delete("/forms/{form_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_intake_form(
     form_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ) -> None:
     """Delete an intake form"""
@@ -131,50 +199,88 @@ async def delete_intake_form(
     await db.commit()
 
 
+# List pages skip ORM loading and response_model validation (see RowProjection)
+submission_rows = RowProjection(IntakeSubmission, IntakeSubmissionResponse, always=("id", "created_at"))
+
+
 @router.get("/submissions", response_model=IntakeSubmissionList)
+@query_budget(3)
 async def list_submissions(
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
+    filters: list[str] = Query([], alias="filter"),
+    include_total: bool = False,
+    fields: str | None = Query(None, description="Comma-separated fields to return, e.g. id,status,created_at"),
+) -> FastJSONResponse:
+    """
+    List submissions for current user's firm, newest first
+
+    Pass the returned next_cursor to fetch the following page. The total is
+    only returned when include_total is set and comes from the firm counters.
+
+    Filter on submitted answers with repeated `filter` parameters, e.g.
+    `?filter=form_data.case_type=divorce`.
+
+    Pass `fields` to select only some columns (id and created_at are always
+    included); tables that don't show answers should leave out form_data.
+    """
+    selected = submission_rows.parse_fields(fields)
+
+    query = submission_rows.select(selected).where(IntakeSubmission.firm_id == current_user.firm_id)
+
+    json_conditions = json_filter_conditions(filters, {"form_data": IntakeSubmission.form_data})
+    if json_conditions:
+        query = query.where(*json_conditions)
+
+    result = await db.execute(keyset_paginate(query, IntakeSubmission, cursor, limit))
+    rows, next_cursor = page_items(result.all(), limit)
+
+    total = None
+    if include_total and json_conditions:
+        # Counters don't know about JSON filters, so count the filtered rows
+        count_result = await db.execute(query.with_only_columns(func.count(IntakeSubmission.id)))
+        total = count_result.scalar()
+    elif include_total:
+        total = await get_firm_count(db, current_user.firm_id, COUNTER_SUBMISSIONS)
+
+    return FastJSONResponse({
+        "items": submission_rows.items(rows, selected), "total": total, "next_cursor": next_cursor
+    })
+
+
+@router.get("/submissions/search", response_model=IntakeSubmissionList)
+@query_budget(2)
+async def search_submissions(
+    q: str = Query(..., min_length=2, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
 ) -> dict:
-    """List all submissions for current user's firm"""
-
-    # Get submissions where form belongs to user's firm
-    result = await db.execute(
-        select(IntakeSubmission)
-        .join(IntakeForm)
-        .where(IntakeForm.firm_id == current_user.firm_id)
-        .offset(skip)
-        .limit(limit)
-    )
-    submissions = result.scalars().all()
+    """Search submissions by client name, email, phone or case type (best matches first)"""
 
-    # Get total count
-    count_result = await db.execute(
-        select(func.count(IntakeSubmission.id))
-        .join(IntakeForm)
-        .where(IntakeForm.firm_id == current_user.firm_id)
-    )
-    total = count_result.scalar()
+    submissions = await search_service.search_submissions(db, current_user.firm_id, q, limit)
 
-    return {"items": submissions, "total": total}
+    return {"items": submissions}
 
 
 @router.get("/submissions/{submission_id}", response_model=IntakeSubmissionResponse)
+@query_budget(2)
 async def get_submission(
     submission_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    request: Request,
+    response: Response,
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ) -> IntakeSubmission:
-    """Get a specific submission"""
+    """Get a specific submission (supports If-None-Match)"""
 
     result = await db.execute(
         select(IntakeSubmission)
-        .join(IntakeForm)
         .where(
             IntakeSubmission.id == submission_id,
-            IntakeForm.firm_id == current_user.firm_id
+            IntakeSubmission.firm_id == current_user.firm_id
         )
     )
     submission = result.scalar_one_or_none()
@@ -182,37 +288,128 @@ async def get_submission(
     if not submission:
         raise HTTPException(status_code=404, detail="Submission not found")
 
+    unchanged = conditional_response(
+        request, response, version_etag(submission.id, submission.updated_at or submission.created_at)
+    )
+    if unchanged:
+        return unchanged
+
     return submission
 
 
+@router.get("/submissions/{submission_id}/detail", response_model=IntakeSubmissionDetail)
+@query_budget(3)
+async def get_submission_detail(
+    submission_id: UUID,
+    current_user: Principal = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_db)
+) -> IntakeSubmissionDetail:
+    """
+    Get a submission with its form, client and documents in one response
+
+    Replaces the dashboard's separate submission, client, form and document
+    requests: form and client are joined into the submission query and the
+    documents come from one selectin query. Document download URLs are
+    presigned in a single batch. The signature status is the locally stored
+    one (kept current by the DocuSign webhook).
+    """
+    result = await db.execute(
+        select(IntakeSubmission)
+        .options(
+            joinedload(IntakeSubmission.form),
+            joinedload(IntakeSubmission.client),
+            selectinload(IntakeSubmission.documents),
+        )
+        .where(
+            IntakeSubmission.id == submission_id,
+            IntakeSubmission.firm_id == current_user.firm_id
+        )
+    )
+    submission = result.scalar_one_or_none()
+
+    if not submission:
+        raise HTTPException(status_code=404, detail="Submission not found")
+
+    detail = IntakeSubmissionDetail.model_validate(submission)
+
+    try:
+        download_urls = await generate_presigned_urls([doc.s3_key for doc in detail.documents])
+    except Exception as e:
+        # The rest of the page is still useful without download links
+        print(f"Error presigning documents for submission {submission_id}: {e}")
+        download_urls = {}
+    for document in detail.documents:
+        document.download_url = download_urls.get(document.s3_key)
+
+    return detail
+
+
 # Public endpoint to get form details (no auth required)
 @router.get("/public/forms/{form_id}", response_model=IntakeFormResponse)
+@query_budget(1)
 async def get_public_intake_form(
     form_id: UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db)
-) -> IntakeForm:
-    """Get a specific intake form for public form submission"""
+) -> Response:
+    """
+    Get a specific intake form for public form submission
+
+    Served from the public form cache when possible, including its
+    precompressed gzip/br bodies. Sends an ETag and Cache-Control so
+    browsers/CDNs revalidate with If-None-Match (304).
+    """
+    cache_headers = {
+        "Cache-Control": f"public, max-age={settings.PUBLIC_FORM_MAX_AGE_SECONDS}, must-revalidate"
+    }
+
+    cached = await public_form_cache.get(form_id)
+    if cached is None:
+        result = await db.execute(
+            select(IntakeForm).where(IntakeForm.id == form_id)
+        )
+        form = result.scalar_one_or_none()
 
-    result = await db.execute(
-        select(IntakeForm).where(IntakeForm.id == form_id)
-    )
-    form = result.scalar_one_or_none()
+        if not form:
+            raise HTTPException(status_code=404, detail="Intake form not found")
 
-    if not form:
-        raise HTTPException(status_code=404, detail="Intake form not found")
+        # Only return active forms to public (deactivating invalidates the cache)
+        if not form.is_active:
+            raise HTTPException(status_code=404, detail="This form is no longer active")
 
-    # Only return active forms to public
-    if not form.is_active:
-        raise HTTPException(status_code=404, detail="This form is no longer active")
+        body = IntakeFormResponse.model_validate(form).model_dump_json().encode()
+        cached = await public_form_cache.store(form_id, body)
 
-    return form
+    body, etag, encoded = cached
+    cache_headers["Vary"] = "Accept-Encoding"
+
+    if etag_matches(request, etag):
+        return not_modified(etag, cache_headers)
+
+    # Serve the cached gzip/br variant (the compression middleware leaves
+    # encoded responses alone). Weak ETag: same content, different bytes.
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"), encoded)
+    if encoding:
+        return Response(
+            content=encoded[encoding],
+            media_type="application/json",
+            headers={"ETag": f"W/{etag}", "Content-Encoding": encoding, **cache_headers}
+        )
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, **cache_headers}
+    )
 
 
 # Public endpoint for clients to submit intake forms
 @router.post("/public/forms/{form_id}/submit", response_model=IntakeSubmissionResponse, status_code=status.HTTP_201_CREATED)
+@query_budget(2)
 async def submit_intake_form(
     form_id: UUID,
     submission_data: IntakeSubmissionPublicCreate,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ) -> IntakeSubmission:
     """Public endpoint for clients to submit intake forms"""
@@ -226,8 +423,20 @@ async def submit_intake_form(
     if not form:
         raise HTTPException(status_code=404, detail="Intake form not found or inactive")
 
-    # Extract client info from form data
+    # Validate against the form's schema (compiled once per form version)
     form_data = submission_data.form_data
+    validator = get_validator(form.id, form.updated_at or form.created_at, form.fields_schema)
+    errors = validator(form_data)
+    if errors:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[
+                {"loc": ["body", "form_data", field], "msg": f"{field} {message}", "type": "value_error"}
+                for field, message in errors.items()
+            ]
+        )
+
+    # Extract client info from form data
     client_email = form_data.get("email")
     client_first_name = form_data.get("first_name", form_data.get("firstName", ""))
     client_last_name = form_data.get("last_name", form_data.get("lastName", ""))
@@ -235,97 +444,71 @@ async def submit_intake_form(
     if not client_email:
         raise HTTPException(status_code=400, detail="Client email is required")
 
-    # Check if client exists, create if not
-    client_result = await db.execute(
-        select(Client).where(Client.email == client_email, Client.firm_id == form.firm_id)
-    )
-    client = client_result.scalar_one_or_none()
-
-    if not client:
-        client = Client(
+    # Upsert the client and insert the submission in one statement/round trip.
+    # ON CONFLICT (firm_id, email) means concurrent submits share one client row.
+    upserted_client = (
+        pg_insert(Client)
+        .values(
+            id=uuid4(),
+            firm_id=form.firm_id,
             email=client_email,
             first_name=client_first_name,
             last_name=client_last_name,
             phone=form_data.get("phone"),
-            firm_id=form.firm_id,
-            intake_data=form_data
+            intake_data=form_data,
+            status="pending"
+        )
+        .on_conflict_do_update(
+            index_elements=[Client.firm_id, Client.email],
+            set_={"updated_at": func.now()}
         )
-        db.add(client)
-        await db.flush()
-
-    # Create submission
-    submission = IntakeSubmission(
-        form_id=form_id,
-        client_id=client.id,
-        form_data=form_data,
-        payment_amount=form.retainer_amount
+        .returning(Client.id)
+        .cte("upserted_client")
     )
 
-    db.add(submission)
+    result = await db.execute(
+        insert(IntakeSubmission)
+        .from_select(
+            ["id", "form_id", "firm_id", "client_id", "form_data", "payment_amount"],
+            select(
+                literal(uuid4(), PG_UUID),
+                literal(form_id, PG_UUID),
+                literal(form.firm_id, PG_UUID),
+                upserted_client.c.id,
+                literal(form_data, JSONB),
+                literal(form.retainer_amount, String)
+            )
+        )
+        .returning(IntakeSubmission)
+    )
+    submission = result.scalar_one()
     await db.commit()
-    await db.refresh(submission)
 
     # Determine the workflow: signature first, then payment
     signature_url = None
-    payment_url = None
     next_step = None
+    needs_payment = bool(form.payment_required and form.retainer_amount)
 
     # Step 1: Check if signature is required (if there's a retainer template)
     if form.retainer_template_url or form.payment_required:
         # For now, we'll create a simple signature page
         # In production, this would integrate with DocuSign
         signature_url = f"{settings.CORS_ORIGINS[0]}/signature/sign?submission_id={submission.id}"
-        submission.signature_status = 'pending'
         next_step = 'signature'
-
-        # Also prepare payment URL for after signature
-        if form.payment_required and form.retainer_amount:
-            try:
-                checkout_session = await create_checkout_session(
-                    amount=float(form.retainer_amount),
-                    success_url=f"{settings.CORS_ORIGINS[0]}/payment/success?submission_id={submission.id}",
-                    cancel_url=f"{settings.CORS_ORIGINS[0]}/payment/cancelled?submission_id={submission.id}",
-                    metadata={
-                        'submission_id': str(submission.id),
-                        'form_id': str(form_id),
-                        'client_id': str(client.id),
-                    }
-                )
-                payment_url = checkout_session['url']
-
-                # Update submission with payment session ID
-                submission.stripe_payment_intent_id = checkout_session['id']
-            except Exception as e:
-                # Log error but don't fail the submission
-                print(f"Error creating payment session: {e}")
-
-    elif form.payment_required and form.retainer_amount:
+    elif needs_payment:
         # Payment only (no signature)
-        try:
-            checkout_session = await create_checkout_session(
-                amount=float(form.retainer_amount),
-                success_url=f"{settings.CORS_ORIGINS[0]}/payment/success?submission_id={submission.id}",
-                cancel_url=f"{settings.CORS_ORIGINS[0]}/payment/cancelled?submission_id={submission.id}",
-                metadata={
-                    'submission_id': str(submission.id),
-                    'form_id': str(form_id),
-                    'client_id': str(client.id),
-                }
-            )
-            payment_url = checkout_session['url']
-            submission.stripe_payment_intent_id = checkout_session['id']
-            next_step = 'payment'
-        except Exception as e:
-            print(f"Error creating payment session: {e}")
+        next_step = 'payment'
 
-    await db.commit()
+    # The Stripe checkout session is created after the response is sent; the
+    # client gets its URL from POST /public/submissions/{id}/checkout (which
+    # creates it on the spot if this hasn't finished yet)
+    if needs_payment:
+        background_tasks.add_task(prefetch_checkout_session, submission.id)
 
     # Build response with workflow information
     response = IntakeSubmissionResponse.model_validate(submission)
     if signature_url:
         response.signature_url = signature_url
-    if payment_url:
-        response.payment_url = payment_url
     if next_step:
         response.next_step = next_step
 
@@ -349,3 +532,78 @@ async def get_public_submission(
         raise HTTPException(status_code=404, detail="Submission not found")
 
     return submission
+
+
+@router.get("/public/submissions/{submission_id}/events", response_class=StreamingResponse)
+async def stream_public_submission_events(submission_id: UUID) -> StreamingResponse:
+    """
+    Stream submission status changes as Server-Sent Events (public)
+
+    Sends an `event: status` with the current state on connect and after every
+    signature/payment change, replacing status polling. Uses short-lived
+    sessions instead of get_db so no pooled connection is held while the
+    stream is open.
+    """
+    async def load_snapshot() -> dict:
+        async with AsyncSessionLocal() as db:
+            submission = await db.get(IntakeSubmission, submission_id)
+            if not submission:
+                raise HTTPException(status_code=404, detail="Submission not found")
+            return status_payload(submission)
+
+    # Fail fast with a proper status code before the stream starts. The slot
+    # is taken first so concurrent connects can't all pass the cap.
+    release = submission_event_streams.reserve(submission_id)
+    try:
+        await load_snapshot()
+    except BaseException:
+        release()
+        raise
+
+    return StreamingResponse(
+        submission_event_streams.stream(submission_id, load_snapshot, release),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS,
+        background=BackgroundTask(release)
+    )
+
+
+@router.post("/public/submissions/{submission_id}/checkout")
+@query_budget(2)
+async def create_public_checkout(
+    submission_id: UUID,
+    db: AsyncSession = Depends(get_db)
+) -> dict:
+    """
+    Get the Stripe checkout URL for a submission (public, called at the payment step)
+
+    Returns the session prefetched after submit, or creates it now.
+    """
+    result = await db.execute(
+        select(IntakeSubmission).where(IntakeSubmission.id == submission_id)
+    )
+    submission = result.scalar_one_or_none()
+
+    if not submission:
+        raise HTTPException(status_code=404, detail="Submission not found")
+
+    if submission.payment_status == "succeeded":
+        raise HTTPException(status_code=400, detail="Payment already completed")
+
+    try:
+        payment_url = await ensure_checkout_session(db, submission)
+    except Exception as e:
+        print(f"Error creating payment session: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Payment provider unavailable, please try again"
+        )
+
+    if not payment_url:
+        raise HTTPException(status_code=400, detail="No payment required for this submission")
+
+    return {
+        "submission_id": str(submission.id),
+        "payment_url": payment_url,
+        "stripe_session_id": submission.stripe_payment_intent_id
+    }
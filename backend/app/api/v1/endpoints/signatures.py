@@ -6,11 +6,13 @@ from datetime import datetime
 from typing import Dict, Any
 
 from app.core.deps import get_db, get_current_active_user
-from app.models.user import User
+from app.core.instrumentation import query_budget
+from app.core.principal import Principal
 from app.models.intake import IntakeSubmission, IntakeForm
 from app.models.document import Document
 from app.services.docusign_service import docusign_service
 from app.services.s3_service import download_file
+from app.services.submission_events import publish_submission_status
 
 router = APIRouter()
 
@@ -60,6 +62,7 @@ async def sign_document_public(
         submission.status = 'awaiting_payment'
 
     await db.commit()
+    await publish_submission_status(submission)
 
     return {
         'status': 'success',
@@ -97,6 +100,7 @@ async def complete_payment_public(
     submission.status = 'completed'
 
     await db.commit()
+    await publish_submission_status(submission)
 
     return {
         'status': 'success',
@@ -107,9 +111,10 @@ async def complete_payment_public(
 
 
 @router.post("/submissions/{submission_id}/request")
+@query_budget(4)
 async def request_signature(
     submission_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """
@@ -119,23 +124,27 @@ async def request_signature(
     - Submission must have a retainer document uploaded
     - User must belong to the firm that owns the submission
     """
-    # Verify submission exists and belongs to user's firm
+    # Load the submission with its client and form in one round trip
+    from app.models.client import Client
     result = await db.execute(
-        select(IntakeSubmission)
-        .join(IntakeForm)
+        select(IntakeSubmission, Client, IntakeForm)
+        .join(IntakeForm, IntakeForm.id == IntakeSubmission.form_id)
+        .outerjoin(Client, Client.id == IntakeSubmission.client_id)
         .where(
             IntakeSubmission.id == submission_id,
-            IntakeForm.firm_id == current_user.firm_id
+            IntakeSubmission.firm_id == current_user.firm_id
         )
     )
-    submission = result.scalar_one_or_none()
+    row = result.one_or_none()
 
-    if not submission:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Submission not found"
         )
 
+    submission, client, form = row
+
     # Check if already signed
     if submission.signature_status == 'signed':
         raise HTTPException(
@@ -143,13 +152,6 @@ async def request_signature(
             detail="Document already signed"
         )
 
-    # Get client info
-    from app.models.client import Client
-    client_result = await db.execute(
-        select(Client).where(Client.id == submission.client_id)
-    )
-    client = client_result.scalar_one_or_none()
-
     if not client:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -176,12 +178,6 @@ async def request_signature(
         document_obj = document[0]  # Extract from tuple
         doc_content = await download_file(document_obj.s3_key)
 
-        # Get form for return URL
-        form_result = await db.execute(
-            select(IntakeForm).where(IntakeForm.id == submission.form_id)
-        )
-        form = form_result.scalar_one()
-
         # Send signature request via DocuSign
         from app.core.config import settings
         result = await docusign_service.create_envelope(
@@ -224,7 +220,7 @@ async def request_signature(
 @router.get("/submissions/{submission_id}/status")
 async def get_signature_status(
     submission_id: UUID,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ) -> Dict[str, Any]:
     """Get the signature status for a submission"""
@@ -232,10 +228,9 @@ async def get_signature_status(
     # Verify submission exists and belongs to user's firm
     result = await db.execute(
         select(IntakeSubmission)
-        .join(IntakeForm)
         .where(
             IntakeSubmission.id == submission_id,
-            IntakeForm.firm_id == current_user.firm_id
+            IntakeSubmission.firm_id == current_user.firm_id
         )
     )
     submission = result.scalar_one_or_none()
@@ -269,11 +264,13 @@ async def get_signature_status(
                 submission.signed_at = datetime.utcnow()
                 submission.status = 'completed'
                 await db.commit()
+                await publish_submission_status(submission)
 
             elif envelope_status == 'declined' and submission.signature_status != 'declined':
                 submission.signature_status = 'declined'
                 submission.status = 'declined'
                 await db.commit()
+                await publish_submission_status(submission)
 
             return {
                 'status': 'success',
@@ -364,6 +361,7 @@ async def docusign_webhook(
                 submission.signature_status = 'delivered'
 
         await db.commit()
+        await publish_submission_status(submission)
 
         return {
             'status': 'success',
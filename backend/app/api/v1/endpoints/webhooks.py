@@ -5,13 +5,16 @@ from datetime import datetime
 from uuid import UUID
 
 from app.core.deps import get_db
+from app.core.instrumentation import query_budget
 from app.models.intake import IntakeSubmission
 from app.services.stripe_service import handle_webhook
+from app.services.submission_events import publish_submission_status
 
 router = APIRouter()
 
 
 @router.post("/stripe")
+@query_budget(2)
 async def stripe_webhook(
     request: Request,
     db: AsyncSession = Depends(get_db)
@@ -68,6 +71,7 @@ async def stripe_webhook(
             submission.status = "payment_completed"
 
             await db.commit()
+            await publish_submission_status(submission)
 
             return {
                 "status": "success",
@@ -91,7 +95,9 @@ async def stripe_webhook(
                 if submission:
                     submission.payment_status = "expired"
                     submission.status = "payment_expired"
+                    submission.payment_url = None  # Next checkout call creates a fresh session
                     await db.commit()
+                    await publish_submission_status(submission)
 
             return {
                 "status": "success",
@@ -0,0 +1,194 @@
+import asyncio
+from abc import ABC, abstractmethod
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Set, TypeVar
+
+from redis.exceptions import RedisError
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.redis import get_redis
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Small in-process LRU cache with per-entry expiry"""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value, or None if missing or expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: float | None = None) -> None:
+        """Store a value, evicting the least recently used entry if full"""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        """Remove a key if present"""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Written over an entry on invalidation. It outlives any read that started
+# before the change committed, so that read can't re-cache the old value
+_TOMBSTONE = object()
+TOMBSTONE_REDIS_VALUE = b"\x00invalidated"
+TOMBSTONE_TTL_SECONDS = 10
+
+
+class TwoTierCache(ABC, Generic[V]):
+    """
+    In-process TTL LRU in front of an optional Redis tier shared by workers
+
+    Subclasses set REDIS_PREFIX and NAME and implement encode/decode between
+    the local value and what Redis stores. invalidate() leaves a short
+    tombstone in both tiers instead of deleting. Redis writes use NX, so a
+    request that missed, read the old row and calls set() after the change
+    committed doesn't put the stale value back. Entries that other workers
+    hold locally expire with their (short) local TTL.
+    """
+
+    REDIS_PREFIX = ""
+    NAME = "Cache"
+
+    def __init__(self, max_size: int, ttl: float, redis_ttl: int, redis_enabled: bool = True):
+        self.local: TTLCache[str, Any] = TTLCache(max_size=max_size, ttl=ttl)
+        self.redis_enabled = redis_enabled
+        self.redis_ttl = redis_ttl
+        self._pending: Set[asyncio.Task] = set()
+
+        # Metrics
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def encode(self, value: V) -> str | bytes:
+        """Redis representation of a value"""
+
+    @abstractmethod
+    def decode(self, raw: bytes) -> V:
+        """Local value from its Redis representation"""
+
+    async def get(self, key: Hashable) -> V | None:
+        """Return the cached value, if any"""
+        key = str(key)
+
+        value = self.local.get(key)
+        if value is _TOMBSTONE:
+            self.misses += 1
+            return None
+        if value is not None:
+            self.local_hits += 1
+            return value
+
+        if self.redis_enabled:
+            try:
+                raw = await get_redis().get(self.REDIS_PREFIX + key)
+            except RedisError as e:
+                print(f"{self.NAME} Redis error: {e}")
+                raw = None
+
+            if raw is not None and raw != TOMBSTONE_REDIS_VALUE:
+                value = self.decode(raw)
+                self.local.set(key, value)
+                self.redis_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: Hashable, value: V) -> None:
+        """Store a value in both tiers, unless it was invalidated moments ago"""
+        key = str(key)
+        if self.local.get(key) is _TOMBSTONE:
+            return
+        self.local.set(key, value)
+
+        if self.redis_enabled:
+            try:
+                await get_redis().set(self.REDIS_PREFIX + key, self.encode(value), ex=self.redis_ttl, nx=True)
+            except RedisError as e:
+                print(f"{self.NAME} Redis error: {e}")
+
+    def invalidate(self, key: Hashable) -> None:
+        """Tombstone a key in both tiers (the Redis write runs in the background)"""
+        key = str(key)
+        self.local.set(key, _TOMBSTONE, ttl=TOMBSTONE_TTL_SECONDS)
+
+        if self.redis_enabled:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+            task = loop.create_task(self._invalidate_remote(key))
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def _invalidate_remote(self, key: str) -> None:
+        try:
+            await get_redis().set(self.REDIS_PREFIX + key, TOMBSTONE_REDIS_VALUE, ex=TOMBSTONE_TTL_SECONDS)
+        except RedisError as e:
+            print(f"{self.NAME} Redis error: {e}")
+
+    def invalidate_on_commit(self, model: Any) -> None:
+        """
+        Invalidate a model's rows (by id) after any committed update or delete
+
+        Rows are marked on flush and invalidated after commit, not at flush
+        time, so a concurrent request can't re-cache the old row in between.
+        """
+        pending_key = f"cache_invalidate:{self.REDIS_PREFIX}"
+
+        def mark_changed(mapper: Any, connection: Any, target: Any) -> None:
+            session = Session.object_session(target)
+            if session is not None:
+                session.info.setdefault(pending_key, set()).add(target.id)
+
+        def invalidate_changed(session: Session) -> None:
+            for key in session.info.pop(pending_key, ()):
+                self.invalidate(key)
+
+        def discard_changed(session: Session) -> None:
+            session.info.pop(pending_key, None)
+
+        event.listen(model, "after_update", mark_changed)
+        event.listen(model, "after_delete", mark_changed)
+        event.listen(Session, "after_commit", invalidate_changed)
+        event.listen(Session, "after_rollback", discard_changed)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters"""
+        return {
+            "size": len(self.local),
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,212 @@
+import gzip
+import zlib
+from typing import Dict, Iterable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Preferred first; br only when the optional brotli package is installed
+SUPPORTED_ENCODINGS = ("br", "gzip") if BROTLI_AVAILABLE else ("gzip",)
+
+# Bodies that are already compressed (or meant to be saved as-is) aren't
+# worth the CPU; text/event-stream must reach the client unbuffered
+EXCLUDED_TYPES = {
+    "text/event-stream",
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/octet-stream",
+}
+EXCLUDED_TYPE_PREFIXES = ("image/", "video/", "audio/")
+
+# Precompressed bodies are built once per cache fill, so trade a little more
+# CPU for ratio. Still on the event loop: brotli 10-11 costs 10-20 ms for a
+# 150-field form, for ~15% fewer bytes (see benchmarks/compression_benchmark.py)
+PRECOMPRESS_GZIP_LEVEL = 9
+PRECOMPRESS_BROTLI_QUALITY = 7
+
+
+def negotiate_encoding(accept_encoding: str | None, available: Iterable[str] = SUPPORTED_ENCODINGS) -> str | None:
+    """Best content coding the client accepts (by q-value, then our preference), or None"""
+    if not accept_encoding:
+        return None
+
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    best, best_weight = None, 0.0
+    for encoding in available:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+def compress(body: bytes, encoding: str, level: int | None = None) -> bytes:
+    """Compress a whole body with the given content coding"""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY if level is None else level)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL if level is None else level, mtime=0)
+
+
+def precompress(body: bytes) -> Dict[str, bytes]:
+    """
+    Encoded variants of a body worth caching alongside it
+
+    Returns {encoding: compressed body}; empty for bodies below the
+    compression threshold, and variants that don't shrink are left out.
+    """
+    if len(body) < settings.COMPRESSION_MINIMUM_SIZE:
+        return {}
+
+    levels = {"gzip": PRECOMPRESS_GZIP_LEVEL, "br": PRECOMPRESS_BROTLI_QUALITY}
+    variants = {encoding: compress(body, encoding, levels[encoding]) for encoding in SUPPORTED_ENCODINGS}
+    return {encoding: data for encoding, data in variants.items() if len(data) < len(body)}
+
+
+class _StreamCompressor:
+    """Incremental compressor that flushes after every chunk so streams keep flowing"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+        else:
+            self._zlib = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def chunk(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.process(data) + self._brotli.flush()
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush(zlib.Z_FINISH)
+
+
+def _should_skip(status: int, headers: Headers) -> bool:
+    if status < 200 or status in (204, 206, 304):
+        return True
+    if "content-encoding" in headers or "content-range" in headers:
+        return True
+    # Document downloads are served as attachments and saved as-is
+    if headers.get("content-disposition", "").lower().startswith("attachment"):
+        return True
+
+    content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+    return content_type in EXCLUDED_TYPES or content_type.startswith(EXCLUDED_TYPE_PREFIXES)
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    """Mark a strong ETag weak: RFC 9110 needs a distinct strong tag per content coding"""
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
+
+
+class CompressionMiddleware:
+    """
+    gzip/brotli response compression
+
+    Compresses responses of at least COMPRESSION_MINIMUM_SIZE bytes when the
+    client sends a matching Accept-Encoding. Streaming responses are
+    compressed chunk by chunk (each chunk flushed), so they still arrive
+    progressively. Skipped for responses that already have a
+    Content-Encoding (e.g. precompressed cache entries, see precompress()),
+    ranges, attachments, event streams and already-compressed media types.
+    A strong ETag on a compressed response is sent weak.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int | None = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MINIMUM_SIZE if minimum_size is None else minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        compressor: _StreamCompressor | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                start = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                headers = MutableHeaders(raw=start["headers"])
+                declared_length = headers.get("content-length")
+                too_small = (
+                    len(body) < self.minimum_size if not more_body
+                    else declared_length is not None and int(declared_length) < self.minimum_size
+                )
+                if too_small or _should_skip(start["status"], headers):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                headers["Content-Encoding"] = encoding
+                headers.add_vary_header("Accept-Encoding")
+
+                if not more_body:
+                    compressed = compress(body, encoding)
+                    if len(compressed) >= len(body):
+                        del headers["Content-Encoding"]
+                        passthrough = True
+                        await send(start)
+                        await send(message)
+                        return
+                    headers["Content-Length"] = str(len(compressed))
+                    _weaken_etag(headers)
+                    await send(start)
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+
+                # Streaming: final length unknown
+                del headers["Content-Length"]
+                _weaken_etag(headers)
+                compressor = _StreamCompressor(encoding)
+                await send(start)
+
+            data = compressor.chunk(body) if body else b""
+            if not more_body:
+                data += compressor.finish()
+            await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,72 @@
+import hashlib
+from typing import Any, Dict
+
+from fastapi import Request, Response, status
+
+
+# Authenticated reads: browsers may keep a private copy but must revalidate it
+PRIVATE_REVALIDATE = "private, no-cache"
+
+
+def etag_for(content: bytes) -> str:
+    """Strong ETag for a response body"""
+    return f'"{hashlib.sha256(content).hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already has this ETag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    wanted = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == wanted for tag in header.split(","))
+
+
+def not_modified(etag: str, headers: Dict[str, str] | None = None) -> Response:
+    """304 response carrying the validator (and caching headers) of the current version"""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, **(headers or {})},
+    )
+
+
+def version_etag(*versions: Any) -> str:
+    """
+    Weak ETag from row versions (ids, updated_at/created_at, counts, query params)
+
+    Unlike etag_for this doesn't need the response body, so the 304 path
+    skips serialization entirely.
+    """
+    raw = "|".join(str(version) for version in versions)
+    return f'W/"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+    cache_control: str = PRIVATE_REVALIDATE
+) -> Response | None:
+    """
+    Attach validator headers to the response and short-circuit unchanged reads
+
+    Returns a 304 to send instead of the body when If-None-Match has this
+    ETag, otherwise None (the endpoint returns its data as usual).
+
+    Example:
+        cached = conditional_response(request, response, version_etag(row.id, row.updated_at))
+        if cached:
+            return cached
+        return row
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+    if etag_matches(request, etag):
+        return not_modified(etag, {"Cache-Control": cache_control})
+    return None
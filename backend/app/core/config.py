@@ -11,14 +11,57 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     SECRET_KEY: str
 
+    # Password hashing pool
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+
     # Database
     DATABASE_URL: str
     DATABASE_POOL_SIZE: int = 10
     DATABASE_MAX_OVERFLOW: int = 20
 
+    # SQL instrumentation
+    QUERY_REPEAT_THRESHOLD: int = 5  # same statement more often per request = likely N+1
+    SLOW_QUERY_MS: int = 500
+
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # Principal (authenticated user) cache
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10000
+    PRINCIPAL_CACHE_REDIS_ENABLED: bool = False
+    PRINCIPAL_CACHE_REDIS_TTL_SECONDS: int = 300
+
+    # Public intake form cache (in-process LRU in front of Redis)
+    PUBLIC_FORM_CACHE_TTL_SECONDS: int = 10
+    PUBLIC_FORM_CACHE_MAX_SIZE: int = 1000
+    PUBLIC_FORM_CACHE_REDIS_TTL_SECONDS: int = 300
+    PUBLIC_FORM_MAX_AGE_SECONDS: int = 60  # Browser/CDN Cache-Control max-age
+
+    # Compiled intake form validators kept in memory (one per form version)
+    FORM_VALIDATOR_CACHE_SIZE: int = 1000
+
+    # Idempotency-Key responses (public submit/sign/pay)
+    IDEMPOTENCY_TTL_SECONDS: int = 86400
+    IDEMPOTENCY_LOCK_SECONDS: int = 30  # How long a running request holds its key
+    IDEMPOTENCY_WAIT_SECONDS: int = 10  # How long a concurrent duplicate waits for it
+
+    # Submission status streams (Server-Sent Events)
+    SSE_HEARTBEAT_SECONDS: int = 15
+    SSE_MAX_STREAM_SECONDS: int = 900  # Clients reconnect after this
+    SSE_MAX_CONNECTIONS: int = 1000  # Per process
+    SSE_MAX_CONNECTIONS_PER_SUBMISSION: int = 5
+
+    # Live dashboard feed (Postgres LISTEN/NOTIFY fanned out over SSE)
+    FIRM_FEED_MAX_CONNECTIONS_PER_FIRM: int = 50
+    FIRM_FEED_QUEUE_SIZE: int = 100  # Pending changes per stream before it's told to resync
+
+    # Response compression (br needs the optional brotli package)
+    COMPRESSION_MINIMUM_SIZE: int = 1024  # Bytes; smaller bodies aren't worth it
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000"]
 
@@ -28,6 +71,11 @@ class Settings(BaseSettings):
     S3_SECRET_ACCESS_KEY: str
     S3_BUCKET_NAME: str
     S3_REGION: str = "us-east-1"
+    S3_MAX_POOL_CONNECTIONS: int = 50  # HTTP connections, and threads running S3 calls
+    S3_UPLOAD_PART_SIZE: int = 8 * 1024 * 1024  # Multipart part size (S3 minimum 5 MiB); upload memory per request
+
+    # Uploads
+    MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # Bytes; enforced while the upload streams in
 
     # Stripe
     STRIPE_SECRET_KEY: str
@@ -50,6 +98,7 @@ class Settings(BaseSettings):
     # Celery
     CELERY_BROKER_URL: str = "redis://localhost:6379/1"
     CELERY_RESULT_BACKEND: str = "redis://localhost:6379/2"
+    FIRM_COUNTERS_RECONCILE_SECONDS: int = 3600
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,4 +1,5 @@
 from typing import AsyncGenerator
+from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
@@ -6,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.config import settings
+from app.core.principal import Principal, principal_cache
 from app.core.security import ALGORITHM
 from app.db.base import AsyncSessionLocal
 from app.models.user import User
@@ -25,8 +27,14 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db)
-) -> User:
-    """Get current authenticated user"""
+) -> Principal:
+    """
+    Get current authenticated user
+
+    Tenant and role are read from the signed token claims. The only state
+    checked is the user's token version and active flag, which come from the
+    principal cache, so a warm request makes no auth queries at all.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -35,27 +43,46 @@ async def get_current_user(
 
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
+        user_id = UUID(payload.get("sub"))
+        token_version = int(payload.get("ver", 0))
+    except (JWTError, TypeError, ValueError):
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    current = await principal_cache.get(user_id)
+
+    if current is None:
+        result = await db.execute(
+            select(User.id, User.firm_id, User.is_active, User.is_superuser, User.token_version)
+            .where(User.id == user_id)
+        )
+        row = result.one_or_none()
+
+        if row is None:
+            raise credentials_exception
+
+        current = Principal(
+            id=row.id,
+            firm_id=row.firm_id,
+            is_active=bool(row.is_active),
+            is_superuser=bool(row.is_superuser),
+            token_version=row.token_version,
+        )
+        await principal_cache.set(current.id, current)
 
-    if user is None:
+    # Token was issued before the user's claims changed or tokens were revoked
+    if token_version < current.token_version:
         raise credentials_exception
 
-    if not user.is_active:
+    if not current.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
 
-    return user
+    # Tokens issued before tenant claims existed fall back to the cached row
+    return Principal.from_claims(payload) or current
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: Principal = Depends(get_current_user),
+) -> Principal:
     """Get current active user"""
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
@@ -0,0 +1,78 @@
+import json
+import math
+from typing import Any, Dict, List
+
+from fastapi import HTTPException, status
+from sqlalchemy import Column, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+def _parse_value(raw: str) -> List[Any]:
+    """
+    Candidate JSON values for a filter value
+
+    The raw text always matches as a string. If it is also a JSON literal
+    (number, true/false/null or a quoted string) that value matches too, so
+    `age=30` finds both "30" and 30. NaN/Infinity (and overflowing numbers
+    like 1e999) aren't valid JSON, so they only match as strings.
+    """
+    candidates: List[Any] = [raw]
+    try:
+        parsed = json.loads(raw)
+    except ValueError:
+        return candidates
+
+    if isinstance(parsed, float) and not math.isfinite(parsed):
+        return candidates
+    if not isinstance(parsed, (dict, list)) and parsed != raw:
+        candidates.append(parsed)
+    return candidates
+
+
+def _nest(keys: List[str], value: Any) -> Dict[str, Any]:
+    """Build {"a": {"b": value}} from ["a", "b"]"""
+    doc: Any = value
+    for key in reversed(keys):
+        doc = {key: doc}
+    return doc
+
+
+def json_filter_conditions(
+    filters: List[str],
+    columns: Dict[str, Column]
+) -> List[ColumnElement]:
+    """
+    Turn `column.path.to.key=value` filters into JSONB containment conditions
+
+    Each filter becomes `column @> '{"path": {"to": {"key": value}}}'`, which
+    Postgres answers from the column's GIN index instead of scanning rows.
+
+    Args:
+        filters: Raw filter expressions, e.g. ["form_data.case_type=divorce"]
+        columns: Filterable JSONB columns by name
+
+    Returns:
+        SQL conditions to AND into the query
+    """
+    conditions = []
+
+    for expression in filters:
+        path, sep, raw_value = expression.partition("=")
+        column_name, _, key_path = path.partition(".")
+        keys = [key for key in key_path.split(".") if key]
+
+        if not sep or column_name not in columns or not keys:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=(
+                    f"Invalid filter '{expression}'. Use <field>.<key>=<value> "
+                    f"where field is one of: {', '.join(columns)}"
+                )
+            )
+
+        column = columns[column_name]
+        conditions.append(or_(*[
+            column.contains(_nest(keys, value)) for value in _parse_value(raw_value)
+        ]))
+
+    return conditions
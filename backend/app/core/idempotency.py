@@ -0,0 +1,211 @@
+import asyncio
+import base64
+import hashlib
+import json
+import re
+from typing import Iterable, List, Pattern
+
+from redis.exceptions import RedisError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.redis import get_redis
+
+IDEMPOTENCY_HEADER = b"idempotency-key"
+REPLAYED_HEADER = b"idempotent-replayed"
+KEY_PREFIX = "idempotency:"
+MAX_KEY_LENGTH = 255
+
+# How often a duplicate polls while the first request is still running
+POLL_INTERVAL_SECONDS = 0.1
+
+
+def _json_response(status_code: int, detail: str) -> List[Message]:
+    body = json.dumps({"detail": detail}).encode()
+    return [
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        },
+        {"type": "http.response.body", "body": body},
+    ]
+
+
+class IdempotencyMiddleware:
+    """
+    Idempotency-Key support for retry-prone POST endpoints
+
+    The first request with a given key runs normally and its response is
+    stored in Redis for IDEMPOTENCY_TTL_SECONDS. Retries with the same key
+    get the stored response back (marked with Idempotent-Replayed: true)
+    without touching the database or Stripe. A duplicate that arrives while
+    the first is still running waits for it, so concurrent retries are
+    serialized into one execution.
+
+    5xx responses aren't stored, so the client can retry those. Reusing a key
+    with a different body is rejected with 422. Requests without the header,
+    or on paths not listed, pass straight through, as does everything when
+    Redis is unavailable.
+    """
+
+    def __init__(self, app: ASGIApp, paths: Iterable[str]) -> None:
+        self.app = app
+        self.paths: List[Pattern[str]] = [re.compile(path) for path in paths]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        key = dict(scope["headers"]).get(IDEMPOTENCY_HEADER)
+        if not key or not any(path.match(scope["path"]) for path in self.paths):
+            await self.app(scope, receive, send)
+            return
+
+        if len(key) > MAX_KEY_LENGTH:
+            await self._send_messages(send, _json_response(400, "Idempotency-Key is too long"))
+            return
+
+        body = await self._read_body(receive)
+        fingerprint = hashlib.sha256(body).hexdigest()
+        store_key = f"{KEY_PREFIX}{scope['path']}:{key.decode('latin-1')}"
+
+        try:
+            redis = get_redis()
+            acquired = await redis.set(
+                store_key,
+                json.dumps({"state": "pending", "fingerprint": fingerprint}),
+                nx=True,
+                ex=settings.IDEMPOTENCY_LOCK_SECONDS,
+            )
+        except RedisError as e:
+            print(f"[IDEMPOTENCY] Redis unavailable, not deduplicating: {e}")
+            await self.app(scope, self._replay_body(body, receive), send)
+            return
+
+        if acquired:
+            await self._run_and_store(scope, self._replay_body(body, receive), send, store_key, fingerprint)
+        else:
+            await self._replay(send, store_key, fingerprint)
+
+    async def _run_and_store(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        store_key: str,
+        fingerprint: str
+    ) -> None:
+        """Run the request, streaming the response through while capturing it"""
+        start: Message = {}
+        chunks: List[bytes] = []
+
+        async def capture(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, capture)
+        except BaseException:
+            await self._release(store_key)
+            raise
+
+        if not start or start["status"] >= 500:
+            await self._release(store_key)
+            return
+
+        record = {
+            "state": "done",
+            "fingerprint": fingerprint,
+            "status": start["status"],
+            "headers": [
+                [base64.b64encode(name).decode(), base64.b64encode(value).decode()]
+                for name, value in start.get("headers", [])
+            ],
+            "body": base64.b64encode(b"".join(chunks)).decode(),
+        }
+        try:
+            await get_redis().set(store_key, json.dumps(record), ex=settings.IDEMPOTENCY_TTL_SECONDS)
+        except RedisError as e:
+            print(f"[IDEMPOTENCY] Could not store response for {store_key}: {e}")
+
+    async def _replay(self, send: Send, store_key: str, fingerprint: str) -> None:
+        """Answer a duplicate from the stored response, waiting if it's still running"""
+        redis = get_redis()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.IDEMPOTENCY_WAIT_SECONDS
+
+        while True:
+            try:
+                raw = await redis.get(store_key)
+            except RedisError as e:
+                print(f"[IDEMPOTENCY] Redis unavailable while waiting on {store_key}: {e}")
+                raw = None
+
+            record = json.loads(raw) if raw else None
+
+            if record and record["fingerprint"] != fingerprint:
+                await self._send_messages(send, _json_response(
+                    422, "Idempotency-Key was already used with a different request body"
+                ))
+                return
+
+            if record and record["state"] == "done":
+                headers = [
+                    (base64.b64decode(name), base64.b64decode(value))
+                    for name, value in record["headers"]
+                ]
+                headers.append((REPLAYED_HEADER, b"true"))
+                await self._send_messages(send, [
+                    {"type": "http.response.start", "status": record["status"], "headers": headers},
+                    {"type": "http.response.body", "body": base64.b64decode(record["body"])},
+                ])
+                return
+
+            # Still pending, or the first attempt failed and released the key
+            if record is None or loop.time() >= deadline:
+                await self._send_messages(send, _json_response(
+                    409, "A request with this Idempotency-Key is in progress or failed; retry shortly"
+                ))
+                return
+
+            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+
+    async def _release(self, store_key: str) -> None:
+        try:
+            await get_redis().delete(store_key)
+        except RedisError as e:
+            print(f"[IDEMPOTENCY] Could not release {store_key}: {e}")
+
+    @staticmethod
+    async def _read_body(receive: Receive) -> bytes:
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body", False):
+                return body
+
+    @staticmethod
+    def _replay_body(body: bytes, receive: Receive) -> Receive:
+        """Hand the already-read body to the app, then defer to the real receive"""
+        sent = False
+
+        async def replay() -> Message:
+            nonlocal sent
+            if not sent:
+                sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        return replay
+
+    @staticmethod
+    async def _send_messages(send: Send, messages: List[Message]) -> None:
+        for message in messages:
+            await send(message)
@@ -0,0 +1,213 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, List, Tuple, TypeVar
+
+from prometheus_client import Counter as PromCounter, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Statement shapes longer than this are truncated in logs and stats
+SHAPE_MAX_LENGTH = 500
+
+_PLACEHOLDERS = re.compile(r"\$\d+|%\(\w+\)s|\?")
+_IN_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+DB_QUERIES = Histogram(
+    "lexflow_db_queries_per_request",
+    "SQL statements executed per HTTP request",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100),
+)
+DB_TIME = Histogram(
+    "lexflow_db_time_seconds",
+    "Time spent executing SQL per HTTP request",
+    ["method", "route"],
+)
+DB_REPEATED_STATEMENTS = PromCounter(
+    "lexflow_db_repeated_statements_total",
+    "Requests that ran the same statement shape more than QUERY_REPEAT_THRESHOLD times",
+    ["method", "route"],
+)
+DB_BUDGET_EXCEEDED = PromCounter(
+    "lexflow_db_query_budget_exceeded_total",
+    "Requests that ran more statements than the route's declared query budget",
+    ["method", "route"],
+)
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so repeats with different parameters compare equal"""
+    shape = _PLACEHOLDERS.sub("?", statement)
+    shape = _IN_LISTS.sub("(?...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()[:SHAPE_MAX_LENGTH]
+
+
+@dataclass
+class QueryStats:
+    """SQL executed while a tracker was active"""
+
+    count: int = 0
+    total_seconds: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest_statement: str | None = None
+    shapes: Counter = field(default_factory=Counter)
+    # (statement, parameters) as sent to the driver; only kept when capturing
+    executed: List[Tuple[str, Any]] | None = None
+
+    def record(self, statement: str, seconds: float, parameters: Any = None) -> None:
+        if self.executed is not None:
+            self.executed.append((statement, parameters))
+        shape = statement_shape(statement)
+        self.count += 1
+        self.total_seconds += seconds
+        self.shapes[shape] += 1
+        if seconds >= self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = shape
+
+    def repeated_shapes(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes executed more than `threshold` times (likely N+1 loops)"""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+
+# Every tracker active in the current context (nested trackers all see the same queries)
+_trackers: ContextVar[Tuple[QueryStats, ...]] = ContextVar("sql_trackers", default=())
+
+
+@contextmanager
+def track_queries(capture: bool = False) -> Iterator[QueryStats]:
+    """
+    Record every SQL statement executed in this context
+
+    With capture=True the exact statements and parameters are kept in
+    stats.executed (e.g. to EXPLAIN what an endpoint really ran).
+
+    Example:
+        with track_queries() as stats:
+            await client.get("/api/v1/clients/")
+        assert stats.count <= 3
+    """
+    stats = QueryStats(executed=[] if capture else None)
+    token = _trackers.set(_trackers.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _trackers.reset(token)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _trackers.get():
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    trackers = _trackers.get()
+    started = conn.info.get("query_started")
+    if not trackers or not started:
+        return
+
+    elapsed = time.perf_counter() - started.pop()
+    for stats in trackers:
+        stats.record(statement, elapsed, parameters)
+
+
+def query_budget(max_queries: int) -> Callable[[F], F]:
+    """
+    Declare the most SQL statements a route may execute per request
+
+    Requests over budget are logged and counted in
+    lexflow_db_query_budget_exceeded_total; the test suite asserts on it.
+    Place it below the @router decorator.
+    """
+    def decorator(endpoint: F) -> F:
+        endpoint.__query_budget__ = max_queries  # type: ignore[attr-defined]
+        return endpoint
+    return decorator
+
+
+def route_query_budget(scope: Scope) -> int | None:
+    """The query budget declared on the route that handled this request, if any"""
+    route = scope.get("route")
+    endpoint = getattr(route, "endpoint", None)
+    return getattr(endpoint, "__query_budget__", None)
+
+
+def _route_label(scope: Scope) -> str:
+    route = scope.get("route")
+    # Use the path template so metrics don't get one series per UUID
+    return getattr(route, "path_format", None) or getattr(route, "path", None) or "unmatched"
+
+
+class QueryStatsMiddleware:
+    """
+    Per-request SQL instrumentation
+
+    Adds a Server-Timing header (query count, DB time, slowest statement),
+    feeds the Prometheus histograms, and logs routes that exceed their
+    query budget or repeat the same statement shape in a loop.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start" and stats.count:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", self._server_timing(stats).encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._report(scope, stats)
+
+    @staticmethod
+    def _server_timing(stats: QueryStats) -> str:
+        return (
+            f'db;dur={stats.total_seconds * 1000:.1f};desc="{stats.count} queries", '
+            f'db-slowest;dur={stats.slowest_seconds * 1000:.1f}'
+        )
+
+    @staticmethod
+    def _report(scope: Scope, stats: QueryStats) -> None:
+        method = scope["method"]
+        route = _route_label(scope)
+
+        DB_QUERIES.labels(method, route).observe(stats.count)
+        DB_TIME.labels(method, route).observe(stats.total_seconds)
+
+        budget = route_query_budget(scope)
+        if budget is not None and stats.count > budget:
+            DB_BUDGET_EXCEEDED.labels(method, route).inc()
+            print(f"[SQL] {method} {route} ran {stats.count} queries (budget {budget})")
+
+        repeated = stats.repeated_shapes(settings.QUERY_REPEAT_THRESHOLD)
+        if repeated:
+            DB_REPEATED_STATEMENTS.labels(method, route).inc()
+            for shape, n in repeated:
+                print(f"[SQL] {method} {route} repeated a statement {n} times: {shape[:200]}")
+
+        if stats.slowest_seconds * 1000 >= settings.SLOW_QUERY_MS:
+            print(
+                f"[SQL] {method} {route} slowest statement took "
+                f"{stats.slowest_seconds * 1000:.0f}ms: {(stats.slowest_statement or '')[:200]}"
+            )
@@ -0,0 +1,92 @@
+import json
+from dataclasses import asdict, dataclass
+from typing import Any, Dict
+from uuid import UUID
+
+from sqlalchemy import event, inspect
+
+from app.core.cache import TwoTierCache
+from app.core.config import settings
+from app.core.security import ROLE_ADMIN
+from app.models.user import User
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated user as seen by request handlers"""
+
+    id: UUID
+    firm_id: UUID
+    is_active: bool
+    is_superuser: bool
+    token_version: int = 0
+
+    @classmethod
+    def from_claims(cls, payload: Dict[str, Any]) -> "Principal | None":
+        """Build a principal from access token claims (None for tokens without tenant claims)"""
+        try:
+            return cls(
+                id=UUID(payload["sub"]),
+                firm_id=UUID(payload["fid"]),
+                is_active=True,
+                is_superuser=payload.get("role") == ROLE_ADMIN,
+                token_version=int(payload.get("ver", 0)),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def to_json(self) -> str:
+        return json.dumps({k: str(v) if isinstance(v, UUID) else v for k, v in asdict(self).items()})
+
+    @classmethod
+    def from_json(cls, raw: str | bytes) -> "Principal":
+        data = json.loads(raw)
+        return cls(
+            id=UUID(data["id"]),
+            firm_id=UUID(data["firm_id"]),
+            is_active=data["is_active"],
+            is_superuser=data["is_superuser"],
+            token_version=data.get("token_version", 0),
+        )
+
+
+class PrincipalCache(TwoTierCache[Principal]):
+    """
+    Two-tier cache of authenticated principals keyed by user id
+
+    The in-process tier is a TTL LRU checked first. The optional Redis tier is
+    shared between workers and survives restarts.
+    """
+
+    REDIS_PREFIX = "principal:"
+    NAME = "Principal cache"
+
+    def encode(self, value: Principal) -> str:
+        return value.to_json()
+
+    def decode(self, raw: bytes) -> Principal:
+        return Principal.from_json(raw)
+
+
+# Global instance
+principal_cache = PrincipalCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    redis_enabled=settings.PRINCIPAL_CACHE_REDIS_ENABLED,
+    redis_ttl=settings.PRINCIPAL_CACHE_REDIS_TTL_SECONDS,
+)
+
+
+# Changing any of these makes previously issued token claims stale
+_TOKEN_CLAIM_ATTRS = ("firm_id", "is_superuser", "is_active")
+
+
+@event.listens_for(User, "before_update")
+def _bump_token_version(mapper: Any, connection: Any, target: User) -> None:
+    state = inspect(target)
+    if any(state.attrs[attr].history.has_changes() for attr in _TOKEN_CLAIM_ATTRS):
+        target.token_version = (target.token_version or 0) + 1
+
+
+# Dropped after any committed change to the user row
+principal_cache.invalidate_on_commit(User)
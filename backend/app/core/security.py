@@ -16,14 +16,37 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 
 
-def create_access_token(subject: str | Any, expires_delta: timedelta | None = None) -> str:
-    """Create JWT access token"""
+ROLE_ADMIN = "admin"
+ROLE_STAFF = "staff"
+
+
+def create_access_token(
+    subject: str | Any,
+    expires_delta: timedelta | None = None,
+    firm_id: str | Any | None = None,
+    is_superuser: bool = False,
+    token_version: int = 0,
+) -> str:
+    """
+    Create JWT access token
+
+    Besides the subject, the token carries the tenant (fid), role and token
+    version (ver) so requests can be authorized without loading the user row.
+    """
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
 
-    to_encode = {"exp": expire, "sub": str(subject)}
+    to_encode = {
+        "exp": expire,
+        "sub": str(subject),
+        "role": ROLE_ADMIN if is_superuser else ROLE_STAFF,
+        "ver": token_version,
+    }
+    if firm_id is not None:
+        to_encode["fid"] = str(firm_id)
+
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -0,0 +1,73 @@
+import json
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable
+
+from fastapi import HTTPException, status
+
+# Response headers for event streams: no caching, and stop nginx buffering them
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+
+# Comment line sent while a stream is idle so proxies don't close it
+HEARTBEAT = b": heartbeat\n\n"
+
+
+def sse_event(event: str, data: Dict[str, Any]) -> bytes:
+    """Encode one Server-Sent Event with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+def sse_retry(seconds: float) -> bytes:
+    """Tell EventSource how long to wait before reconnecting"""
+    return f"retry: {int(seconds * 1000)}\n\n".encode()
+
+
+class StreamSlots:
+    """
+    Open stream caps, per process and per key (submission, firm, ...)
+
+    reserve() counts the stream before anything is awaited, so a burst of
+    connects can't all pass the check and overshoot the caps. It returns an
+    idempotent release callable: call it from the stream generator's
+    finally and also as the response's background task, because a body
+    generator that never starts (client gone before the first chunk) never
+    runs its finally.
+    """
+
+    def __init__(self, max_total: int, max_per_key: int, detail: str = "Too many open streams"):
+        self.max_total = max_total
+        self.max_per_key = max_per_key
+        self.detail = detail
+        self._open: Counter = Counter()
+        self.total = 0
+
+    def reserve(self, key: Hashable) -> Callable[[], None]:
+        """Take a slot for `key` or raise 429; returns the release callable"""
+        if self.total >= self.max_total or self._open[key] >= self.max_per_key:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=self.detail,
+                headers={"Retry-After": "30"}
+            )
+
+        self._open[key] += 1
+        self.total += 1
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+            self.total -= 1
+            self._open[key] -= 1
+            if self._open[key] <= 0:
+                del self._open[key]
+
+        return release
+
+    def keys(self) -> int:
+        """Number of keys with an open stream"""
+        return len(self._open)
@@ -0,0 +1,175 @@
+import hashlib
+from typing import AsyncIterator, List
+
+import multipart
+from fastapi import HTTPException, Request, status
+from multipart.exceptions import MultipartParseError
+from multipart.multipart import parse_options_header
+
+# Slack for the multipart envelope (boundaries, part headers, small fields)
+# when rejecting on Content-Length before reading the body
+MULTIPART_OVERHEAD = 64 * 1024
+
+# OpenAPI request body for endpoints that read a StreamedFile instead of
+# declaring an UploadFile parameter
+UPLOAD_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                    "required": ["file"],
+                }
+            }
+        },
+    }
+}
+
+
+class StreamedFile:
+    """
+    The file part of a multipart/form-data request, read as it arrives
+
+    UploadFile only reaches the endpoint after Starlette has spooled the whole
+    body, so size limits are checked after the fact. This parses the request
+    stream directly: chunks() yields the file's bytes as they come off the
+    socket, counting and hashing them, and raises 413 as soon as the count
+    passes max_size. A declared Content-Length over the limit is rejected
+    before anything is read. Other parts of the body are ignored.
+    """
+
+    def __init__(self, request: Request, max_size: int, field_name: str = "file"):
+        self.request = request
+        self.max_size = max_size
+        self.field_name = field_name
+
+        self.filename: str | None = None
+        self.content_type: str | None = None
+        self.size = 0
+        self._sha256 = hashlib.sha256()
+
+        # Parser state (callbacks fire synchronously inside parser.write)
+        self._stream = request.stream()
+        self._parser = None
+        self._header_name = b""
+        self._header_value = b""
+        self._part_headers: dict[bytes, bytes] = {}
+        self._in_file = False
+        self._file_done = False
+        self._pending: List[bytes] = []
+
+    @property
+    def sha256(self) -> str:
+        """Hex SHA-256 of the bytes yielded so far"""
+        return self._sha256.hexdigest()
+
+    def _too_large(self) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"File size exceeds {self.max_size // (1024 * 1024)}MB limit"
+        )
+
+    async def open(self) -> None:
+        """Check the request and read up to the start of the file's data"""
+        content_type, params = parse_options_header(self.request.headers.get("content-type", ""))
+        if content_type != b"multipart/form-data" or b"boundary" not in params:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Expected a multipart/form-data upload"
+            )
+
+        content_length = self.request.headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_size + MULTIPART_OVERHEAD:
+            raise self._too_large()
+
+        self._parser = multipart.MultipartParser(params[b"boundary"], {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        })
+
+        while self.filename is None:
+            if not await self._feed():
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"No '{self.field_name}' file in upload"
+                )
+
+    async def chunks(self) -> AsyncIterator[bytes]:
+        """Yield the file's bytes, enforcing max_size as they arrive"""
+        while True:
+            pending, self._pending = self._pending, []
+            for data in pending:
+                self.size += len(data)
+                if self.size > self.max_size:
+                    raise self._too_large()
+                self._sha256.update(data)
+                yield data
+
+            if self._file_done:
+                return
+            if not await self._feed():
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Upload ended before the file was complete"
+                )
+
+    async def _feed(self) -> bool:
+        """Parse the next chunk of the body; False once it's exhausted"""
+        try:
+            chunk = await self._stream.__anext__()
+        except StopAsyncIteration:
+            return False
+
+        try:
+            if chunk:
+                self._parser.write(chunk)
+            else:
+                self._parser.finalize()
+        except MultipartParseError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Malformed multipart body"
+            )
+        return True
+
+    def _on_part_begin(self) -> None:
+        self._part_headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._part_headers[self._header_name.lower()] = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        if self.filename is not None:
+            return
+        _, options = parse_options_header(self._part_headers.get(b"content-disposition", b""))
+        if options.get(b"name", b"").decode("latin-1") != self.field_name or b"filename" not in options:
+            return
+
+        self.filename = options[b"filename"].decode("utf-8", errors="replace")
+        content_type = self._part_headers.get(b"content-type")
+        self.content_type = content_type.decode("latin-1") if content_type else None
+        self._in_file = True
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._in_file:
+            self._pending.append(data[start:end])
+
+    def _on_part_end(self) -> None:
+        if self._in_file:
+            self._in_file = False
+            self._file_done = True
@@ -1,6 +1,8 @@
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.core.config import settings
+from app.db.notify import FIRM_CHANGE_TRIGGERS
 
 # Create async engine
 engine = create_async_engine(
@@ -23,6 +25,19 @@ AsyncSessionLocal = async_sessionmaker(
 Base = declarative_base()
 
 
+@event.listens_for(Base.metadata, "before_create")
+def _create_extensions(target, connection, **kw) -> None:
+    """Extensions the models' indexes depend on (trigram search indexes)"""
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_triggers(target, connection, **kw) -> None:
+    """NOTIFY triggers feeding the live dashboard stream"""
+    for statement in FIRM_CHANGE_TRIGGERS:
+        connection.execute(text(statement))
+
+
 async def get_db() -> AsyncSession:
     """Dependency to get database session"""
     async with AsyncSessionLocal() as session:
@@ -0,0 +1,63 @@
+"""
+Postgres NOTIFY triggers behind the live firm dashboard feed
+
+Inserts and status changes on intake_submissions and clients send a
+notification on FIRM_CHANGES_CHANNEL once their transaction commits. The
+payload carries the firm id and the row's list-view columns (well under
+NOTIFY's 8000 byte limit), so listeners can forward it as a delta without
+querying. Form data and intake answers are deliberately left out.
+
+The migration keeps its own copy of this DDL; this one is run by
+create_all (tests, local setups).
+"""
+
+FIRM_CHANGES_CHANNEL = "firm_changes"
+
+
+def _notify_function(name: str, row_columns: list[str]) -> str:
+    row = ", ".join(f"'{column}', NEW.{column}" for column in row_columns)
+    return f"""
+    CREATE OR REPLACE FUNCTION {name}() RETURNS trigger AS $$
+    BEGIN
+        PERFORM pg_notify('{FIRM_CHANGES_CHANNEL}', json_build_object(
+            'table', TG_TABLE_NAME,
+            'op', lower(TG_OP),
+            'firm_id', NEW.firm_id,
+            'row', json_build_object({row})
+        )::text);
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """
+
+
+def _triggers(table: str, function: str, watched_columns: list[str]) -> list[str]:
+    changed = " OR ".join(f"OLD.{column} IS DISTINCT FROM NEW.{column}" for column in watched_columns)
+    return [
+        f"""
+        CREATE OR REPLACE TRIGGER {table}_notify_insert AFTER INSERT ON {table}
+        FOR EACH ROW EXECUTE FUNCTION {function}()
+        """,
+        # Only changes a dashboard shows (not e.g. updated_at bumps from upserts)
+        f"""
+        CREATE OR REPLACE TRIGGER {table}_notify_update AFTER UPDATE ON {table}
+        FOR EACH ROW WHEN ({changed}) EXECUTE FUNCTION {function}()
+        """,
+    ]
+
+
+SUBMISSION_STATUS_COLUMNS = ["status", "signature_status", "payment_status"]
+CLIENT_LIST_COLUMNS = ["email", "first_name", "last_name", "phone", "status"]
+
+# Each statement runs separately (asyncpg can't prepare several at once)
+FIRM_CHANGE_TRIGGERS = [
+    _notify_function("notify_intake_submission_change", [
+        "id", "form_id", "client_id", *SUBMISSION_STATUS_COLUMNS,
+        "payment_amount", "signed_at", "paid_at", "created_at", "updated_at",
+    ]),
+    *_triggers("intake_submissions", "notify_intake_submission_change", SUBMISSION_STATUS_COLUMNS),
+    _notify_function("notify_client_change", [
+        "id", *CLIENT_LIST_COLUMNS, "created_at", "updated_at",
+    ]),
+    *_triggers("clients", "notify_client_change", CLIENT_LIST_COLUMNS),
+]
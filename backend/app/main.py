@@ -1,7 +1,33 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from app.core.config import settings
+from app.core.serialization import FastJSONResponse
+from app.core.compression import CompressionMiddleware
+from app.core.idempotency import IdempotencyMiddleware
+from app.core.instrumentation import QueryStatsMiddleware
 from app.api.v1.router import api_router
+from app.core.principal import principal_cache
+from app.core.redis import close_redis
+from app.services.firm_feed import firm_change_feed
+from app.services.form_cache import public_form_cache
+from app.services.submission_events import submission_event_streams
+from app.services.password_service import password_service
+from app.services.s3_service import s3_storage
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Application startup/shutdown hooks"""
+    await firm_change_feed.start()
+    yield
+    await firm_change_feed.stop()
+    password_service.shutdown()
+    s3_storage.shutdown()
+    await close_redis()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -10,9 +36,21 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
+)
+
+# Replay stored responses for retried public writes (Idempotency-Key header)
+app.add_middleware(
+    IdempotencyMiddleware,
+    paths=[
+        r"^/api/v1/intake/public/forms/[^/]+/submit$",
+        r"^/api/v1/intake/public/submissions/[^/]+/checkout$",
+        r"^/api/v1/signatures/public/(sign|pay)/[^/]+$",
+    ],
 )
 
-# CORS middleware
+# CORS middleware (added after so it wraps replayed responses too)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
@@ -21,14 +59,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# gzip/br compression (outside idempotency so stored replays stay uncompressed)
+app.add_middleware(CompressionMiddleware)
+
+# Per-request SQL stats (Server-Timing header + Prometheus)
+app.add_middleware(QueryStatsMiddleware)
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
 
 @app.get("/health")
-async def health_check() -> dict[str, str]:
+async def health_check() -> dict[str, Any]:
     """Health check endpoint"""
-    return {"status": "healthy"}
+    return {
+        "status": "healthy",
+        "password_hashing": password_service.stats(),
+        "s3": s3_storage.stats(),
+        "principal_cache": principal_cache.stats(),
+        "public_form_cache": public_form_cache.stats(),
+        "submission_streams": submission_event_streams.stats(),
+        "firm_feed": firm_change_feed.stats(),
+    }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus metrics"""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
 
 @app.get("/")
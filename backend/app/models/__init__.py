@@ -4,5 +4,6 @@ from app.models.firm import Firm
 from app.models.client import Client
 from app.models.intake import IntakeForm, IntakeSubmission
 from app.models.document import Document
+from app.models.firm_counter import FirmCounter
 
-__all__ = ["User", "Firm", "Client", "IntakeForm", "IntakeSubmission", "Document"]
+__all__ = ["User", "Firm", "Client", "IntakeForm", "IntakeSubmission", "Document", "FirmCounter"]
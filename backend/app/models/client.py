@@ -1,15 +1,35 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Text, Computed
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 import uuid
 from app.db.base import Base
 
+# Text searched by /clients/search (kept in sync by Postgres as generated columns)
+CLIENT_SEARCH_TEXT = (
+    "lower(first_name || ' ' || last_name || ' ' || email || ' ' || coalesce(phone, ''))"
+)
+
 
 class Client(Base):
     """Client model - represents potential/actual clients"""
 
     __tablename__ = "clients"
+    __table_args__ = (
+        Index("ix_clients_firm_id_created_at_id", "firm_id", "created_at", "id"),
+        Index("ix_clients_firm_id_status_created_at_id", "firm_id", "status", "created_at", "id"),
+        # Public submissions upsert on this (INSERT ... ON CONFLICT (firm_id, email))
+        Index("uq_clients_firm_id_email", "firm_id", "email", unique=True),
+        Index(
+            "ix_clients_intake_data", "intake_data",
+            postgresql_using="gin", postgresql_ops={"intake_data": "jsonb_path_ops"}
+        ),
+        Index("ix_clients_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_clients_search_text_trgm", "search_text",
+            postgresql_using="gin", postgresql_ops={"search_text": "gin_trgm_ops"}
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     firm_id = Column(UUID(as_uuid=True), ForeignKey("firms.id"), nullable=False)
@@ -21,11 +41,17 @@ class Client(Base):
     phone = Column(String)
 
     # Additional data collected during intake
-    intake_data = Column(JSON)
+    intake_data = Column(JSONB)
 
     # Status tracking
     status = Column(String, default="pending")  # pending, signed, paid, active, rejected
 
+    # Search (deferred so normal loads don't fetch them)
+    search_text = deferred(Column(Text, Computed(CLIENT_SEARCH_TEXT, persisted=True)))
+    search_vector = deferred(Column(
+        TSVECTOR, Computed(f"to_tsvector('simple', {CLIENT_SEARCH_TEXT})", persisted=True)
+    ))
+
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
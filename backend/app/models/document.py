@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey, Integer
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -10,15 +10,21 @@ class Document(Base):
     """Stored documents (signed retainers, attachments, etc.)"""
 
     __tablename__ = "documents"
+    __table_args__ = (
+        Index("ix_documents_submission_id_document_type", "submission_id", "document_type"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     submission_id = Column(UUID(as_uuid=True), ForeignKey("intake_submissions.id"), nullable=False)
+    # Denormalized from the submission so tenant checks don't need a join
+    firm_id = Column(UUID(as_uuid=True), ForeignKey("firms.id"), nullable=False, index=True)
 
     # Document metadata
     filename = Column(String, nullable=False)
     document_type = Column(String, nullable=False)  # retainer, attachment, id_proof, etc.
     mime_type = Column(String)
     file_size = Column(Integer)
+    checksum_sha256 = Column(String(64))  # Hex digest, computed while uploading
 
     # Storage location
     s3_key = Column(String, nullable=False)
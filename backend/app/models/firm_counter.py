@@ -0,0 +1,24 @@
+from sqlalchemy import Column, String, BigInteger, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from app.db.base import Base
+
+# Counter entities
+COUNTER_CLIENTS = "clients"
+COUNTER_SUBMISSIONS = "submissions"
+
+
+class FirmCounter(Base):
+    """
+    Per-firm row counts by status
+
+    Maintained by database triggers on clients and intake_submissions in the
+    same transaction as the write (see the firm_counters migration), and
+    reconciled periodically by the reconcile_firm_counters task.
+    """
+
+    __tablename__ = "firm_counters"
+
+    firm_id = Column(UUID(as_uuid=True), ForeignKey("firms.id"), primary_key=True)
+    entity = Column(String, primary_key=True)  # clients, submissions
+    status = Column(String, primary_key=True)  # '' when the row has no status
+    count = Column(BigInteger, nullable=False, default=0)
@@ -1,10 +1,18 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, JSON, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Index, Computed
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 import uuid
 from app.db.base import Base
 
+# form_data keys searched by /intake/submissions/search
+SUBMISSION_SEARCH_KEYS = (
+    "first_name", "firstName", "last_name", "lastName", "email", "phone", "case_type",
+)
+SUBMISSION_SEARCH_TEXT = "lower({})".format(
+    " || ' ' || ".join(f"coalesce(form_data->>'{key}', '')" for key in SUBMISSION_SEARCH_KEYS)
+)
+
 
 class IntakeForm(Base):
     """Intake form template created by law firms"""
@@ -12,13 +20,13 @@ class IntakeForm(Base):
     __tablename__ = "intake_forms"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    firm_id = Column(UUID(as_uuid=True), ForeignKey("firms.id"), nullable=False)
+    firm_id = Column(UUID(as_uuid=True), ForeignKey("firms.id"), nullable=False, index=True)
 
     name = Column(String, nullable=False)
     description = Column(Text)
 
     # Form configuration (JSON schema for fields)
-    fields_schema = Column(JSON, nullable=False)
+    fields_schema = Column(JSONB, nullable=False)
 
     # Retainer agreement template
     retainer_template_url = Column(String)  # S3 URL
@@ -42,21 +50,36 @@ class IntakeSubmission(Base):
     """Client submission of an intake form"""
 
     __tablename__ = "intake_submissions"
+    __table_args__ = (
+        Index("ix_intake_submissions_firm_id_created_at_id", "firm_id", "created_at", "id"),
+        Index(
+            "ix_intake_submissions_form_data", "form_data",
+            postgresql_using="gin", postgresql_ops={"form_data": "jsonb_path_ops"}
+        ),
+        Index("ix_intake_submissions_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_intake_submissions_search_text_trgm", "search_text",
+            postgresql_using="gin", postgresql_ops={"search_text": "gin_trgm_ops"}
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    form_id = Column(UUID(as_uuid=True), ForeignKey("intake_forms.id"), nullable=False)
+    form_id = Column(UUID(as_uuid=True), ForeignKey("intake_forms.id"), nullable=False, index=True)
+    # Denormalized from the form so tenant checks don't need a join
+    firm_id = Column(UUID(as_uuid=True), ForeignKey("firms.id"), nullable=False)
     client_id = Column(UUID(as_uuid=True), ForeignKey("clients.id"), nullable=False)
 
     # Submitted form data
-    form_data = Column(JSON, nullable=False)
+    form_data = Column(JSONB, nullable=False)
 
     # E-signature tracking
-    docusign_envelope_id = Column(String)
+    docusign_envelope_id = Column(String, index=True)
     signature_status = Column(String, default="pending")  # pending, sent, signed, declined
     signed_at = Column(DateTime(timezone=True))
 
     # Payment tracking
-    stripe_payment_intent_id = Column(String)
+    stripe_payment_intent_id = Column(String)  # Checkout session id
+    payment_url = Column(String)  # Checkout session URL (created lazily, see checkout_service)
     payment_status = Column(String, default="pending")  # pending, succeeded, failed
     payment_amount = Column(String)
     paid_at = Column(DateTime(timezone=True))
@@ -64,6 +87,12 @@ class IntakeSubmission(Base):
     # Overall status
     status = Column(String, default="submitted")  # submitted, processing, completed, rejected
 
+    # Search (deferred so normal loads don't fetch them)
+    search_text = deferred(Column(Text, Computed(SUBMISSION_SEARCH_TEXT, persisted=True)))
+    search_vector = deferred(Column(
+        TSVECTOR, Computed(f"to_tsvector('simple', {SUBMISSION_SEARCH_TEXT})", persisted=True)
+    ))
+
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Integer
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -18,6 +18,9 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
 
+    # Bumped to revoke every token issued before the change
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
+
     # Multi-tenancy
     firm_id = Column(UUID(as_uuid=True), ForeignKey("firms.id"), nullable=False)
 
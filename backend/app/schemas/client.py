@@ -42,4 +42,5 @@ class ClientResponse(ClientBase):
 class ClientList(BaseModel):
     """List of clients"""
     items: list[ClientResponse]
-    total: int
+    total: int | None = None  # Only set when include_total is requested
+    next_cursor: str | None = None  # Pass as ?cursor= to get the next page
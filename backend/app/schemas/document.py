@@ -24,6 +24,7 @@ class DocumentResponse(DocumentBase):
     id: UUID
     submission_id: UUID
     file_size: int
+    checksum_sha256: Optional[str] = None
     s3_key: str
     s3_bucket: str
     created_at: datetime
@@ -3,6 +3,9 @@ from uuid import UUID
 from datetime import datetime
 from typing import Any
 
+from app.schemas.client import ClientResponse
+from app.schemas.document import DocumentResponse
+
 
 class IntakeFormBase(BaseModel):
     """Base intake form schema"""
@@ -80,4 +83,14 @@ class IntakeSubmissionResponse(IntakeSubmissionBase):
 class IntakeSubmissionList(BaseModel):
     """List of intake submissions"""
     items: list[IntakeSubmissionResponse]
-    total: int
+    total: int | None = None  # Only set when include_total is requested
+    next_cursor: str | None = None  # Pass as ?cursor= to get the next page
+
+
+class IntakeSubmissionDetail(IntakeSubmissionResponse):
+    """Submission with its form, client and documents (dashboard detail view)"""
+    updated_at: datetime | None
+    docusign_envelope_id: str | None
+    form: IntakeFormResponse
+    client: ClientResponse
+    documents: list[DocumentResponse]
@@ -0,0 +1,74 @@
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.base import AsyncSessionLocal
+from app.models.intake import IntakeSubmission
+from app.services.stripe_service import create_checkout_session
+
+
+def needs_checkout(submission: IntakeSubmission) -> bool:
+    """Whether the submission still needs a (new) Stripe checkout session"""
+    return bool(submission.payment_amount) and submission.payment_status in ("pending", "expired")
+
+
+async def ensure_checkout_session(db: AsyncSession, submission: IntakeSubmission) -> str | None:
+    """
+    Get the submission's checkout URL, creating the Stripe session if needed
+
+    Safe to call concurrently (e.g. the post-submit prefetch racing the
+    client reaching the payment step): the Stripe idempotency key is derived
+    from the submission and its previous session, so both get one session.
+
+    Returns:
+        The checkout URL, or None if the submission has nothing to pay
+    """
+    if not needs_checkout(submission):
+        return None
+
+    if submission.payment_url and submission.payment_status == "pending":
+        return submission.payment_url
+
+    frontend_url = settings.CORS_ORIGINS[0]
+    previous_session = submission.stripe_payment_intent_id or "first"
+
+    checkout_session = await create_checkout_session(
+        amount=float(submission.payment_amount),
+        success_url=f"{frontend_url}/payment/success?submission_id={submission.id}",
+        cancel_url=f"{frontend_url}/payment/cancelled?submission_id={submission.id}",
+        metadata={
+            'submission_id': str(submission.id),
+            'form_id': str(submission.form_id),
+            'client_id': str(submission.client_id),
+        },
+        idempotency_key=f"checkout-{submission.id}-{previous_session}",
+    )
+
+    submission.stripe_payment_intent_id = checkout_session['id']
+    submission.payment_url = checkout_session['url']
+    submission.payment_status = "pending"
+    await db.commit()
+
+    return submission.payment_url
+
+
+async def prefetch_checkout_session(submission_id: UUID) -> None:
+    """
+    Background task: create the checkout session after the submit response
+
+    Runs with its own DB session since the request's session is closed by
+    then. Failures are only logged - the client-facing checkout endpoint
+    creates the session on demand if the prefetch didn't.
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(IntakeSubmission).where(IntakeSubmission.id == submission_id)
+            )
+            submission = result.scalar_one_or_none()
+            if submission:
+                await ensure_checkout_session(db, submission)
+    except Exception as e:
+        print(f"Error prefetching payment session for {submission_id}: {e}")
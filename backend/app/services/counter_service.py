@@ -0,0 +1,104 @@
+from uuid import UUID
+from sqlalchemy import select, func, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.firm_counter import FirmCounter
+
+
+async def get_firm_count(
+    db: AsyncSession,
+    firm_id: UUID,
+    entity: str,
+    status: str | None = None
+) -> int:
+    """
+    Read a firm's maintained row count
+
+    Args:
+        db: Database session
+        firm_id: Firm to count for
+        entity: Counter entity (COUNTER_CLIENTS or COUNTER_SUBMISSIONS)
+        status: Only count rows with this status (default: all statuses)
+
+    Returns:
+        Number of rows
+    """
+    query = select(func.coalesce(func.sum(FirmCounter.count), 0)).where(
+        FirmCounter.firm_id == firm_id,
+        FirmCounter.entity == entity
+    )
+    if status is not None:
+        query = query.where(FirmCounter.status == status)
+
+    result = await db.execute(query)
+    return int(result.scalar())
+
+
+# Advisory lock class for per-firm counter writes. firm_counters_track takes
+# (class, hashtext(firm_id)) shared on every write; reconcile takes it
+# exclusively, so a firm's counts can't change between counting and writing
+COUNTER_LOCK_CLASS = 7001
+
+FIRM_IDS_SQL = text("SELECT id FROM firms ORDER BY id")
+
+LOCK_FIRM_SQL = text("SELECT pg_advisory_xact_lock(:lock_class, hashtext(CAST(CAST(:firm_id AS uuid) AS text)))")
+
+# Recompute one firm's counters from the source tables and fix the ones that
+# drifted. Run after LOCK_FIRM_SQL in the same transaction: the statement
+# snapshot is then taken with no counter writes for the firm in flight
+RECONCILE_FIRM_SQL = text("""
+    WITH actual AS (
+        SELECT firm_id, 'clients' AS entity, COALESCE(status, '') AS status, count(*) AS count
+        FROM clients
+        WHERE firm_id = :firm_id
+        GROUP BY firm_id, COALESCE(status, '')
+        UNION ALL
+        SELECT firm_id, 'submissions', COALESCE(status, ''), count(*)
+        FROM intake_submissions
+        WHERE firm_id = :firm_id
+        GROUP BY firm_id, COALESCE(status, '')
+    ),
+    corrected AS (
+        INSERT INTO firm_counters (firm_id, entity, status, count)
+        SELECT firm_id, entity, status, count FROM actual
+        ON CONFLICT (firm_id, entity, status)
+        DO UPDATE SET count = EXCLUDED.count
+        WHERE firm_counters.count <> EXCLUDED.count
+        RETURNING 1
+    ),
+    emptied AS (
+        UPDATE firm_counters c
+        SET count = 0
+        WHERE c.firm_id = :firm_id
+          AND c.count <> 0
+          AND NOT EXISTS (
+              SELECT 1 FROM actual a
+              WHERE a.firm_id = c.firm_id AND a.entity = c.entity AND a.status = c.status
+          )
+        RETURNING 1
+    )
+    SELECT (SELECT count(*) FROM corrected) + (SELECT count(*) FROM emptied)
+""")
+
+
+async def reconcile_firm_counters(db: AsyncSession) -> int:
+    """
+    Repair counter drift (e.g. from writes made while triggers were disabled)
+
+    Firms are reconciled one per transaction, each under the firm's counter
+    lock, so only that firm's writes wait and only for its recount.
+
+    Returns:
+        Number of counter rows that were corrected
+    """
+    result = await db.execute(FIRM_IDS_SQL)
+    firm_ids = result.scalars().all()
+    await db.commit()
+
+    corrected = 0
+    for firm_id in firm_ids:
+        await db.execute(LOCK_FIRM_SQL, {"lock_class": COUNTER_LOCK_CLASS, "firm_id": firm_id})
+        result = await db.execute(RECONCILE_FIRM_SQL, {"firm_id": firm_id})
+        corrected += int(result.scalar())
+        await db.commit()
+    return corrected
@@ -0,0 +1,183 @@
+import asyncio
+import json
+from collections import defaultdict
+from typing import Any, AsyncIterator, Callable, Dict, Set
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+from app.core.sse import HEARTBEAT, StreamSlots, sse_event, sse_retry
+from app.db.notify import FIRM_CHANGES_CHANNEL
+
+# Queued for a subscriber that may have missed changes (slow client, listener
+# reconnect); the dashboard refetches its list when it sees this
+RESYNC: Dict[str, Any] = {}
+
+# How often an idle LISTEN connection is checked for silent drops
+KEEPALIVE_SECONDS = 60
+
+
+def _listen_dsn() -> str:
+    """DATABASE_URL for plain asyncpg (without SQLAlchemy's +asyncpg driver suffix)"""
+    return make_url(settings.DATABASE_URL).set(drivername="postgresql").render_as_string(
+        hide_password=False
+    )
+
+
+class FirmChangeFeed:
+    """
+    Live dashboard feed: Postgres NOTIFY fanned out to per-firm SSE streams
+
+    Each API process keeps one dedicated LISTEN connection (outside the
+    SQLAlchemy pool) on FIRM_CHANGES_CHANNEL, fed by triggers on
+    intake_submissions and clients (see app/db/notify.py). Notifications are
+    routed in memory to the streams of the firm they belong to, so any
+    number of open dashboards costs one database connection per process
+    instead of a list query each every few seconds.
+
+    Subscribers get bounded queues; one that falls behind has its backlog
+    replaced by a resync event rather than blocking the others.
+    """
+
+    def __init__(self, max_connections: int, max_per_firm: int, queue_size: int):
+        self.slots = StreamSlots(max_connections, max_per_firm, detail="Too many open dashboard streams")
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._task: asyncio.Task | None = None
+        self._connected = False
+        self._received = 0
+        self._resyncs = 0
+
+    async def start(self) -> None:
+        """Start the background LISTEN loop (idempotent)"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop listening and close the connection"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _listen(self) -> None:
+        """Hold the LISTEN connection, reconnecting with backoff when it drops"""
+        backoff = 1
+        while True:
+            try:
+                connection = await asyncpg.connect(_listen_dsn())
+            except (OSError, asyncpg.PostgresError) as e:
+                print(f"Firm feed can't connect to LISTEN ({e}), retrying in {backoff}s")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 30)
+                continue
+
+            lost = asyncio.Event()
+            connection.add_termination_listener(lambda _: lost.set())
+            try:
+                await connection.add_listener(FIRM_CHANGES_CHANNEL, self._on_notify)
+                self._connected = True
+                backoff = 1
+                # Anything committed while we weren't listening was missed
+                self._broadcast(RESYNC)
+
+                while not lost.is_set():
+                    try:
+                        await asyncio.wait_for(lost.wait(), timeout=KEEPALIVE_SECONDS)
+                    except asyncio.TimeoutError:
+                        await connection.execute("SELECT 1")
+            except (OSError, asyncpg.PostgresError) as e:
+                print(f"Firm feed LISTEN connection failed: {e}")
+            finally:
+                self._connected = False
+                if not connection.is_closed():
+                    connection.terminate()
+
+            print("Firm feed LISTEN connection lost, reconnecting")
+
+    def _on_notify(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        try:
+            change = json.loads(payload)
+            firm_id = change.pop("firm_id")
+        except (ValueError, KeyError):
+            print(f"Firm feed ignored malformed notification: {payload[:200]}")
+            return
+
+        self._received += 1
+        for queue in self._subscribers.get(firm_id, ()):
+            self._offer(queue, change)
+
+    def _offer(self, queue: asyncio.Queue, change: Dict[str, Any]) -> None:
+        try:
+            queue.put_nowait(change)
+        except asyncio.QueueFull:
+            # Drop the backlog; the client refetches instead of replaying it
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(RESYNC)
+            self._resyncs += 1
+
+    def _broadcast(self, change: Dict[str, Any]) -> None:
+        for queues in self._subscribers.values():
+            for queue in queues:
+                self._offer(queue, change)
+
+    def reserve(self, firm_id: UUID) -> Callable[[], None]:
+        """Take a stream slot or raise 429; returns the (idempotent) release callable"""
+        return self.slots.reserve(str(firm_id))
+
+    async def stream(self, firm_id: UUID, release: Callable[[], None]) -> AsyncIterator[bytes]:
+        """
+        SSE body for one dashboard: `change` events ({table, op, row}), plus
+        `resync` when the client should refetch, with heartbeats while idle
+
+        The slot comes from reserve() and is released when the stream ends.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.SSE_MAX_STREAM_SECONDS
+
+        key = str(firm_id)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers[key].add(queue)
+        try:
+            yield sse_retry(settings.SSE_HEARTBEAT_SECONDS)
+
+            while loop.time() < deadline:
+                try:
+                    change = await asyncio.wait_for(queue.get(), timeout=settings.SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield HEARTBEAT
+                    continue
+
+                if change is RESYNC:
+                    yield sse_event("resync", {})
+                else:
+                    yield sse_event("change", change)
+        finally:
+            self._subscribers[key].discard(queue)
+            if not self._subscribers[key]:
+                del self._subscribers[key]
+            release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Listener state and stream counts"""
+        return {
+            "listening": self._connected,
+            "open_streams": self.slots.total,
+            "firms": self.slots.keys(),
+            "notifications": self._received,
+            "resyncs": self._resyncs,
+        }
+
+
+# Global instance
+firm_change_feed = FirmChangeFeed(
+    max_connections=settings.SSE_MAX_CONNECTIONS,
+    max_per_firm=settings.FIRM_FEED_MAX_CONNECTIONS_PER_FIRM,
+    queue_size=settings.FIRM_FEED_QUEUE_SIZE,
+)
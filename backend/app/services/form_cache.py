@@ -0,0 +1,48 @@
+from typing import Dict, Tuple
+from uuid import UUID
+
+from app.core.cache import TwoTierCache
+from app.core.compression import precompress
+from app.core.conditional import etag_for
+from app.core.config import settings
+from app.models.intake import IntakeForm
+
+# (JSON body, ETag, {content coding: precompressed body})
+CachedForm = Tuple[bytes, str, Dict[str, bytes]]
+
+
+class PublicFormCache(TwoTierCache[CachedForm]):
+    """
+    Two-tier cache of serialized public intake form payloads
+
+    Entries hold the exact JSON body served by GET /intake/public/forms/{id},
+    its ETag and its gzip/br variants (compressed once when the local tier
+    is filled), so a hit skips the database, serialization and compression.
+    Redis only keeps the plain body.
+    """
+
+    REDIS_PREFIX = "public_form:"
+    NAME = "Public form cache"
+
+    def encode(self, value: CachedForm) -> bytes:
+        return value[0]
+
+    def decode(self, raw: bytes) -> CachedForm:
+        return (raw, etag_for(raw), precompress(raw))
+
+    async def store(self, form_id: UUID, body: bytes) -> CachedForm:
+        """Cache a serialized form and return its entry"""
+        entry = self.decode(body)
+        await self.set(form_id, entry)
+        return entry
+
+
+# Global instance
+public_form_cache = PublicFormCache(
+    max_size=settings.PUBLIC_FORM_CACHE_MAX_SIZE,
+    ttl=settings.PUBLIC_FORM_CACHE_TTL_SECONDS,
+    redis_ttl=settings.PUBLIC_FORM_CACHE_REDIS_TTL_SECONDS,
+)
+
+# Dropped after update_intake_form, delete_intake_form or any other writer commits
+public_form_cache.invalidate_on_commit(IntakeForm)
@@ -0,0 +1,183 @@
+import math
+import re
+from datetime import date
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+# A check returns an error message, or None if the value is fine
+Check = Callable[[Any], str | None]
+Validator = Callable[[Dict[str, Any]], Dict[str, str]]
+
+_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_PHONE = re.compile(r"^\+?[\d\s().-]{7,20}$")
+
+# What compile_schema raises for a malformed schema (bad pattern, non-dict properties, ...)
+SCHEMA_ERRORS = (re.error, TypeError, ValueError, AttributeError)
+
+# Field types the form builder produces, by the kind of value they hold
+_TEXT_TYPES = {"string", "text", "textarea"}
+_NUMBER_TYPES = {"number", "integer"}
+
+
+def _is_number(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    # Browsers submit <input type="number"> values as strings; "nan"/"inf" parse but aren't numbers
+    try:
+        return math.isfinite(float(value))
+    except (TypeError, ValueError, OverflowError):
+        return False
+
+
+def _check_email(value: Any) -> str | None:
+    return None if isinstance(value, str) and _EMAIL.match(value) else "must be a valid email address"
+
+
+def _check_phone(value: Any) -> str | None:
+    return None if isinstance(value, str) and _PHONE.match(value) else "must be a valid phone number"
+
+
+def _check_date(value: Any) -> str | None:
+    try:
+        date.fromisoformat(value)
+        return None
+    except (TypeError, ValueError):
+        return "must be a date (YYYY-MM-DD)"
+
+
+def _check_text(value: Any) -> str | None:
+    return None if isinstance(value, str) else "must be text"
+
+
+def _check_number(value: Any) -> str | None:
+    return None if _is_number(value) else "must be a number"
+
+
+def _check_integer(value: Any) -> str | None:
+    return None if _is_number(value) and float(value).is_integer() else "must be a whole number"
+
+
+def _check_boolean(value: Any) -> str | None:
+    return None if isinstance(value, bool) else "must be true or false"
+
+
+_TYPE_CHECKS: Dict[str, Check] = {
+    **{name: _check_text for name in _TEXT_TYPES},
+    "email": _check_email,
+    "tel": _check_phone,
+    "phone": _check_phone,
+    "date": _check_date,
+    "number": _check_number,
+    "integer": _check_integer,
+    "boolean": _check_boolean,
+}
+
+
+def _field_checks(field: Dict[str, Any]) -> List[Check]:
+    """Checks for one schema property, in the order they should run"""
+    field_type = field.get("type", "string")
+    field_format = field.get("format")
+
+    checks: List[Check] = [_TYPE_CHECKS.get(field_format) or _TYPE_CHECKS.get(field_type, _check_text)]
+
+    if "enum" in field:
+        allowed = frozenset(str(option) for option in field["enum"])
+        checks.append(lambda v: None if str(v) in allowed else f"must be one of: {', '.join(sorted(allowed))}")
+
+    if field_type in _TEXT_TYPES or field_type in ("email", "tel", "phone"):
+        if "minLength" in field:
+            min_length = int(field["minLength"])
+            checks.append(lambda v: None if len(v) >= min_length else f"must be at least {min_length} characters")
+        if "maxLength" in field:
+            max_length = int(field["maxLength"])
+            checks.append(lambda v: None if len(v) <= max_length else f"must be at most {max_length} characters")
+        if "pattern" in field:
+            pattern = re.compile(field["pattern"])
+            checks.append(lambda v: None if pattern.search(v) else "has an invalid format")
+
+    if field_type in _NUMBER_TYPES:
+        if "minimum" in field:
+            minimum = float(field["minimum"])
+            checks.append(lambda v: None if float(v) >= minimum else f"must be at least {field['minimum']}")
+        if "maximum" in field:
+            maximum = float(field["maximum"])
+            checks.append(lambda v: None if float(v) <= maximum else f"must be at most {field['maximum']}")
+
+    return checks
+
+
+def compile_schema(schema: Dict[str, Any]) -> Validator:
+    """
+    Compile a form's fields_schema into a validator function
+
+    The schema is the JSON-Schema subset the form builder produces: an object
+    with `properties` (type/format, enum, min/maxLength, pattern,
+    minimum/maximum) and a `required` list. All schema interpretation
+    happens here, once; the returned validator only runs the prebuilt checks.
+    Unknown keys in the submission are allowed, and empty strings count as
+    missing.
+
+    Returns:
+        validator(form_data) -> {field name: error message} (empty if valid)
+    """
+    properties = schema.get("properties") or {}
+    required = frozenset(schema.get("required") or ())
+
+    fields: List[Tuple[str, bool, Tuple[Check, ...]]] = [
+        (name, name in required, tuple(_field_checks(field if isinstance(field, dict) else {})))
+        for name, field in properties.items()
+    ]
+    # Required fields the schema lists without describing
+    fields.extend((name, True, ()) for name in required - properties.keys())
+
+    def validate(form_data: Dict[str, Any]) -> Dict[str, str]:
+        errors: Dict[str, str] = {}
+        for name, is_required, checks in fields:
+            value = form_data.get(name)
+            if value is None or value == "":
+                if is_required:
+                    errors[name] = "is required"
+                continue
+            for check in checks:
+                message = check(value)
+                if message:
+                    errors[name] = message
+                    break
+        return errors
+
+    return validate
+
+
+# Compiled validators by (form id, form version). A new version (updated_at)
+# gets a new key, so edits never see a stale validator; the TTL only bounds
+# how long unused versions stay in memory.
+_validators: TTLCache[Hashable, Validator] = TTLCache(
+    max_size=settings.FORM_VALIDATOR_CACHE_SIZE,
+    ttl=3600,
+)
+
+
+def _accept_all(form_data: Dict[str, Any]) -> Dict[str, str]:
+    return {}
+
+
+def get_validator(form_id: Any, version: Any, schema: Dict[str, Any]) -> Validator:
+    """
+    Return the compiled validator for a form version, compiling it on first use
+
+    Schemas are checked when forms are created or updated, but forms saved
+    before that may not compile. Those are logged and accept any submission
+    (as before validation existed) rather than failing every submit.
+    """
+    key = (form_id, version)
+    validator = _validators.get(key)
+    if validator is None:
+        try:
+            validator = compile_schema(schema)
+        except SCHEMA_ERRORS as e:
+            print(f"Skipping validation for form {form_id}: invalid fields_schema ({e})")
+            validator = _accept_all
+        _validators.set(key, validator)
+    return validator
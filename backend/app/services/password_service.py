@@ -0,0 +1,96 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, TypeVar
+
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password
+
+T = TypeVar("T")
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing pool is saturated and cannot accept more work"""
+
+
+class PasswordHashingService:
+    """
+    Runs bcrypt hashing/verification on a bounded thread pool
+
+    bcrypt releases the GIL, so a small thread pool keeps the event loop free
+    while logins are being checked. Work beyond max_workers waits in the pool
+    queue; once max_queue jobs are waiting, new requests are rejected with
+    PasswordHasherBusy instead of piling up behind each other.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor: ThreadPoolExecutor | None = None
+
+        # Metrics (only mutated on the event loop thread)
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for a free worker"""
+        return max(self.in_flight - self.max_workers, 0)
+
+    def _finished(self, _: Future) -> None:
+        self.in_flight -= 1
+        self.completed += 1
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if self.in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusy("Password hashing pool is saturated")
+
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        future = self.executor.submit(func, *args)
+        # Count the job as finished when the thread is done, not when the caller
+        # stops waiting, so cancelled requests don't under-report the queue
+        future.add_done_callback(lambda f: loop.call_soon_threadsafe(self._finished, f))
+        return await asyncio.wrap_future(future)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against a hash without blocking the event loop"""
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        """Hash a password without blocking the event loop"""
+        return await self._run(get_password_hash, password)
+
+    def stats(self) -> Dict[str, int]:
+        """Current pool metrics"""
+        return {
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            "completed": self.completed,
+            "rejected": self.rejected,
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Global instance
+password_service = PasswordHashingService(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
@@ -1,32 +1,131 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Dict, TypeVar
+import uuid
+from datetime import datetime
+
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from app.core.config import settings
-from typing import BinaryIO
-import uuid
-from datetime import datetime
 
+T = TypeVar("T")
+
+# Bytes read from an S3 body per thread hop when streaming a download
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+
+class S3Storage:
+    """
+    Shared S3 client whose blocking boto3 calls run on a dedicated thread pool
+
+    boto3 is synchronous, so every call is handed to a pool sized to the
+    client's HTTP connection pool (S3_MAX_POOL_CONNECTIONS): concurrent
+    uploads/downloads each get a thread and a connection instead of stalling
+    the event loop, and never queue for a connection inside botocore. The
+    client (thread-safe once built) and pool are created on first use and
+    closed on shutdown; building the client is locked because pool threads
+    can be the first to touch it and boto3's default session isn't
+    thread-safe.
+    """
+
+    def __init__(self, max_connections: int):
+        self.max_connections = max_connections
+        self._client: Any = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._client_lock = threading.Lock()
+
+        # Metrics (only mutated on the event loop thread)
+        self.in_flight = 0
+        self.completed = 0
+
+    @property
+    def client(self) -> Any:
+        if self._client is not None:
+            return self._client
+        with self._client_lock:
+            if self._client is None:
+                self._client = boto3.client(
+                    's3',
+                    endpoint_url=settings.S3_ENDPOINT_URL,
+                    aws_access_key_id=settings.S3_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.S3_SECRET_ACCESS_KEY,
+                    region_name=settings.S3_REGION,
+                    config=Config(
+                        max_pool_connections=self.max_connections,
+                        retries={'max_attempts': 3, 'mode': 'standard'},
+                    ),
+                )
+            return self._client
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_connections,
+                thread_name_prefix="s3"
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking call (usually a client method) on the S3 pool"""
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        try:
+            return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Current pool metrics"""
+        return {
+            "max_connections": self.max_connections,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+        }
 
-# Initialize S3 client
-s3_client = boto3.client(
-    's3',
-    endpoint_url=settings.S3_ENDPOINT_URL,
-    aws_access_key_id=settings.S3_ACCESS_KEY_ID,
-    aws_secret_access_key=settings.S3_SECRET_ACCESS_KEY,
-    region_name=settings.S3_REGION
-)
+    def shutdown(self) -> None:
+        """Stop the worker threads and close the client's connections"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
 
 
-async def upload_file(
-    file_obj: BinaryIO,
+# Global instance
+s3_storage = S3Storage(max_connections=settings.S3_MAX_POOL_CONNECTIONS)
+
+
+def _object_key(filename: str, folder: str) -> str:
+    """Unique, date-partitioned S3 key keeping the original extension"""
+    file_extension = filename.split('.')[-1] if '.' in filename else ''
+    unique_filename = f"{uuid.uuid4()}.{file_extension}" if file_extension else str(uuid.uuid4())
+    return f"{folder}/{datetime.utcnow().strftime('%Y/%m/%d')}/{unique_filename}"
+
+
+async def upload_stream(
+    chunks: AsyncIterator[bytes],
     filename: str,
     content_type: str = None,
     folder: str = "documents"
 ) -> dict:
     """
-    Upload a file to S3
+    Upload a file to S3 as its bytes arrive
+
+    Chunks are gathered into S3_UPLOAD_PART_SIZE parts and sent with a
+    multipart upload, so at most one part is held in memory. Files smaller
+    than one part go up in a single PutObject. If the iterator raises (e.g.
+    an upload over the size limit) or S3 fails, the multipart upload is
+    aborted so no orphaned parts are left behind, and the error propagates.
 
     Args:
-        file_obj: File object to upload
+        chunks: Async iterator of file bytes
         filename: Original filename
         content_type: MIME type of the file
         folder: S3 folder/prefix (default: documents)
@@ -34,35 +133,82 @@ async def upload_file(
     Returns:
         dict with s3_key, bucket, and url
     """
-    try:
-        # Generate unique filename
-        file_extension = filename.split('.')[-1] if '.' in filename else ''
-        unique_filename = f"{uuid.uuid4()}.{file_extension}" if file_extension else str(uuid.uuid4())
-        s3_key = f"{folder}/{datetime.utcnow().strftime('%Y/%m/%d')}/{unique_filename}"
-
-        # Upload to S3
-        extra_args = {}
-        if content_type:
-            extra_args['ContentType'] = content_type
-
-        s3_client.upload_fileobj(
-            file_obj,
-            settings.S3_BUCKET_NAME,
-            s3_key,
-            ExtraArgs=extra_args
+    client = s3_storage.client
+    s3_key = _object_key(filename, folder)
+    extra_args = {'ContentType': content_type} if content_type else {}
+
+    upload_id = None
+    parts = []
+    buffer = bytearray()
+
+    async def send_part() -> None:
+        nonlocal upload_id, buffer
+        if upload_id is None:
+            created = await s3_storage.run(
+                client.create_multipart_upload,
+                Bucket=settings.S3_BUCKET_NAME,
+                Key=s3_key,
+                **extra_args
+            )
+            upload_id = created['UploadId']
+
+        part_number = len(parts) + 1
+        body, buffer = bytes(buffer), bytearray()
+        uploaded = await s3_storage.run(
+            client.upload_part,
+            Bucket=settings.S3_BUCKET_NAME,
+            Key=s3_key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=body
         )
+        parts.append({'PartNumber': part_number, 'ETag': uploaded['ETag']})
 
-        # Generate URL
-        url = f"{settings.S3_ENDPOINT_URL}/{settings.S3_BUCKET_NAME}/{s3_key}"
+    try:
+        async for chunk in chunks:
+            buffer += chunk
+            if len(buffer) >= settings.S3_UPLOAD_PART_SIZE:
+                await send_part()
 
-        return {
-            's3_key': s3_key,
-            'bucket': settings.S3_BUCKET_NAME,
-            'url': url
-        }
+        if upload_id is None:
+            await s3_storage.run(
+                client.put_object,
+                Bucket=settings.S3_BUCKET_NAME,
+                Key=s3_key,
+                Body=bytes(buffer),
+                **extra_args
+            )
+        else:
+            if buffer:
+                await send_part()
+            await s3_storage.run(
+                client.complete_multipart_upload,
+                Bucket=settings.S3_BUCKET_NAME,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts}
+            )
 
-    except ClientError as e:
-        raise Exception(f"S3 upload error: {str(e)}")
+    except BaseException as e:
+        if upload_id is not None:
+            try:
+                await s3_storage.run(
+                    client.abort_multipart_upload,
+                    Bucket=settings.S3_BUCKET_NAME,
+                    Key=s3_key,
+                    UploadId=upload_id
+                )
+            except Exception as abort_error:
+                print(f"S3 multipart abort failed for {s3_key}: {abort_error}")
+        if isinstance(e, ClientError):
+            raise Exception(f"S3 upload error: {str(e)}")
+        raise
+
+    return {
+        's3_key': s3_key,
+        'bucket': settings.S3_BUCKET_NAME,
+        'url': f"{settings.S3_ENDPOINT_URL}/{settings.S3_BUCKET_NAME}/{s3_key}"
+    }
 
 
 async def download_file(s3_key: str) -> bytes:
@@ -76,16 +222,79 @@ async def download_file(s3_key: str) -> bytes:
         File content as bytes
     """
     try:
-        response = s3_client.get_object(
-            Bucket=settings.S3_BUCKET_NAME,
-            Key=s3_key
-        )
-        return response['Body'].read()
+        def _read() -> bytes:
+            response = s3_storage.client.get_object(
+                Bucket=settings.S3_BUCKET_NAME,
+                Key=s3_key
+            )
+            return response['Body'].read()
+
+        return await s3_storage.run(_read)
 
     except ClientError as e:
         raise Exception(f"S3 download error: {str(e)}")
 
 
+async def open_download(
+    s3_key: str,
+    byte_range: str | None = None,
+    if_none_match: str | None = None,
+    if_modified_since: datetime | None = None,
+    if_match: str | None = None,
+    if_unmodified_since: datetime | None = None
+) -> dict:
+    """
+    Start a download from S3 without reading the body
+
+    Range and conditions are evaluated by S3, so only the requested bytes
+    leave the bucket. Stream the body with iter_body().
+
+    Args:
+        s3_key: S3 object key
+        byte_range: HTTP Range value, e.g. "bytes=0-1023"
+        if_none_match, if_modified_since, if_match, if_unmodified_since:
+            Conditional request headers passed through to S3
+
+    Returns:
+        GetObject response (Body, ContentLength, ContentRange, ETag, LastModified, ...)
+
+    Raises:
+        ClientError: S3 error responses, unwrapped so callers can map
+            304/412/416 to HTTP responses
+    """
+    conditions = {
+        'Range': byte_range,
+        'IfNoneMatch': if_none_match,
+        'IfModifiedSince': if_modified_since,
+        'IfMatch': if_match,
+        'IfUnmodifiedSince': if_unmodified_since,
+    }
+    return await s3_storage.run(
+        s3_storage.client.get_object,
+        Bucket=settings.S3_BUCKET_NAME,
+        Key=s3_key,
+        **{name: value for name, value in conditions.items() if value is not None}
+    )
+
+
+async def iter_body(body: Any, chunk_size: int = DOWNLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """
+    Stream an S3 response body in chunks
+
+    Each read runs on the S3 pool, so memory per download is one chunk
+    whatever the file size. The body (and its connection) is closed when
+    the stream ends or the client goes away.
+    """
+    try:
+        while True:
+            chunk = await s3_storage.run(body.read, chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        body.close()
+
+
 async def generate_presigned_url(s3_key: str, expiration: int = 3600) -> str:
     """
     Generate a presigned URL for secure file download
@@ -98,7 +307,8 @@ async def generate_presigned_url(s3_key: str, expiration: int = 3600) -> str:
         Presigned URL
     """
     try:
-        url = s3_client.generate_presigned_url(
+        url = await s3_storage.run(
+            s3_storage.client.generate_presigned_url,
             'get_object',
             Params={
                 'Bucket': settings.S3_BUCKET_NAME,
@@ -112,6 +322,40 @@ async def generate_presigned_url(s3_key: str, expiration: int = 3600) -> str:
         raise Exception(f"S3 presigned URL error: {str(e)}")
 
 
+async def generate_presigned_urls(s3_keys: list[str], expiration: int = 3600) -> dict[str, str]:
+    """
+    Generate presigned download URLs for several files at once
+
+    Signing is local (no S3 round trip), so a whole document list is signed
+    in one pass on the S3 pool rather than one thread hop per document.
+
+    Args:
+        s3_keys: S3 object keys
+        expiration: URL expiration time in seconds (default: 1 hour)
+
+    Returns:
+        dict of s3_key -> presigned URL
+    """
+    def _sign_all() -> dict[str, str]:
+        return {
+            s3_key: s3_storage.client.generate_presigned_url(
+                'get_object',
+                Params={
+                    'Bucket': settings.S3_BUCKET_NAME,
+                    'Key': s3_key
+                },
+                ExpiresIn=expiration
+            )
+            for s3_key in dict.fromkeys(s3_keys)
+        }
+
+    try:
+        return await s3_storage.run(_sign_all)
+
+    except ClientError as e:
+        raise Exception(f"S3 presigned URL error: {str(e)}")
+
+
 async def delete_file(s3_key: str) -> bool:
     """
     Delete a file from S3
@@ -123,7 +367,8 @@ async def delete_file(s3_key: str) -> bool:
         True if successful
     """
     try:
-        s3_client.delete_object(
+        await s3_storage.run(
+            s3_storage.client.delete_object,
             Bucket=settings.S3_BUCKET_NAME,
             Key=s3_key
         )
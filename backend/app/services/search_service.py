@@ -0,0 +1,75 @@
+import re
+from typing import Any, Sequence
+from uuid import UUID
+
+from sqlalchemy import select, func, literal, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.client import Client
+from app.models.intake import IntakeSubmission
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def _prefix_tsquery(q: str) -> Any:
+    """
+    Build a prefix tsquery ("jo smi" -> 'jo':* & 'smi':*) from free text
+
+    Only word characters reach to_tsquery, so user input can't produce a
+    tsquery syntax error. Returns None when the text has no words.
+    """
+    terms = _WORD.findall(q.lower())
+    if not terms:
+        return None
+    return func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+
+
+async def _search(
+    db: AsyncSession,
+    model: Any,
+    firm_id: UUID,
+    q: str,
+    limit: int
+) -> Sequence[Any]:
+    """
+    Ranked search over a model's generated search_text/search_vector columns
+
+    Rows match on whole-word prefixes (GIN tsvector index) or on trigram word
+    similarity for typos and partial emails/phones (GIN pg_trgm index). They
+    are ranked by whichever signal is stronger.
+    """
+    needle = q.strip().lower()
+    tsquery = _prefix_tsquery(needle)
+
+    fuzzy_match = literal(needle).op("<%")(model.search_text)
+    similarity = func.word_similarity(needle, model.search_text)
+
+    if tsquery is not None:
+        match = or_(model.search_vector.op("@@")(tsquery), fuzzy_match)
+        rank = func.greatest(func.ts_rank(model.search_vector, tsquery), similarity)
+    else:
+        match = fuzzy_match
+        rank = similarity
+
+    result = await db.execute(
+        select(model)
+        .where(model.firm_id == firm_id, match)
+        .order_by(rank.desc(), model.created_at.desc())
+        .limit(limit)
+    )
+    return result.scalars().all()
+
+
+async def search_clients(db: AsyncSession, firm_id: UUID, q: str, limit: int = 20) -> Sequence[Client]:
+    """Search a firm's clients by name, email and phone"""
+    return await _search(db, Client, firm_id, q, limit)
+
+
+async def search_submissions(
+    db: AsyncSession,
+    firm_id: UUID,
+    q: str,
+    limit: int = 20
+) -> Sequence[IntakeSubmission]:
+    """Search a firm's submissions by the contact and case fields in form_data"""
+    return await _search(db, IntakeSubmission, firm_id, q, limit)
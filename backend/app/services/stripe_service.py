@@ -1,3 +1,4 @@
+import asyncio
 import stripe
 from app.core.config import settings
 
@@ -9,7 +10,8 @@ async def create_checkout_session(
     currency: str = "usd",
     success_url: str = None,
     cancel_url: str = None,
-    metadata: dict = None
+    metadata: dict = None,
+    idempotency_key: str = None
 ) -> dict:
     """
     Create a Stripe checkout session for payment
@@ -20,6 +22,7 @@ async def create_checkout_session(
         success_url: URL to redirect after successful payment
         cancel_url: URL to redirect if payment is cancelled
         metadata: Additional metadata to attach to the payment
+        idempotency_key: Stripe returns the same session for repeat calls with this key
 
     Returns:
         dict with checkout session details including 'url' and 'id'
@@ -28,7 +31,9 @@ async def create_checkout_session(
         # Convert amount to cents
         amount_cents = int(float(amount) * 100)
 
-        session = stripe.checkout.Session.create(
+        # The Stripe SDK is blocking, so run it off the event loop
+        session = await asyncio.to_thread(
+            stripe.checkout.Session.create,
             payment_method_types=['card'],
             line_items=[{
                 'price_data': {
@@ -45,6 +50,7 @@ async def create_checkout_session(
             success_url=success_url or settings.CORS_ORIGINS[0] + '/payment/success?session_id={CHECKOUT_SESSION_ID}',
             cancel_url=cancel_url or settings.CORS_ORIGINS[0] + '/payment/cancelled',
             metadata=metadata or {},
+            **({'idempotency_key': idempotency_key} if idempotency_key else {}),
         )
 
         return {
@@ -67,7 +73,7 @@ async def verify_payment(session_id: str) -> dict:
         dict with payment details including status and metadata
     """
     try:
-        session = stripe.checkout.Session.retrieve(session_id)
+        session = await asyncio.to_thread(stripe.checkout.Session.retrieve, session_id)
 
         return {
             'id': session.id,
@@ -0,0 +1,127 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict
+from uuid import UUID
+
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.core.sse import HEARTBEAT, StreamSlots, sse_event, sse_retry
+from app.models.intake import IntakeSubmission
+
+CHANNEL_PREFIX = "submission:"
+
+
+def _channel(submission_id: UUID) -> str:
+    return f"{CHANNEL_PREFIX}{submission_id}"
+
+
+def status_payload(submission: IntakeSubmission) -> Dict[str, Any]:
+    """The submission fields the public status pages care about"""
+    return {
+        "id": str(submission.id),
+        "status": submission.status,
+        "signature_status": submission.signature_status,
+        "payment_status": submission.payment_status,
+        "signed_at": submission.signed_at.isoformat() if submission.signed_at else None,
+        "paid_at": submission.paid_at.isoformat() if submission.paid_at else None,
+    }
+
+
+async def publish_submission_status(submission: IntakeSubmission) -> None:
+    """
+    Push a submission's current status to its SSE subscribers
+
+    Call after committing the change. Failures are only logged: clients
+    still get the new state from their next (re)connect snapshot.
+    """
+    try:
+        await get_redis().publish(_channel(submission.id), json.dumps(status_payload(submission)))
+    except RedisError as e:
+        print(f"Error publishing status for submission {submission.id}: {e}")
+
+
+class SubmissionEventStreams:
+    """
+    Server-Sent Events streams of submission status, fed by Redis pub/sub
+
+    Connections are capped per process and per submission so a page left
+    open in many tabs (or a misbehaving client) can't exhaust Redis
+    connections. Each stream sends a heartbeat comment while idle (keeps
+    proxies from closing it) and ends after SSE_MAX_STREAM_SECONDS;
+    EventSource reconnects automatically and gets a fresh snapshot.
+    """
+
+    def __init__(self, max_connections: int, max_per_submission: int):
+        self.slots = StreamSlots(max_connections, max_per_submission, detail="Too many open status streams")
+
+    def reserve(self, submission_id: UUID) -> Callable[[], None]:
+        """Take a stream slot or raise 429; returns the (idempotent) release callable"""
+        return self.slots.reserve(submission_id)
+
+    async def stream(
+        self,
+        submission_id: UUID,
+        load_snapshot: Callable[[], Awaitable[Dict[str, Any]]],
+        release: Callable[[], None]
+    ) -> AsyncIterator[bytes]:
+        """
+        SSE body: the current status, then every published change, with heartbeats
+
+        Subscribes before loading the snapshot, so a change committed in
+        between is never missed. The slot comes from reserve(); it and the
+        Redis connection are always released when the stream ends.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.SSE_MAX_STREAM_SECONDS
+
+        pubsub: PubSub = get_redis().pubsub()
+        try:
+            yield sse_retry(settings.SSE_HEARTBEAT_SECONDS)
+
+            try:
+                await pubsub.subscribe(_channel(submission_id))
+            except RedisError as e:
+                # EventSource reconnects after the retry delay
+                print(f"Error subscribing to submission {submission_id}: {e}")
+                return
+
+            yield sse_event("status", await load_snapshot())
+
+            while loop.time() < deadline:
+                try:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True,
+                        timeout=settings.SSE_HEARTBEAT_SECONDS
+                    )
+                except RedisError as e:
+                    print(f"Status stream for submission {submission_id} lost Redis: {e}")
+                    return
+
+                if message is None:
+                    yield HEARTBEAT
+                    continue
+
+                yield sse_event("status", json.loads(message["data"]))
+        finally:
+            release()
+            try:
+                await pubsub.aclose()
+            except RedisError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Open stream counts"""
+        return {
+            "open_streams": self.slots.total,
+            "submissions": self.slots.keys(),
+        }
+
+
+# Global instance
+submission_event_streams = SubmissionEventStreams(
+    max_connections=settings.SSE_MAX_CONNECTIONS,
+    max_per_submission=settings.SSE_MAX_CONNECTIONS_PER_SUBMISSION,
+)
@@ -1,3 +1,4 @@
+import asyncio
 from app.worker import celery_app
 from typing import Dict, Any
 
@@ -120,3 +121,40 @@ def send_signature_request(
             'status': 'error',
             'message': str(e)
         }
+
+
+@celery_app.task(name='reconcile_firm_counters')
+def reconcile_firm_counters() -> Dict[str, Any]:
+    """
+    Periodic task to repair drift in the per-firm client/submission counters
+
+    Counters are maintained by triggers; this recomputes them from the source
+    tables and fixes any that disagree.
+    """
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import NullPool
+    from app.core.config import settings
+    from app.services.counter_service import reconcile_firm_counters as reconcile
+
+    async def _run() -> int:
+        # Each task run gets its own event loop, so don't reuse pooled connections
+        engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+        try:
+            async with async_sessionmaker(engine, class_=AsyncSession)() as session:
+                return await reconcile(session)
+        finally:
+            await engine.dispose()
+
+    try:
+        corrected = asyncio.run(_run())
+        print(f"[TASK] Reconciled firm counters ({corrected} corrected)")
+
+        return {
+            'status': 'success',
+            'corrected': corrected
+        }
+    except Exception as e:
+        return {
+            'status': 'error',
+            'message': str(e)
+        }
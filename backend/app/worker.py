@@ -21,6 +21,12 @@ celery_app.conf.update(
     task_soft_time_limit=240,  # 4 minutes
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
+    beat_schedule={
+        'reconcile-firm-counters': {
+            'task': 'reconcile_firm_counters',
+            'schedule': settings.FIRM_COUNTERS_RECONCILE_SECONDS,
+        },
+    },
 )
 
 if __name__ == '__main__':
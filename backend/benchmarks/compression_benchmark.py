@@ -0,0 +1,69 @@
+"""
+Response compression benchmark
+
+Compresses typical response bodies (a submissions list page, the OpenAPI
+schema, a public intake form) at the middleware's per-request settings and at
+the precompression settings used for cached bodies, and reports CPU time
+against bytes saved. brotli rows only appear when the optional package is
+installed. Needs no database.
+
+Usage (from backend/):
+    python -m benchmarks.compression_benchmark [--runs 50]
+"""
+import argparse
+import json
+import time
+
+from app.core.compression import (
+    PRECOMPRESS_BROTLI_QUALITY,
+    PRECOMPRESS_GZIP_LEVEL,
+    SUPPORTED_ENCODINGS,
+    compress,
+)
+from app.core.config import settings
+from app.core.serialization import FastJSONResponse
+from app.main import app
+from benchmarks.serialization_benchmark import build_rows
+from benchmarks.validation_benchmark import build_form
+
+
+def sample_bodies() -> dict[str, bytes]:
+    schema, _ = build_form(150)
+    return {
+        "submissions page (100 x 150 fields)": FastJSONResponse({"items": build_rows(100, 150)}).body,
+        "submissions page (100, no form_data)": FastJSONResponse(
+            {"items": [{k: v for k, v in row.items() if k != "form_data"} for row in build_rows(100, 0)]}
+        ).body,
+        "openapi.json": json.dumps(app.openapi()).encode(),
+        "public form (150 fields)": json.dumps({"name": "Intake", "fields_schema": schema}).encode(),
+    }
+
+
+def main(runs: int) -> None:
+    levels = {
+        "gzip": [settings.COMPRESSION_GZIP_LEVEL, PRECOMPRESS_GZIP_LEVEL],
+        "br": [settings.COMPRESSION_BROTLI_QUALITY, PRECOMPRESS_BROTLI_QUALITY],
+    }
+
+    for name, body in sample_bodies().items():
+        print(f"{name}: {len(body) / 1024:.1f} KiB")
+        for encoding in SUPPORTED_ENCODINGS:
+            for level in levels[encoding]:
+                start = time.perf_counter()
+                for _ in range(runs):
+                    compressed = compress(body, encoding, level)
+                ms = (time.perf_counter() - start) / runs * 1000
+                saved = 1 - len(compressed) / len(body)
+                print(
+                    f"  {encoding:4} level {level:2}: {ms:7.2f} ms  "
+                    f"{len(compressed) / 1024:7.1f} KiB  ({saved:.0%} saved, "
+                    f"{(len(body) - len(compressed)) / 1024 / max(ms, 1e-6):.0f} KiB saved per ms)"
+                )
+    print(f"\nBodies under {settings.COMPRESSION_MINIMUM_SIZE} bytes are sent uncompressed.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+    main(args.runs)
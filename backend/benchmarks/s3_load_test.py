@@ -0,0 +1,102 @@
+"""
+Concurrent S3 traffic load test
+
+Runs N concurrent document downloads the old way (blocking boto3 calls made
+directly in the coroutine) and through s3_service (shared client on the S3
+thread pool), and reports wall time plus event loop lag: how late a 10 ms
+ticker ran while the downloads were in flight. Blocking calls serialize the
+worker, so the old way takes ~N x latency and stalls the loop for all of it.
+
+By default it starts an in-process S3 stand-in (a threaded HTTP server that
+answers every GET after --latency ms), so no S3 or MinIO is needed; pass
+--endpoint to use a real S3-compatible service holding --key instead.
+
+Usage (from backend/):
+    python -m benchmarks.s3_load_test [--concurrency 50] [--latency 100] [--size 256]
+"""
+import argparse
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app.core.config import settings
+
+
+def start_stand_in(latency_ms: int, size_kb: int) -> ThreadingHTTPServer:
+    """Minimal S3 GetObject stand-in on a random local port"""
+    body = b"x" * (size_kb * 1024)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency_ms / 1000)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/pdf")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("ETag", '"stand-in"')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def measure(name: str, make_download, concurrency: int) -> None:
+    """Run `concurrency` downloads at once while a ticker records loop lag"""
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            expected = time.perf_counter() + 0.01
+            await asyncio.sleep(0.01)
+            lags.append(time.perf_counter() - expected)
+
+    tick = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(*(make_download() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    done.set()
+    await tick
+
+    print(
+        f"{name:28} {elapsed * 1000:8.0f} ms total   "
+        f"max loop lag {max(lags, default=elapsed) * 1000:7.0f} ms"
+    )
+
+
+async def main(concurrency: int, latency_ms: int, size_kb: int, endpoint: str | None, key: str) -> None:
+    if endpoint is None:
+        server = start_stand_in(latency_ms, size_kb)
+        endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+    settings.S3_ENDPOINT_URL = endpoint
+
+    from app.services.s3_service import download_file, s3_storage
+
+    async def blocking_download():
+        # What s3_service used to do: a sync boto3 call inside a coroutine
+        response = s3_storage.client.get_object(Bucket=settings.S3_BUCKET_NAME, Key=key)
+        return response["Body"].read()
+
+    print(f"{concurrency} concurrent downloads of {key} from {endpoint}")
+    await measure("blocking boto3 in coroutine", blocking_download, concurrency)
+    await measure("s3_service (S3 pool)", lambda: download_file(key), concurrency)
+    s3_storage.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=int, default=100, help="stand-in response delay (ms)")
+    parser.add_argument("--size", type=int, default=256, help="stand-in object size (KiB)")
+    parser.add_argument("--endpoint", default=None, help="real S3-compatible endpoint instead of the stand-in")
+    parser.add_argument("--key", default="documents/load-test.pdf")
+    args = parser.parse_args()
+    asyncio.run(main(args.concurrency, args.latency, args.size, args.endpoint, args.key))
@@ -0,0 +1,109 @@
+"""
+Client search latency benchmark
+
+Seeds a throwaway firm with 100k clients, times /clients/search queries
+against it and reports p50/p95. The firm and its clients are deleted at the end.
+
+Usage (from backend/, against a migrated database):
+    python -m benchmarks.search_benchmark [--clients 100000] [--runs 50]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+
+from sqlalchemy import delete, insert
+
+from app.db.base import AsyncSessionLocal
+from app.models.client import Client
+from app.models.firm import Firm
+from app.models.firm_counter import FirmCounter
+from app.services.search_service import search_clients
+
+TARGET_P95_MS = 50
+CHUNK_SIZE = 5000
+
+FIRST_NAMES = ["james", "maria", "robert", "linda", "michael", "sofia", "david", "aisha", "daniel", "elena"]
+LAST_NAMES = ["smith", "garcia", "johnson", "nguyen", "brown", "obrien", "miller", "kowalski", "davis", "patel"]
+
+QUERIES = [
+    "smith",          # common last name
+    "mar gar",        # prefixes of first + last name
+    "jonhson",        # typo
+    "obrien",         # exact token
+    "555-01",         # partial phone
+    "client4242@",    # partial email
+]
+
+
+async def seed(firm_id: uuid.UUID, count: int) -> None:
+    """Bulk insert `count` clients for the firm"""
+    async with AsyncSessionLocal() as db:
+        db.add(Firm(id=firm_id, name="Search benchmark firm", email="bench@example.com"))
+        await db.commit()
+
+        for start in range(0, count, CHUNK_SIZE):
+            rows = []
+            for i in range(start, min(start + CHUNK_SIZE, count)):
+                rows.append({
+                    "id": uuid.uuid4(),
+                    "firm_id": firm_id,
+                    "first_name": random.choice(FIRST_NAMES),
+                    "last_name": random.choice(LAST_NAMES),
+                    "email": f"client{i}@example.com",
+                    "phone": f"555-{i % 10000:04d}",
+                    "status": "pending",
+                })
+            await db.execute(insert(Client), rows)
+            await db.commit()
+
+
+async def cleanup(firm_id: uuid.UUID) -> None:
+    async with AsyncSessionLocal() as db:
+        await db.execute(delete(Client).where(Client.firm_id == firm_id))
+        # The counter triggers leave a row for the firm, and its FK has no cascade
+        await db.execute(delete(FirmCounter).where(FirmCounter.firm_id == firm_id))
+        await db.execute(delete(Firm).where(Firm.id == firm_id))
+        await db.commit()
+
+
+async def run(clients: int, runs: int) -> None:
+    firm_id = uuid.uuid4()
+    print(f"Seeding {clients} clients...")
+    await seed(firm_id, clients)
+
+    try:
+        async with AsyncSessionLocal() as db:
+            # Warm up caches and the planner statistics
+            await db.execute(Client.__table__.select().limit(0))
+            for q in QUERIES:
+                await search_clients(db, firm_id, q)
+
+            print(f"{'query':<16}{'p50 ms':>10}{'p95 ms':>10}{'hits':>8}")
+            worst_p95 = 0.0
+            for q in QUERIES:
+                timings = []
+                for _ in range(runs):
+                    started = time.perf_counter()
+                    results = await search_clients(db, firm_id, q)
+                    timings.append((time.perf_counter() - started) * 1000)
+
+                p50 = statistics.median(timings)
+                p95 = statistics.quantiles(timings, n=20)[-1]
+                worst_p95 = max(worst_p95, p95)
+                print(f"{q:<16}{p50:>10.1f}{p95:>10.1f}{len(results):>8}")
+
+        verdict = "OK" if worst_p95 <= TARGET_P95_MS else "OVER TARGET"
+        print(f"\nWorst p95: {worst_p95:.1f} ms (target {TARGET_P95_MS} ms) - {verdict}")
+    finally:
+        await cleanup(firm_id)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clients", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.clients, args.runs))
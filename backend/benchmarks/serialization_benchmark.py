@@ -0,0 +1,94 @@
+"""
+List page serialization benchmark
+
+Times turning one page of submissions into a JSON body, the old way
+(ORM objects -> response_model validation -> JSONResponse) against the
+RowProjection path (row dicts -> FastJSONResponse). Rows carry a realistic
+form_data blob. Only serialization CPU is measured; the projection also
+skips ORM hydration when fetching, which needs a database to time.
+
+Usage (from backend/):
+    python -m benchmarks.serialization_benchmark [--items 100] [--fields 150] [--runs 200]
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.core.serialization import FastJSONResponse, RowProjection
+from app.models.intake import IntakeSubmission
+from app.schemas.intake import IntakeSubmissionList, IntakeSubmissionResponse
+
+
+def build_rows(items: int, fields: int) -> list[dict]:
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": uuid.uuid4(),
+            "form_id": uuid.uuid4(),
+            "client_id": uuid.uuid4(),
+            "form_data": {f"field_{i}": f"Answer {i} for submission {n}" for i in range(fields)},
+            "signature_status": "signed",
+            "payment_status": "succeeded",
+            "payment_amount": "1500.00",
+            "payment_url": None,
+            "status": "completed",
+            "signed_at": now,
+            "paid_at": now,
+            "created_at": now,
+        }
+        for n in range(items)
+    ]
+
+
+async def old_path(field, objects: list[IntakeSubmission]) -> bytes:
+    content = await serialize_response(
+        field=field, response_content={"items": objects, "total": None, "next_cursor": None}
+    )
+    return JSONResponse(content).body
+
+
+def new_path(projection: RowProjection, rows: list[SimpleNamespace]) -> bytes:
+    return FastJSONResponse({"items": projection.items(rows), "total": None, "next_cursor": None}).body
+
+
+async def main(items: int, fields: int, runs: int) -> None:
+    data = build_rows(items, fields)
+    objects = [IntakeSubmission(**row) for row in data]
+    rows = [SimpleNamespace(_mapping=row) for row in data]
+    field = create_model_field("response", IntakeSubmissionList)
+    projection = RowProjection(IntakeSubmission, IntakeSubmissionResponse)
+
+    old_body = await old_path(field, objects)
+    new_body = new_path(projection, rows)
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        await old_path(field, objects)
+    old_ms = (time.perf_counter() - start) / runs * 1000
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        new_path(projection, rows)
+    new_ms = (time.perf_counter() - start) / runs * 1000
+
+    print(f"Page of {items} submissions, {fields} form fields each "
+          f"({len(old_body) / 1024:.0f} KiB old / {len(new_body) / 1024:.0f} KiB new)")
+    print(f"  response_model + JSONResponse: {old_ms:8.2f} ms/page")
+    print(f"  RowProjection + FastJSONResponse: {new_ms:5.2f} ms/page")
+    print(f"  speedup: {old_ms / new_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--fields", type=int, default=150)
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.items, args.fields, args.runs))
@@ -0,0 +1,22 @@
+import pytest
+from uuid import uuid4
+
+from app.core.security import create_access_token
+from app.models.user import User
+
+
+@pytest.fixture
+async def auth_headers(db_session, test_firm):
+    """Bearer token for a fresh user in test_firm"""
+    user = User(
+        id=uuid4(),
+        email=f"test-{uuid4().hex[:8]}@example.com",
+        hashed_password="not-used",
+        full_name="Test User",
+        firm_id=test_firm.id,
+    )
+    db_session.add(user)
+    await db_session.commit()
+
+    token = create_access_token(subject=str(user.id), firm_id=str(test_firm.id))
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,90 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+
+LARGE = b'{"items": [' + b'{"status": "completed"},' * 500 + b'{}]}'
+
+
+async def _large(request):
+    return Response(LARGE, media_type="application/json")
+
+
+async def _tagged(request):
+    return Response(LARGE, media_type="application/json", headers={"ETag": '"v1"'})
+
+
+async def _small(request):
+    return Response(b'{"ok": true}', media_type="application/json")
+
+
+async def _stream(request):
+    async def chunks():
+        for _ in range(3):
+            yield LARGE
+    return StreamingResponse(chunks(), media_type="application/json")
+
+
+async def _events(request):
+    async def events():
+        yield b"event: status\ndata: {}\n\n" * 100
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+app = CompressionMiddleware(
+    Starlette(routes=[
+        Route("/large", _large),
+        Route("/tagged", _tagged),
+        Route("/small", _small),
+        Route("/stream", _stream),
+        Route("/events", _events),
+    ]),
+    minimum_size=1024,
+)
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("gzip;q=0, deflate") is None
+    assert negotiate_encoding(None) is None
+    assert negotiate_encoding("*", available=["gzip"]) == "gzip"
+
+
+@pytest.mark.asyncio
+async def test_compression_thresholds_and_exclusions():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
+        headers = {"Accept-Encoding": "gzip"}
+
+        large = await http.get("/large", headers=headers)
+        assert large.headers["content-encoding"] == "gzip"
+        assert large.headers["vary"] == "Accept-Encoding"
+        assert int(large.headers["content-length"]) < len(LARGE)
+        assert large.content == LARGE  # httpx decodes
+
+        streamed = await http.get("/stream", headers=headers)
+        assert streamed.headers["content-encoding"] == "gzip"
+        assert streamed.content == LARGE * 3
+
+        small = await http.get("/small", headers=headers)
+        assert "content-encoding" not in small.headers
+
+        events = await http.get("/events", headers=headers)
+        assert "content-encoding" not in events.headers
+
+        plain = await http.get("/large", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert plain.content == LARGE
+
+
+@pytest.mark.asyncio
+async def test_compressed_responses_get_weak_etags():
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
+        compressed = await http.get("/tagged", headers={"Accept-Encoding": "gzip"})
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.headers["etag"] == 'W/"v1"'
+
+        plain = await http.get("/tagged", headers={"Accept-Encoding": "identity"})
+        assert plain.headers["etag"] == '"v1"'
@@ -0,0 +1,37 @@
+import pytest
+from fastapi import status
+from starlette.requests import Request
+
+from app.core.conditional import etag_matches, version_etag
+
+
+def _request(if_none_match: str) -> Request:
+    return Request({"type": "http", "headers": [(b"if-none-match", if_none_match.encode())]})
+
+
+def test_etag_matching():
+    etag = version_etag("row", "2026-10-17T12:00:00")
+    assert etag_matches(_request(etag), etag)
+    assert etag_matches(_request(f'"other", {etag}'), etag)
+    assert etag_matches(_request("*"), etag)
+    assert not etag_matches(_request(version_etag("row", "2026-10-17T12:00:01")), etag)
+
+
+@pytest.mark.asyncio
+async def test_get_client_revalidates(client, db_session, auth_headers, test_client):
+    url = f"/api/v1/clients/{test_client.id}"
+
+    first = await client.get(url, headers=auth_headers)
+    assert first.status_code == status.HTTP_200_OK
+    etag = first.headers["etag"]
+
+    unchanged = await client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert unchanged.status_code == status.HTTP_304_NOT_MODIFIED
+    assert unchanged.content == b""
+
+    test_client.phone = "555-0199"
+    await db_session.commit()
+
+    changed = await client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert changed.status_code == status.HTTP_200_OK
+    assert changed.headers["etag"] != etag
@@ -0,0 +1,18 @@
+from starlette.requests import Request
+
+from app.api.v1.endpoints.documents import _download_conditions
+
+
+def test_download_range_conditions():
+    def conditions(**headers):
+        raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+        return _download_conditions(Request({"type": "http", "headers": raw}))
+
+    assert conditions(range="bytes=0-1023")["byte_range"] == "bytes=0-1023"
+    assert conditions(range="bytes=-500")["byte_range"] == "bytes=-500"
+    # Multi-range and malformed ranges are served whole
+    assert "byte_range" not in conditions(range="bytes=0-1,5-9")
+    assert "byte_range" not in conditions(range="items=0-1")
+    # If-Range rides along as a precondition; weak tags never match
+    assert conditions(range="bytes=0-", if_range='"abc"')["if_match"] == '"abc"'
+    assert "byte_range" not in conditions(range="bytes=0-", if_range='W/"abc"')
@@ -0,0 +1,54 @@
+from app.services.form_validation import _accept_all, compile_schema, get_validator
+
+SCHEMA = {
+    "properties": {
+        "name": {"type": "string", "minLength": 2},
+        "email": {"type": "email"},
+        "age": {"type": "integer", "minimum": 18},
+        "budget": {"type": "number"},
+        "case_number": {"type": "string", "pattern": "^[A-Z]{2}-\\d+$"},
+        "matter": {"type": "string", "enum": ["divorce", "custody"]},
+    },
+    "required": ["name", "email", "consent"],
+}
+
+
+def test_required_and_empty_fields():
+    validate = compile_schema(SCHEMA)
+
+    errors = validate({"name": "", "email": "jo@example.com"})
+    assert errors == {"name": "is required", "consent": "is required"}
+    # Optional fields may be empty or missing; unknown keys are ignored
+    assert validate({"name": "Jo", "email": "jo@example.com", "consent": True, "budget": "", "extra": 1}) == {}
+
+
+def test_numbers():
+    validate = compile_schema(SCHEMA)
+    base = {"name": "Jo", "email": "jo@example.com", "consent": True}
+
+    # Number inputs arrive as strings
+    assert validate({**base, "age": "42", "budget": "1500.50"}) == {}
+    assert validate({**base, "age": "17"})["age"] == "must be at least 18"
+    assert validate({**base, "age": "18.5"})["age"] == "must be a whole number"
+    for value in ("nan", "inf", "-Infinity", True, "abc"):
+        assert validate({**base, "budget": value})["budget"] == "must be a number"
+
+
+def test_pattern_and_enum():
+    validate = compile_schema(SCHEMA)
+    base = {"name": "Jo", "email": "jo@example.com", "consent": True}
+
+    assert validate({**base, "case_number": "CA-1234", "matter": "custody"}) == {}
+    assert validate({**base, "case_number": "1234"})["case_number"] == "has an invalid format"
+    assert validate({**base, "matter": "probate"})["matter"] == "must be one of: custody, divorce"
+    assert validate({**base, "email": "not-an-email"})["email"] == "must be a valid email address"
+
+
+def test_uncompilable_schema_accepts_everything():
+    schema = {"properties": {"case_number": {"type": "string", "pattern": "(unclosed"}}}
+
+    validator = get_validator("form-with-bad-pattern", 1, schema)
+    assert validator is _accept_all
+    assert validator({"case_number": "anything"}) == {}
+    # Cached, so the schema isn't recompiled on every submit
+    assert get_validator("form-with-bad-pattern", 1, schema) is validator
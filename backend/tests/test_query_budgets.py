@@ -0,0 +1,128 @@
+import pytest
+from uuid import uuid4
+
+from app.core.config import settings
+from app.core.instrumentation import QueryStats, statement_shape, track_queries
+from app.main import app
+from app.models.intake import IntakeSubmission
+
+
+def _declared_budget(method: str, path: str) -> int:
+    """Query budget declared with @query_budget on the route serving `path`"""
+    for route in app.routes:
+        if method in getattr(route, "methods", ()) and route.path_format == path:
+            return route.endpoint.__query_budget__
+    raise AssertionError(f"No route {method} {path}")
+
+
+def _assert_within_budget(stats: QueryStats, method: str, path: str) -> None:
+    budget = _declared_budget(method, path)
+    assert stats.count <= budget, (
+        f"{method} {path} ran {stats.count} queries (budget {budget}): {list(stats.shapes)}"
+    )
+    assert not stats.repeated_shapes(settings.QUERY_REPEAT_THRESHOLD), (
+        f"{method} {path} repeats a statement (N+1): {stats.repeated_shapes(settings.QUERY_REPEAT_THRESHOLD)}"
+    )
+
+
+def test_statement_shape_ignores_parameters():
+    """Same statement with different parameters and IN-list sizes has one shape"""
+    a = statement_shape("SELECT * FROM clients\n WHERE id = $1 AND status IN ($2, $3)")
+    b = statement_shape("SELECT * FROM clients WHERE id = $7 AND status IN ($8, $9, $10, $11)")
+    assert a == b
+
+
+def test_repeated_shapes_flags_loops():
+    stats = QueryStats()
+    for _ in range(settings.QUERY_REPEAT_THRESHOLD + 1):
+        stats.record("SELECT * FROM documents WHERE id = $1", 0.001)
+    stats.record("SELECT * FROM clients WHERE id = $1", 0.001)
+
+    repeated = stats.repeated_shapes(settings.QUERY_REPEAT_THRESHOLD)
+    assert repeated == [("SELECT * FROM documents WHERE id = ?", settings.QUERY_REPEAT_THRESHOLD + 1)]
+
+
+@pytest.fixture
+async def submissions(db_session, test_firm, test_intake_form, test_client):
+    rows = [
+        IntakeSubmission(
+            id=uuid4(),
+            form_id=test_intake_form.id,
+            firm_id=test_firm.id,
+            client_id=test_client.id,
+            form_data={"email": test_client.email},
+        )
+        for _ in range(10)
+    ]
+    db_session.add_all(rows)
+    await db_session.commit()
+    return rows
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("path, url", [
+    ("/api/v1/clients/", "/api/v1/clients/?include_total=true"),
+    ("/api/v1/clients/search", "/api/v1/clients/search?q=test"),
+    ("/api/v1/intake/forms", "/api/v1/intake/forms"),
+    ("/api/v1/intake/submissions", "/api/v1/intake/submissions?include_total=true"),
+    ("/api/v1/intake/submissions/search", "/api/v1/intake/submissions/search?q=test"),
+])
+async def test_list_routes_within_budget(client, auth_headers, submissions, path, url):
+    with track_queries() as stats:
+        response = await client.get(url, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert "server-timing" in response.headers
+    _assert_within_budget(stats, "GET", path)
+
+
+@pytest.mark.asyncio
+async def test_list_fields_narrow_the_select(client, auth_headers, submissions):
+    with track_queries() as stats:
+        response = await client.get(
+            "/api/v1/intake/submissions?fields=status,payment_status", headers=auth_headers
+        )
+
+    assert response.status_code == 200
+    assert set(response.json()["items"][0]) == {"id", "created_at", "status", "payment_status"}
+    assert not any("form_data" in shape for shape in stats.shapes)
+
+    response = await client.get("/api/v1/clients/?fields=intake_data,nope", headers=auth_headers)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_detail_routes_within_budget(client, auth_headers, submissions, test_client, test_intake_form):
+    submission = submissions[0]
+    requests = [
+        ("/api/v1/clients/{client_id}", f"/api/v1/clients/{test_client.id}", auth_headers),
+        ("/api/v1/intake/submissions/{submission_id}", f"/api/v1/intake/submissions/{submission.id}", auth_headers),
+        ("/api/v1/intake/submissions/{submission_id}/detail", f"/api/v1/intake/submissions/{submission.id}/detail", auth_headers),
+        ("/api/v1/documents/submission/{submission_id}/list", f"/api/v1/documents/submission/{submission.id}/list", auth_headers),
+        ("/api/v1/intake/public/forms/{form_id}", f"/api/v1/intake/public/forms/{test_intake_form.id}", {}),
+    ]
+
+    for path, url, headers in requests:
+        with track_queries() as stats:
+            response = await client.get(url, headers=headers)
+
+        assert response.status_code == 200, url
+        _assert_within_budget(stats, "GET", path)
+
+
+@pytest.mark.asyncio
+async def test_public_submit_within_budget_and_reuses_client(client, test_intake_form):
+    """Repeat submits with the same email upsert onto one client"""
+    url = f"/api/v1/intake/public/forms/{test_intake_form.id}/submit"
+    payload = {"form_data": {"email": "repeat@example.com", "first_name": "Re", "last_name": "Peat"}}
+
+    client_ids = set()
+    for _ in range(2):
+        with track_queries() as stats:
+            response = await client.post(url, json=payload)
+
+        assert response.status_code == 201
+        client_ids.add(response.json()["client_id"])
+        _assert_within_budget(stats, "POST", "/api/v1/intake/public/forms/{form_id}/submit")
+
+    assert len(client_ids) == 1
@@ -0,0 +1,132 @@
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import patch
+from uuid import uuid4
+from sqlalchemy import text
+
+from app.core.instrumentation import track_queries
+from app.core.pagination import encode_cursor
+from app.models.document import Document
+from app.models.intake import IntakeSubmission
+
+# Statements worth planning; transaction control, SET etc. are skipped
+PLANNED_STATEMENTS = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+def _plan_node_types(plan: dict) -> list[tuple[str, str | None]]:
+    """Flatten an EXPLAIN (FORMAT JSON) plan into (node type, relation) pairs"""
+    nodes = [(plan["Node Type"], plan.get("Relation Name"))]
+    for child in plan.get("Plans", []):
+        nodes.extend(_plan_node_types(child))
+    return nodes
+
+
+async def _assert_endpoint_uses_indexes(client, db_session, method: str, url: str, **kwargs) -> None:
+    """
+    Call an endpoint and EXPLAIN every statement it ran, with sequential scans disabled
+
+    The statements are captured as sent to the driver (track_queries), so a
+    change to the endpoint's query is what gets planned. With enable_seqscan
+    off the planner only falls back to a Seq Scan when no usable index
+    exists, so any Seq Scan in a plan means a missing index.
+    """
+    with track_queries(capture=True) as stats:
+        response = await client.request(method, url, **kwargs)
+    assert response.status_code < 500, f"{method} {url}: {response.status_code}"
+
+    planned = [
+        (statement, parameters) for statement, parameters in stats.executed
+        if statement.lstrip().upper().startswith(PLANNED_STATEMENTS)
+    ]
+    assert planned, f"{method} {url} ran no statements"
+
+    connection = await db_session.connection()
+    await connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    for statement, parameters in planned:
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        plan = result.scalar()[0]["Plan"]
+
+        seq_scans = [rel for node, rel in _plan_node_types(plan) if node == "Seq Scan"]
+        assert not seq_scans, f"{method} {url}: sequential scan on {seq_scans} for query:\n{statement}"
+    await db_session.rollback()
+
+
+@pytest.fixture
+async def seeded(db_session, test_firm, test_intake_form, test_client):
+    """A handful of rows in every table the hot queries touch"""
+    for i in range(20):
+        submission = IntakeSubmission(
+            id=uuid4(),
+            form_id=test_intake_form.id,
+            firm_id=test_firm.id,
+            client_id=test_client.id,
+            form_data={"email": f"client{i}@example.com"},
+            docusign_envelope_id=f"env_{i}",
+            stripe_payment_intent_id=f"cs_test_{i}",
+        )
+        db_session.add(submission)
+        db_session.add(Document(
+            submission_id=submission.id,
+            firm_id=test_firm.id,
+            filename=f"retainer_{i}.pdf",
+            document_type="retainer",
+            s3_key=f"submissions/{submission.id}/retainer.pdf",
+            s3_bucket="test",
+        ))
+
+    await db_session.commit()
+    await db_session.execute(text("ANALYZE"))
+    return test_firm
+
+
+def _deep_cursor() -> str:
+    return encode_cursor(datetime(2024, 1, 1, tzinfo=timezone.utc), uuid4())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("url", [
+    "/api/v1/clients/",
+    "/api/v1/clients/?cursor={cursor}",
+    "/api/v1/clients/?status_filter=pending&cursor={cursor}",
+    "/api/v1/clients/?include_total=true&filter=intake_data.case_type=divorce",
+    "/api/v1/clients/search?q=client",
+    "/api/v1/intake/forms",
+    "/api/v1/intake/submissions",
+    "/api/v1/intake/submissions?cursor={cursor}",
+    "/api/v1/intake/submissions?include_total=true&filter=form_data.email=client3@example.com",
+    "/api/v1/intake/submissions/search?q=client",
+])
+async def test_list_routes_use_indexes(client, db_session, auth_headers, seeded, url):
+    url = url.format(cursor=_deep_cursor())
+    await _assert_endpoint_uses_indexes(client, db_session, "GET", url, headers=auth_headers)
+
+
+@pytest.mark.asyncio
+async def test_public_submit_client_upsert_uses_index(client, db_session, seeded, test_intake_form):
+    await _assert_endpoint_uses_indexes(
+        client, db_session, "POST", f"/api/v1/intake/public/forms/{test_intake_form.id}/submit",
+        json={"form_data": {"email": "client@example.com", "first_name": "Plan", "last_name": "Test"}},
+    )
+
+
+@pytest.mark.asyncio
+async def test_retainer_document_lookup_uses_index(client, db_session, auth_headers, seeded):
+    submission_id = (await db_session.execute(
+        text("SELECT id FROM intake_submissions WHERE docusign_envelope_id = 'env_3'")
+    )).scalar()
+    # Runs the retainer lookup; S3 and DocuSign are stubbed out and the envelope "fails"
+    with patch("app.api.v1.endpoints.signatures.download_file", return_value=b"%PDF"), \
+            patch("app.api.v1.endpoints.signatures.docusign_service.create_envelope",
+                  return_value={"status": "error", "message": "test"}):
+        await _assert_endpoint_uses_indexes(
+            client, db_session, "POST", f"/api/v1/signatures/submissions/{submission_id}/request",
+            headers=auth_headers,
+        )
+
+
+@pytest.mark.asyncio
+async def test_docusign_webhook_lookup_uses_index(client, db_session, seeded):
+    await _assert_endpoint_uses_indexes(
+        client, db_session, "POST", "/api/v1/signatures/webhooks/docusign",
+        json={"event": "envelope-sent", "data": {"envelopeSummary": {"envelopeId": "env_3"}}},
+    )
@@ -0,0 +1,63 @@
+import hashlib
+
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from app.core.uploads import StreamedFile
+
+app = FastAPI()
+
+
+@app.post("/upload")
+async def _upload(request: Request):
+    file = StreamedFile(request, max_size=1024 * 1024)
+    await file.open()
+    async for _ in file.chunks():
+        pass
+    return {"filename": file.filename, "content_type": file.content_type, "size": file.size, "sha256": file.sha256}
+
+
+async def _chunked(body: bytes, chunk_size: int = 4096):
+    # No Content-Length, so the limit can only be enforced while streaming
+    for i in range(0, len(body), chunk_size):
+        yield body[i:i + chunk_size]
+
+
+def _multipart(data: bytes, boundary: str = "b0undary") -> tuple[bytes, dict]:
+    body = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="note"\r\n\r\nignored\r\n'
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="retainer.pdf"\r\n'
+        "Content-Type: application/pdf\r\n\r\n"
+    ).encode() + data + f"\r\n--{boundary}--\r\n".encode()
+    return body, {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+
+
+@pytest.mark.asyncio
+async def test_streamed_file_counts_and_hashes():
+    data = bytes(range(256)) * 1000
+    body, headers = _multipart(data)
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
+        response = await http.post("/upload", content=_chunked(body), headers=headers)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "filename": "retainer.pdf",
+        "content_type": "application/pdf",
+        "size": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+    }
+
+
+@pytest.mark.asyncio
+async def test_streamed_file_rejects_oversize():
+    body, headers = _multipart(b"x" * (2 * 1024 * 1024))
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as http:
+        # Declared length over the limit: rejected before reading
+        declared = await http.post("/upload", content=body, headers=headers)
+        streamed = await http.post("/upload", content=_chunked(body), headers=headers)
+
+    assert declared.status_code == 413
+    assert streamed.status_code == 413
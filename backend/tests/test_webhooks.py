@@ -14,6 +14,7 @@ async def test_stripe_webhook_payment_completed(client, db_session, test_firm, t
     submission = IntakeSubmission(
         id=uuid4(),
         form_id=test_intake_form.id,
+        firm_id=test_firm.id,
         client_id=test_client.id,
         form_data={"test": "data"},
         payment_amount="1000.00",
@@ -79,6 +80,7 @@ async def test_stripe_webhook_expired_session(client, db_session, test_firm, tes
     submission = IntakeSubmission(
         id=uuid4(),
         form_id=test_intake_form.id,
+        firm_id=test_firm.id,
         client_id=test_client.id,
         form_data={"test": "data"},
         payment_amount="1000.00",
@@ -124,6 +126,7 @@ async def test_payment_field_naming(client, db_session, test_firm, test_intake_f
     # Verify the field exists in the model
     submission = IntakeSubmission(
         form_id=test_intake_form.id,
+        firm_id=test_firm.id,
         client_id=uuid4(),
         form_data={"email": "test@example.com"},
         payment_amount="500.00"
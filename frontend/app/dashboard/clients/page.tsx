@@ -21,7 +21,7 @@ export default function ClientsPage() {
     const token = localStorage.getItem('token')
     if (!token) return
 
-    fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/clients`, {
+    fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/clients?fields=first_name,last_name,email,phone,status`, {
       headers: { 'Authorization': `Bearer ${token}` }
     })
       .then(res => res.json())
@@ -38,7 +38,7 @@ export default function FormDetailsPage() {
       fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/forms/${formId}`, {
         headers: { 'Authorization': `Bearer ${token}` }
       }),
-      fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/submissions?form_id=${formId}`, {
+      fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/submissions?form_id=${formId}&include_total=true`, {
         headers: { 'Authorization': `Bearer ${token}` }
       })
     ])
@@ -19,7 +19,7 @@ export default function FormsPage() {
     const token = localStorage.getItem('token')
     if (!token) return
 
-    fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/forms`, {
+    fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/forms?fields=name,description,is_active,created_at`, {
       headers: { 'Authorization': `Bearer ${token}` }
     })
       .then(res => res.json())
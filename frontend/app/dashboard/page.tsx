@@ -18,13 +18,13 @@ export default function DashboardPage() {
 
     // Fetch dashboard stats
     Promise.all([
-      fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/forms`, {
+      fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/forms?fields=id`, {
         headers: { 'Authorization': `Bearer ${token}` }
       }),
-      fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/submissions`, {
+      fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/submissions?include_total=true&limit=1&fields=id`, {
         headers: { 'Authorization': `Bearer ${token}` }
       }),
-      fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/clients`, {
+      fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/clients?include_total=true&limit=1&fields=id`, {
         headers: { 'Authorization': `Bearer ${token}` }
       }),
     ])
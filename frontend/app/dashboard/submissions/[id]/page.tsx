@@ -51,35 +51,18 @@ export default function SubmissionDetailsPage() {
       return
     }
 
-    // Fetch submission details
-    fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/submissions/${submissionId}`, {
+    // Fetch submission with its client and form in one request
+    fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/submissions/${submissionId}/detail`, {
       headers: { 'Authorization': `Bearer ${token}` }
     })
       .then(res => {
         if (!res.ok) throw new Error('Submission not found')
         return res.json()
       })
-      .then(async (submissionData) => {
+      .then(({ client, form, ...submissionData }) => {
         setSubmission(submissionData)
-
-        // Fetch client details
-        const clientRes = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/clients/${submissionData.client_id}`, {
-          headers: { 'Authorization': `Bearer ${token}` }
-        })
-        if (clientRes.ok) {
-          const clientData = await clientRes.json()
-          setClient(clientData)
-        }
-
-        // Fetch form details
-        const formRes = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/forms/${submissionData.form_id}`, {
-          headers: { 'Authorization': `Bearer ${token}` }
-        })
-        if (formRes.ok) {
-          const formData = await formRes.json()
-          setForm(formData)
-        }
-
+        setClient(client)
+        setForm(form)
         setLoading(false)
       })
       .catch((error) => {
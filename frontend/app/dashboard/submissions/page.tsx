@@ -2,6 +2,7 @@
 
 import { useEffect, useState } from 'react'
 import Link from 'next/link'
+import { subscribeFirmEvents } from '@/lib/firmEvents'
 
 interface Submission {
   id: string
@@ -21,15 +22,35 @@ export default function SubmissionsPage() {
     const token = localStorage.getItem('token')
     if (!token) return
 
-    fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/submissions`, {
-      headers: { 'Authorization': `Bearer ${token}` }
-    })
-      .then(res => res.json())
-      .then(data => {
-        setSubmissions(data.items || [])
-        setLoading(false)
+    const loadSubmissions = () =>
+      fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/submissions?fields=form_id,client_id,status,signature_status,payment_status`, {
+        headers: { 'Authorization': `Bearer ${token}` }
       })
-      .catch(() => setLoading(false))
+        .then(res => res.json())
+        .then(data => {
+          setSubmissions(data.items || [])
+          setLoading(false)
+        })
+        .catch(() => setLoading(false))
+
+    // The list is loaded once the feed is live (onResync), then kept up to
+    // date from live changes instead of refetching the whole list
+    return subscribeFirmEvents(token, {
+      onChange: ({ table, op, row }) => {
+        if (table !== 'intake_submissions') return
+        setSubmissions(current => {
+          const index = current.findIndex(submission => submission.id === row.id)
+          if (index === -1) {
+            // Updates to rows outside the loaded page don't belong in it
+            return op === 'insert' ? [row as Submission, ...current] : current
+          }
+          const updated = [...current]
+          updated[index] = { ...updated[index], ...row }
+          return updated
+        })
+      },
+      onResync: loadSubmissions,
+    })
   }, [])
 
   const getStatusColor = (status: string) => {
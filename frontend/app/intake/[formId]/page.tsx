@@ -25,6 +25,9 @@ export default function PublicIntakeFormPage() {
   const [submitted, setSubmitted] = useState(false)
   const [error, setError] = useState('')
   const [formData, setFormData] = useState<Record<string, any>>({})
+  // Sent as Idempotency-Key so a retried submit can't create a second submission.
+  // A new key is generated whenever the answers change.
+  const [submitKey, setSubmitKey] = useState(() => crypto.randomUUID())
 
   useEffect(() => {
     // Fetch form details (public endpoint, no auth required)
@@ -44,6 +47,7 @@ export default function PublicIntakeFormPage() {
   }, [formId])
 
   const handleInputChange = (fieldName: string, value: any) => {
+    setSubmitKey(crypto.randomUUID())
     setFormData(prev => ({
       ...prev,
       [fieldName]: value
@@ -61,6 +65,7 @@ export default function PublicIntakeFormPage() {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
+          'Idempotency-Key': submitKey,
         },
         body: JSON.stringify({
           form_data: formData
@@ -71,7 +76,10 @@ export default function PublicIntakeFormPage() {
         let errorMessage = 'Failed to submit form'
         try {
           const data = await response.json()
-          errorMessage = data.detail || data.message || errorMessage
+          // Validation errors (422) list each invalid field
+          errorMessage = Array.isArray(data.detail)
+            ? data.detail.map((item: { msg: string }) => item.msg).join('; ')
+            : data.detail || data.message || errorMessage
         } catch (e) {
           errorMessage = `Server error: ${response.status} ${response.statusText}`
         }
@@ -87,9 +95,20 @@ export default function PublicIntakeFormPage() {
         return
       }
 
-      if (result.next_step === 'payment' && result.payment_url) {
-        // Payment required (no signature)
-        window.location.href = result.payment_url
+      if (result.next_step === 'payment') {
+        // Payment required (no signature). The checkout session is created
+        // after submit, so ask for its URL (created on demand if not ready).
+        // Fresh key per attempt: a replayed response could hold an expired
+        // session URL, and the server already reuses a live session.
+        const checkoutResponse = await fetch(
+          `${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/public/submissions/${result.id}/checkout`,
+          { method: 'POST', headers: { 'Idempotency-Key': crypto.randomUUID() } }
+        )
+        if (!checkoutResponse.ok) {
+          throw new Error('Your intake was received, but the payment page could not be opened. Please try again.')
+        }
+        const checkout = await checkoutResponse.json()
+        window.location.href = checkout.payment_url
         return
       }
 
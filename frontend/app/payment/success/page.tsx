@@ -16,32 +16,37 @@ export default function PaymentSuccessPage() {
       return
     }
 
-    // Fetch submission status to verify payment
-    const checkPaymentStatus = async () => {
-      try {
-        const response = await fetch(
-          `${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/public/submissions/${submissionId}`
-        )
-
-        if (response.ok) {
-          const data = await response.json()
-          setPaymentStatus(data.payment_status || 'pending')
-
-          // If payment succeeded, redirect to intake success page after 3 seconds
-          if (data.payment_status === 'succeeded') {
-            setTimeout(() => {
-              window.location.href = `/intake/success?submission_id=${submissionId}`
-            }, 3000)
-          }
-        }
-      } catch (error) {
-        console.error('Error checking payment status:', error)
-      } finally {
-        setLoading(false)
+    // Stream submission status: the first event is the current state, later
+    // ones arrive as soon as the Stripe webhook lands (no polling needed)
+    const events = new EventSource(
+      `${process.env.NEXT_PUBLIC_API_URL}/api/v1/intake/public/submissions/${submissionId}/events`
+    )
+    let redirectTimer: ReturnType<typeof setTimeout> | undefined
+
+    events.addEventListener('status', (event) => {
+      const data = JSON.parse((event as MessageEvent).data)
+      setPaymentStatus(data.payment_status || 'pending')
+      setLoading(false)
+
+      // If payment succeeded, redirect to intake success page after 3 seconds
+      if (data.payment_status === 'succeeded') {
+        events.close()
+        redirectTimer = setTimeout(() => {
+          window.location.href = `/intake/success?submission_id=${submissionId}`
+        }, 3000)
       }
+    })
+
+    events.onerror = () => {
+      // EventSource retries on its own; just stop showing the spinner
+      console.error('Payment status stream interrupted, reconnecting...')
+      setLoading(false)
     }
 
-    checkPaymentStatus()
+    return () => {
+      events.close()
+      if (redirectTimer) clearTimeout(redirectTimer)
+    }
   }, [submissionId])
 
   if (loading) {
@@ -0,0 +1,85 @@
+export interface FirmChange {
+  table: 'intake_submissions' | 'clients'
+  op: 'insert' | 'update'
+  row: Record<string, any> & { id: string }
+}
+
+interface FirmEventHandlers {
+  onChange: (change: FirmChange) => void
+  // Changes may have been missed: refetch the list
+  onResync: () => void
+}
+
+/**
+ * Subscribe to the firm's live dashboard feed (GET /firms/me/events).
+ *
+ * EventSource can't send the Authorization header, so this reads the SSE
+ * stream with fetch and reconnects when it ends or fails. onResync fires
+ * once each connection is live (its first message has arrived, so the
+ * server is already routing changes to it), including the first one:
+ * load the list there rather than before subscribing, or rows committed
+ * in between are never shown. If the feed can't be reached at all, onResync
+ * still fires once so the list loads.
+ * Returns a function that closes the subscription.
+ */
+export function subscribeFirmEvents(token: string, handlers: FirmEventHandlers): () => void {
+  const controller = new AbortController()
+  let retryMs = 5000
+  let synced = false
+
+  const connect = async () => {
+    let live = false
+    try {
+      const response = await fetch(`${process.env.NEXT_PUBLIC_API_URL}/api/v1/firms/me/events`, {
+        headers: { 'Authorization': `Bearer ${token}` },
+        signal: controller.signal,
+      })
+      if (!response.ok || !response.body) throw new Error(`Feed unavailable (${response.status})`)
+
+      const reader = response.body.pipeThrough(new TextDecoderStream()).getReader()
+      let buffer = ''
+      while (true) {
+        const { value, done } = await reader.read()
+        if (done) break
+        buffer += value
+
+        let boundary
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+          const message = buffer.slice(0, boundary)
+          buffer = buffer.slice(boundary + 2)
+
+          if (!live) {
+            live = true
+            synced = true
+            handlers.onResync()
+          }
+
+          let event = 'message'
+          let data = ''
+          for (const line of message.split('\n')) {
+            if (line.startsWith('event: ')) event = line.slice(7)
+            else if (line.startsWith('data: ')) data += line.slice(6)
+            else if (line.startsWith('retry: ')) retryMs = Number(line.slice(7)) || retryMs
+          }
+
+          if (event === 'change') handlers.onChange(JSON.parse(data))
+          else if (event === 'resync') handlers.onResync()
+        }
+      }
+    } catch (error) {
+      if (controller.signal.aborted) return
+      console.error('Dashboard feed interrupted, reconnecting...', error)
+    }
+
+    if (!synced) {
+      synced = true
+      handlers.onResync()
+    }
+    if (!controller.signal.aborted) {
+      setTimeout(connect, retryMs)
+    }
+  }
+
+  connect()
+  return () => controller.abort()
+}